@@ -0,0 +1,49 @@
+from typing import AsyncIterator, Union
+
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.configuration.config import (
+    DB_ASYNC_MAX_OVERFLOW,
+    DB_ASYNC_POOL_SIZE,
+    DB_ECHO,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_TIMEOUT,
+)
+from app.configuration.database import DATABASE_URL
+from app.configuration.pool_metrics import MeteredAsyncQueuePool
+
+# Misma base que el engine síncrono, con el driver asíncrono de MySQL
+ASYNC_DATABASE_URL = DATABASE_URL.set(drivername="mysql+aiomysql")
+
+
+def create_async_db_engine(
+    url: Union[str, URL] = ASYNC_DATABASE_URL
+) -> AsyncEngine:
+    """
+    Engine asíncrono para los endpoints de lectura con más tráfico: una
+    petición que espera a MySQL no ocupa un hilo del threadpool. Su pool es
+    aparte del síncrono y se dimensiona con DB_ASYNC_POOL_SIZE y
+    DB_ASYNC_MAX_OVERFLOW; timeout, recycle y pre-ping son los mismos.
+    """
+    return create_async_engine(
+        url,
+        echo=DB_ECHO,
+        poolclass=MeteredAsyncQueuePool,
+        pool_size=DB_ASYNC_POOL_SIZE,
+        max_overflow=DB_ASYNC_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+
+
+async_engine = create_async_db_engine()
+
+
+# Proveer sesiones asíncronas como dependencia
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
@@ -0,0 +1,102 @@
+import os
+import tempfile
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Cantidad de filas enviadas por sentencia en las inserciones masivas.
+# Mantiene cada paquete por debajo de max_allowed_packet de MySQL.
+BULK_INSERT_BATCH_SIZE: int = int(os.getenv("BULK_INSERT_BATCH_SIZE", "2000"))
+
+# Hilos que procesan en segundo plano los archivos subidos.
+UPLOAD_JOB_WORKERS: int = int(os.getenv("UPLOAD_JOB_WORKERS", "2"))
+
+# Trabajos terminados que se conservan en memoria para consulta de estado.
+UPLOAD_JOB_RETENTION: int = int(os.getenv("UPLOAD_JOB_RETENTION", "100"))
+
+# Segundos entre lecturas del avance para los eventos SSE de una carga y
+# entre comentarios de keep-alive cuando el avance no cambia.
+PROGRESS_EVENT_INTERVAL: float = float(
+    os.getenv("PROGRESS_EVENT_INTERVAL", "1.0")
+)
+PROGRESS_EVENT_HEARTBEAT: float = float(
+    os.getenv("PROGRESS_EVENT_HEARTBEAT", "15.0")
+)
+
+# Procesos para validar y derivar las filas de archivos grandes.
+# 0 o 1 mantiene el recorrido serial.
+PARSE_WORKERS: int = int(os.getenv("PARSE_WORKERS", "0"))
+
+# Filas por bloque enviado a cada proceso en el recorrido paralelo.
+PARSE_CHUNK_ROWS: int = int(os.getenv("PARSE_CHUNK_ROWS", "20000"))
+
+# Conexiones con las que se escriben en paralelo las tablas independientes
+# de una ingesta. 0 o 1 escribe todo en serie sobre la misma sesión.
+INSERT_WORKERS: int = int(os.getenv("INSERT_WORKERS", "4"))
+
+# Registros por bloque confirmado (y marcado para retomar) en cada tabla.
+INSERT_CHUNK_ROWS: int = int(os.getenv("INSERT_CHUNK_ROWS", "10000"))
+
+# Horas que se conservan las marcas de una carga que no terminó; las más
+# viejas se borran al iniciar la siguiente carga.
+IMPORT_CHECKPOINT_MAX_AGE_HOURS: float = float(
+    os.getenv("IMPORT_CHECKPOINT_MAX_AGE_HOURS", "72")
+)
+
+# Carpeta de los reportes completos de validación (CSV comprimido) y
+# errores de muestra incluidos en la respuesta.
+VALIDATION_REPORT_DIR: str = os.getenv(
+    "VALIDATION_REPORT_DIR",
+    os.path.join(tempfile.gettempdir(), "validation_reports")
+)
+VALIDATION_SAMPLE_SIZE: int = int(os.getenv("VALIDATION_SAMPLE_SIZE", "10"))
+
+# Los reportes se borran pasadas VALIDATION_REPORT_MAX_AGE_HOURS horas y se
+# conservan a lo sumo VALIDATION_REPORT_RETENTION (los más recientes).
+VALIDATION_REPORT_MAX_AGE_HOURS: float = float(
+    os.getenv("VALIDATION_REPORT_MAX_AGE_HOURS", "24")
+)
+VALIDATION_REPORT_RETENTION: int = int(
+    os.getenv("VALIDATION_REPORT_RETENTION", "200")
+)
+
+# Carpeta de los archivos de log; por defecto, el directorio de trabajo.
+LOG_DIR: str = os.getenv("LOG_DIR", ".")
+
+# Nivel mínimo de los logs de la aplicación (DEBUG, INFO, WARNING...).
+# Antes los loggers quedaban fijos en DEBUG; ahora el valor por defecto es
+# INFO y los mensajes por fila solo se escriben con LOG_LEVEL=DEBUG.
+LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+
+# Los mensajes por fila se registran una vez cada LOG_SAMPLE_EVERY
+# apariciones; 1 los registra todos.
+LOG_SAMPLE_EVERY: int = int(os.getenv("LOG_SAMPLE_EVERY", "1000"))
+
+# Pools de conexiones a MySQL: el del engine síncrono (DB_POOL_SIZE,
+# DB_MAX_OVERFLOW) y el del asíncrono de los endpoints de lectura
+# (DB_ASYNC_POOL_SIZE, DB_ASYNC_MAX_OVERFLOW). El total por proceso es la
+# suma de los cuatro; multiplicar por los workers de uvicorn para
+# compararlo con max_connections.
+DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_ASYNC_POOL_SIZE: int = int(os.getenv("DB_ASYNC_POOL_SIZE", "5"))
+DB_ASYNC_MAX_OVERFLOW: int = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "5"))
+DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in (
+    "1", "true", "yes"
+)
+# Registra cada sentencia SQL; solo para desarrollo.
+DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() in ("1", "true", "yes")
+
+# Segundos que vive en memoria el esquema de organización de un periodo si
+# nadie lo invalida antes (ingesta o cambios en las asociaciones).
+ORGANIZATION_SCHEMA_TTL: float = float(
+    os.getenv("ORGANIZATION_SCHEMA_TTL", "600")
+)
+
+# Cómo se generan las asociaciones de remitentes: "python" (llaves en
+# memoria) o "sql" (INSERT IGNORE ... SELECT dentro de la base).
+EMAIL_SENDER_ASSOCIATION_MODE: str = os.getenv(
+    "EMAIL_SENDER_ASSOCIATION_MODE", "python"
+).lower()
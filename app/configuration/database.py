@@ -1,9 +1,24 @@
+from sqlalchemy.engine import URL, Engine
 from sqlmodel import SQLModel, create_engine, Session
 from dotenv import load_dotenv
+from typing import Union
 import os
 
+from app.configuration.config import (
+    DB_ECHO,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+from app.configuration.pool_metrics import MeteredQueuePool
+from app.utils.app_logger import AppLogger
+
 load_dotenv()
 
+logger = AppLogger(__file__)
+
 MYSQL_USER = os.getenv("MYSQL_USER")
 MYSQL_ROOT = os.getenv("MYSQL_ROOT")
 MYSQL_ROOT_PASSWORD = os.getenv("MYSQL_ROOT")
@@ -12,15 +27,39 @@ MYSQL_HOST = os.getenv("MYSQL_HOST")
 MYSQL_PORT = os.getenv("MYSQL_PORT")
 MYSQL_DATABASE = os.getenv("MYSQL_DATABASE")
 
-DATABASE_URL = (
-    f"mysql+pymysql://{MYSQL_ROOT}:{MYSQL_USER_PASSWORD}"
-    f"@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
+DATABASE_URL = URL.create(
+    "mysql+pymysql",
+    username=MYSQL_ROOT,
+    password=MYSQL_USER_PASSWORD,
+    host=MYSQL_HOST,
+    port=int(MYSQL_PORT) if MYSQL_PORT else None,
+    database=MYSQL_DATABASE,
 )
 
-print(f"Connecting to database at {DATABASE_URL}")
 
-# El engine es exactamente el mismo
-engine = create_engine(DATABASE_URL, echo=True)
+def create_db_engine(url: Union[str, URL] = DATABASE_URL) -> Engine:
+    """
+    Engine con el pool configurado por entorno (DB_POOL_*, DB_ECHO). El
+    pool mide las esperas por conexión; ver get_pool_stats.
+    """
+    return create_engine(
+        url,
+        echo=DB_ECHO,
+        poolclass=MeteredQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+
+
+engine = create_db_engine()
+# La URL se registra sin la contraseña
+logger.info(
+    "Conectando a la base de datos en %s",
+    engine.url.render_as_string(hide_password=True)
+)
 
 
 # Crear tablas
@@ -0,0 +1,71 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class MeteredQueuePool(QueuePool):
+    """
+    QueuePool que mide cuánto espera cada checkout por una conexión libre
+    y cuántos agotan el timeout. Sirve para dimensionar el pool según los
+    workers de uvicorn y detectar cuando se queda corto bajo carga.
+    """
+
+    def __init__(self, *args: Any, max_overflow: int = 10, **kwargs: Any):
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        # QueuePool no expone el límite configurado
+        self.max_overflow = max_overflow
+        self._metrics_lock = threading.Lock()
+        self.wait_count: int = 0
+        self.wait_total: float = 0.0
+        self.wait_max: float = 0.0
+        self.timeouts: int = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            self.record_wait(time.perf_counter() - started)
+
+    def record_wait(self, waited: float):
+        with self._metrics_lock:
+            self.wait_count += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+
+class MeteredAsyncQueuePool(MeteredQueuePool, AsyncAdaptedQueuePool):
+    """MeteredQueuePool con la cola asíncrona del engine de aiomysql."""
+
+
+def get_pool_stats(engine: Engine) -> Dict[str, Any]:
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+            timeout=pool.timeout(),
+        )
+    if isinstance(pool, MeteredQueuePool):
+        with pool._metrics_lock:
+            stats.update(
+                max_overflow=pool.max_overflow,
+                checkouts=pool.wait_count,
+                wait_avg_ms=round(
+                    1000 * pool.wait_total / pool.wait_count, 3
+                ) if pool.wait_count else 0.0,
+                wait_max_ms=round(1000 * pool.wait_max, 3),
+                timeouts=pool.timeouts,
+            )
+    return stats
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
-from typing import List
+from typing import List, Optional
 
 from app.configuration.database import get_session
+from app.domain.enums.email_sender.email_sender import AssociationMode
 from app.domain.models.email_sender import EmailSender
 from app.domain.dtos.email_sender.email_sender_input import EmailSenderInput
 from app.service.crud.email_sender_service import EmailSenderService
+from app.service.use_cases import email_sender_association_sync
 from app.service.use_cases.fill_asociate_email_sender import (
     fill_associate_email_sender
 )
@@ -46,7 +48,7 @@ def create_email_sender(
     user_email: str = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    return EmailSenderService.create(data, session)
+    return email_sender_association_sync.create_email_sender(data, session)
 
 
 @router.post(
@@ -56,9 +58,10 @@ def create_email_sender(
 def create_email_senders(
     session: Session = Depends(get_session),
     cod_period: str = "",
+    mode: Optional[AssociationMode] = None,
     user_email: str = Depends(get_current_user)
 ):
-    return fill_associate_email_sender(session, cod_period)
+    return fill_associate_email_sender(session, cod_period, mode)
 
 
 @router.patch("/{id}", response_model=EmailSender)
@@ -68,7 +71,9 @@ def update_email_sender(
     session: Session = Depends(get_session),
     user_email: str = Depends(get_current_user)
 ):
-    updated = EmailSenderService.update(id, data, session)
+    updated = email_sender_association_sync.update_email_sender(
+        id, data, session
+    )
     if not updated:
         raise HTTPException(status_code=404, detail="Email sender not found")
     return updated
@@ -80,6 +85,6 @@ def delete_email_sender(
     user_email: str = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    deleted = EmailSenderService.delete(id, session)
+    deleted = email_sender_association_sync.delete_email_sender(id, session)
     if not deleted:
         raise HTTPException(status_code=404, detail="Email sender not found")
@@ -1,14 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
+from app.configuration.async_database import get_async_session
 from app.configuration.database import get_session
 from app.domain.models.headquarters import Headquarters
 from app.domain.dtos.headquarters.headquarters_input import HeadquartersInput
 from app.service.crud.headquarters_service import HeadquartersService
 
 from app.service.use_cases.get_list_email_organization import (
-    get_email_list_of_headquarters
+    get_email_list_of_headquarters_async
 )
 
 from app.utils.auth import get_current_user
@@ -51,20 +53,20 @@ def get_headquarters_by_name(
 
 
 @router.get("/get-email-list/{cod_headquarters}/{cod_period}")
-def define_get_headquarters(
+async def define_get_headquarters(
     cod_headquarters: str,
     cod_period: str,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     user_email: str = Depends(get_current_user)
 ):
-    hq = HeadquartersService.get_by_id(
+    hq = await HeadquartersService.get_by_id_async(
         cod_headquarters,
         session
     )
     if not hq:
         raise HTTPException(status_code=404, detail="Headquarters not found")
 
-    emails = get_email_list_of_headquarters(
+    emails = await get_email_list_of_headquarters_async(
         session,
         cod_headquarters,
         cod_period
@@ -0,0 +1,23 @@
+# app/controllers/internal_controller.py
+
+from fastapi import APIRouter, Depends
+
+from app.configuration.async_database import async_engine
+from app.configuration.database import engine
+from app.configuration.pool_metrics import get_pool_stats
+from app.domain.dtos.internal.pool_stats import PoolStats
+
+from app.utils.auth import get_current_user
+
+router = APIRouter(prefix="/internal", tags=["Internal"])
+
+
+@router.get("/db/pool", response_model=PoolStats)
+def get_db_pool_stats(user_email: str = Depends(get_current_user)):
+    """
+    Estado de los pools de conexiones (síncrono y, en `async_pool`, el
+    asíncrono) del proceso que atiende la petición.
+    """
+    stats = get_pool_stats(engine)
+    stats["async_pool"] = get_pool_stats(async_engine.sync_engine)
+    return stats
@@ -1,14 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
+from app.configuration.async_database import get_async_session
 from app.configuration.database import get_session
 from app.domain.models.school import School
 from app.domain.dtos.school.school_input import SchoolInput
 from app.service.crud.school_service import SchoolService
 
 from app.service.use_cases.get_list_email_organization import (
-    get_email_list_of_school
+    get_email_list_of_school_async
 )
 
 from app.utils.auth import get_current_user
@@ -39,20 +41,22 @@ def get_school(
 
 
 @router.get("/get-email-list/{cod_school}/{cod_period}")
-def define_get_school(
+async def define_get_school(
     cod_school: str,
     cod_period: str,
     user_email: str = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    school = SchoolService.get_by_id(
+    school = await SchoolService.get_by_id_async(
         cod_school,
         session
     )
     if not school:
         raise HTTPException(status_code=404, detail="School not found")
 
-    emails = get_email_list_of_school(session, cod_school, cod_period)
+    emails = await get_email_list_of_school_async(
+        session, cod_school, cod_period
+    )
     if not emails:
         raise HTTPException(
             status_code=404,
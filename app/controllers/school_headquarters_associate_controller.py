@@ -12,6 +12,10 @@ from app.domain.dtos.school_headquarters_associate.school_headquarters_associate
 from app.service.crud.school_headquarters_associate_service import (
     SchoolHeadquartersAssociateService
 )
+from app.service.use_cases.email_sender_association_sync import (
+    create_school_headquarters_associate,
+    delete_school_headquarters_associate,
+)
 from app.utils.auth import get_current_user
 
 router = APIRouter(
@@ -96,7 +100,7 @@ def create_association(
     user_email: str = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    return SchoolHeadquartersAssociateService.create(data, session)
+    return create_school_headquarters_associate(data, session)
 
 
 @router.delete(
@@ -110,7 +114,7 @@ def delete_association(
     user_email: str = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    deleted = SchoolHeadquartersAssociateService.delete(
+    deleted = delete_school_headquarters_associate(
         cod_school,
         cod_headquarters,
         cod_period,
@@ -10,6 +10,10 @@ from app.domain.dtos.unit_school_associate.unit_school_associate_input import (
 from app.service.crud.unit_school_associate_service import (
     UnitSchoolAssociateService,
 )
+from app.service.use_cases.email_sender_association_sync import (
+    create_unit_school_associate,
+    delete_unit_school_associate,
+)
 from app.utils.auth import get_current_user
 
 router = APIRouter(
@@ -89,7 +93,7 @@ def create_association(
     user_email: str = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    return UnitSchoolAssociateService.create(data, session)
+    return create_unit_school_associate(data, session)
 
 
 @router.delete(
@@ -103,7 +107,7 @@ def delete_association(
     user_email: str = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    deleted = UnitSchoolAssociateService.delete(
+    deleted = delete_unit_school_associate(
         cod_unit, cod_school, cod_period, session
     )
     if not deleted:
@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
+from app.configuration.async_database import get_async_session
 from app.configuration.database import get_session
 from app.domain.models.unit_unal import UnitUnal
 from app.domain.dtos.unit_unal.unit_unal_input import UnitUnalInput
 from app.service.crud.unit_unal_service import UnitUnalService
 from app.service.use_cases.get_list_email_organization import (
-    get_email_list_of_unit
+    get_email_list_of_unit_async
 )
 from app.utils.auth import get_current_user
 
@@ -42,20 +44,22 @@ def get_unit(
 
 
 @router.get("/get-email-list/{cod_unit}/{cod_period}")
-def define_get_unit(
+async def define_get_unit(
     cod_unit: str,
     cod_period: str,
     user_email: str = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    unit = UnitUnalService.get_by_id(
+    unit = await UnitUnalService.get_by_id_async(
         cod_unit,
         session
     )
     if not unit:
         raise HTTPException(status_code=404, detail="Unit not found")
 
-    emails = get_email_list_of_unit(session, cod_unit, cod_period)
+    emails = await get_email_list_of_unit_async(
+        session, cod_unit, cod_period
+    )
     if not emails:
         raise HTTPException(
             status_code=404,
@@ -1,30 +1,208 @@
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+import hashlib
+from typing import BinaryIO, Iterator, List, Optional
+
+from fastapi import (
+    APIRouter, Depends, File, HTTPException, Request, UploadFile, status
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlmodel import Session
-from openpyxl import Workbook
 
 from app.configuration.database import get_session
-from app.utils.type_file_validation import readExcelFile
+from app.domain.dtos.upload_job.ingestion_options import IngestionOptions
+from app.domain.dtos.upload_job.upload_job_status import UploadJobStatus
+from app.utils.type_file_validation import (
+    open_upload,
+    spool_upload,
+    validate_upload_filename,
+)
 
-from app.service.excel_processor.process_file import process_file
+from app.service.crud.import_ledger_service import ImportLedgerService
 from app.service.crud.period_service import PeriodService
+from app.service.excel_processor.dry_run import (
+    to_ndjson,
+    validate_estudiantes_activos,
+)
+from app.service.excel_processor.process_file import get_valid_sheet
+from app.service.excel_processor.validation_sink import find_report
+from app.service.jobs.upload_job_events import stream_job_events
+from app.service.jobs.upload_job_queue import upload_job_queue
 from app.utils.auth import get_current_user
 
 router = APIRouter(prefix="/upload_excel", tags=["Excel Upload"])
 
 
-@router.post("/", status_code=status.HTTP_200_OK)
+@router.post(
+    "/",
+    response_model=UploadJobStatus,
+    status_code=status.HTTP_202_ACCEPTED
+)
 async def upload_excel_file(
     cod_period: str,
+    force: bool = False,
+    delta: bool = False,
+    previous_period: Optional[str] = None,
+    report_dropped: bool = False,
+    upsert: bool = False,
     file: UploadFile = File(...),
     user_email: str = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    period = PeriodService.get_by_id(cod_period, session)
+    # La sesión es síncrona: las consultas van al pool de hilos para no
+    # bloquear el event loop mientras llegan otras cargas
+    period = await run_in_threadpool(
+        PeriodService.get_by_id, cod_period, session
+    )
     if not period:
         raise HTTPException(status_code=400, detail={
             "error": f"El periodo con código {cod_period} no existe",
             "message": "Verifique el código del periodo"
         })
-    wb: Workbook = await readExcelFile(file)
-    # Save the data in the excel in database
-    return process_file(wb, cod_period, session)
+    validate_upload_filename(file.filename)
+
+    # Solo se copia el archivo a disco; el procesamiento corre en segundo
+    # plano y se consulta con GET /upload_excel/jobs/{job_id}
+    hasher = hashlib.sha256()
+    spool = await spool_upload(file, hasher=hasher)
+    content_hash = hasher.hexdigest()
+
+    options = IngestionOptions(
+        delta=delta,
+        previous_period=previous_period,
+        report_dropped=report_dropped,
+        upsert_reference=upsert,
+        content_hash=content_hash,
+        force=force,
+        report_owner=user_email
+    )
+
+    # Un reintento del mismo archivo reutiliza el trabajo en curso o el
+    # resultado de la importación anterior, salvo que se pida `force` o
+    # alguna opción que cambie lo que hace la importación
+    if not force and options.is_default():
+        active = upload_job_queue.find_active(content_hash, cod_period)
+        if active:
+            spool.close()
+            return active.to_status()
+
+        ledger = await run_in_threadpool(
+            ImportLedgerService.get_by_id, content_hash, cod_period, session
+        )
+        if ledger:
+            spool.close()
+            return upload_job_queue.complete_from_ledger(
+                ledger, file.filename, user_email
+            ).to_status()
+
+    job = upload_job_queue.submit(
+        spool, cod_period, file.filename, user_email, content_hash, options
+    )
+    return job.to_status()
+
+
+@router.post("/validate")
+async def validate_excel_file(
+    cod_period: str,
+    file: UploadFile = File(...),
+    user_email: str = Depends(get_current_user)
+):
+    """
+    Validación sin escritura: revisa encabezados, filas y derivación de
+    códigos igual que la importación y responde en NDJSON, una línea por
+    bloque de filas y una línea final con el veredicto y los conteos.
+    """
+    validate_upload_filename(file.filename)
+    spool = await spool_upload(file)
+    try:
+        wb = open_upload(spool, file.filename)
+    except Exception:
+        spool.close()
+        raise
+    try:
+        ws = get_valid_sheet(wb)
+    except Exception:
+        close_upload(wb, spool)
+        raise
+    if ws is None:
+        close_upload(wb, spool)
+        raise HTTPException(status_code=400, detail={
+            "error": "La primera hoja no tiene encabezados",
+        })
+
+    def stream() -> Iterator[str]:
+        try:
+            yield from to_ndjson(
+                validate_estudiantes_activos(
+                    ws, cod_period, report_owner=user_email
+                )
+            )
+        finally:
+            close_upload(wb, spool)
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+def close_upload(wb, spool: BinaryIO):
+    wb.close()
+    spool.close()
+
+
+@router.get("/jobs", response_model=List[UploadJobStatus])
+def list_upload_jobs(user_email: str = Depends(get_current_user)):
+    return [job.to_status() for job in upload_job_queue.get_all()]
+
+
+@router.get("/jobs/{job_id}", response_model=UploadJobStatus)
+def get_upload_job(
+    job_id: str,
+    user_email: str = Depends(get_current_user)
+):
+    job = upload_job_queue.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No existe el trabajo de carga {job_id}"
+        )
+    return job.to_status()
+
+
+@router.get("/jobs/{job_id}/events")
+def stream_upload_job_events(
+    job_id: str,
+    request: Request,
+    user_email: str = Depends(get_current_user)
+):
+    """Avance de la carga como Server-Sent Events."""
+    job = upload_job_queue.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No existe el trabajo de carga {job_id}"
+        )
+    return StreamingResponse(
+        stream_job_events(job, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/reports/{report_id}")
+def download_validation_report(
+    report_id: str,
+    user_email: str = Depends(get_current_user)
+):
+    """
+    Reporte completo de errores de validación (CSV comprimido). Solo lo
+    descarga quien subió el archivo.
+    """
+    path = find_report(report_id, user_email)
+    if not path:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No existe el reporte de validación {report_id}"
+        )
+    return FileResponse(
+        path,
+        media_type="application/gzip",
+        filename=f"errores_{report_id}.csv.gz"
+    )
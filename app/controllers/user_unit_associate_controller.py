@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
+from app.configuration.async_database import get_async_session
 from app.configuration.database import get_session
 from app.domain.models.user_unit_associate import UserUnitAssociate
 from app.domain.dtos.user_unit_associate.user_unit_associate_input import (
@@ -51,14 +53,14 @@ def get_association(
     "/by-user/{email_unal}/{cod_period}",
     response_model=List[UserUnitAssociate]
 )
-def get_units_by_user(
+async def get_units_by_user(
     email_unal: str,
     cod_period: str = None,
     user_email: str = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    return UserUnitAssociateService.get_by_user(
-        email_unal, cod_period, session
+    return await UserUnitAssociateService.get_by_user_async(
+        email_unal, session, cod_period
     )
 
 
@@ -67,13 +69,13 @@ def get_units_by_user(
 
     response_model=List[UserUnitAssociate]
 )
-def get_users_by_unit(
+async def get_users_by_unit(
     cod_unit: str,
     cod_period: str = None,
     user_email: str = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    return UserUnitAssociateService.get_by_unit(
+    return await UserUnitAssociateService.get_by_unit_async(
         cod_unit, cod_period, session
     )
 
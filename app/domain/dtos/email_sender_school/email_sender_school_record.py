@@ -0,0 +1,10 @@
+from typing import NamedTuple
+
+from app.domain.enums.email_sender.email_sender import AssociationSource
+
+
+class EmailSenderSchoolRecord(NamedTuple):
+    """Registro de carga masiva; ver UserUnalRecord."""
+    sender_id: str
+    cod_school: str
+    source: str = AssociationSource.RULE.value
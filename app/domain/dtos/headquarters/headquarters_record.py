@@ -0,0 +1,10 @@
+from typing import NamedTuple, Optional
+
+
+class HeadquartersRecord(NamedTuple):
+    """Registro de carga masiva; ver UserUnalRecord."""
+    cod_headquarters: str
+    email: Optional[str] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+    type_facultad: Optional[str] = None
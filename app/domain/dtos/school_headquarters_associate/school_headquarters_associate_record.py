@@ -0,0 +1,8 @@
+from typing import NamedTuple
+
+
+class SchoolHeadquartersAssociateRecord(NamedTuple):
+    """Registro de carga masiva; ver UserUnalRecord."""
+    cod_school: str
+    cod_headquarters: str
+    cod_period: str
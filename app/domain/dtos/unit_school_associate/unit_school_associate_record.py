@@ -0,0 +1,8 @@
+from typing import NamedTuple
+
+
+class UnitSchoolAssociateRecord(NamedTuple):
+    """Registro de carga masiva; ver UserUnalRecord."""
+    cod_unit: str
+    cod_school: str
+    cod_period: str
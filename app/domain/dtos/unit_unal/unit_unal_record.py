@@ -0,0 +1,10 @@
+from typing import NamedTuple, Optional
+
+
+class UnitUnalRecord(NamedTuple):
+    """Registro de carga masiva; ver UserUnalRecord."""
+    cod_unit: str
+    email: Optional[str] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+    type_unit: Optional[str] = None
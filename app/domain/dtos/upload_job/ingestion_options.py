@@ -0,0 +1,34 @@
+from pydantic import BaseModel
+from typing import Optional
+
+# Campos que no cambian lo que escribe la importación
+NEUTRAL_FIELDS = {"content_hash", "force", "report_owner"}
+
+
+class IngestionOptions(BaseModel):
+    # Escribe solo las asociaciones usuario-plan que faltan en el periodo
+    # y reporta la diferencia contra el periodo anterior
+    delta: bool = False
+    # Periodo de comparación; por defecto, el que inicia justo antes
+    previous_period: Optional[str] = None
+    # Incluye en el reporte los correos de estudiantes que no continúan
+    report_dropped: bool = False
+    # Actualiza planes, facultades y sedes existentes que cambiaron
+    upsert_reference: bool = False
+    # Hash del archivo; habilita la escritura por bloques retomables
+    content_hash: Optional[str] = None
+    # Descarta los bloques marcados por un intento anterior del archivo
+    force: bool = False
+    # Usuario al que se le entrega el reporte de errores de validación
+    report_owner: Optional[str] = None
+
+    def is_default(self) -> bool:
+        """
+        Importación sin opciones que cambien el resultado (el hash,
+        `force` y el dueño del reporte no cuentan). Solo estas reutilizan
+        trabajos en curso o el ledger.
+        """
+        return (
+            self.model_dump(exclude=NEUTRAL_FIELDS)
+            == IngestionOptions().model_dump(exclude=NEUTRAL_FIELDS)
+        )
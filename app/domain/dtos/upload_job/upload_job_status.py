@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class UploadJobProgress(BaseModel):
+    stage: str
+    rows_parsed: int = 0
+    rows_validated: int = 0
+    rows_inserted: int = 0
+    inserted_by_table: Dict[str, int] = {}
+    entities_found: Dict[str, int] = {}
+    seconds_since_update: float = 0
+
+
+class UploadJobStatus(BaseModel):
+    job_id: str
+    status: str
+    cod_period: str
+    filename: Optional[str] = None
+    submitted_by: Optional[str] = None
+    content_hash: Optional[str] = None
+    reused_result: bool = False
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    progress: UploadJobProgress
+    result: Optional[Any] = None
+    error: Optional[Any] = None
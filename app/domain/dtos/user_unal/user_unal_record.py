@@ -0,0 +1,17 @@
+from datetime import date
+from typing import NamedTuple, Optional
+
+
+class UserUnalRecord(NamedTuple):
+    """
+    Registro de carga masiva: tupla liviana que va directo a los
+    parámetros del INSERT. Los datos ya se validaron al leer el archivo.
+    """
+    email_unal: str
+    document: Optional[str] = None
+    name: Optional[str] = None
+    lastname: Optional[str] = None
+    full_name: Optional[str] = None
+    gender: Optional[str] = None
+    birth_date: Optional[date] = None
+    headquarters: Optional[str] = None
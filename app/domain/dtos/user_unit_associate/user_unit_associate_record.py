@@ -0,0 +1,8 @@
+from typing import NamedTuple
+
+
+class UserUnitAssociateRecord(NamedTuple):
+    """Registro de carga masiva; ver UserUnalRecord."""
+    email_unal: str
+    cod_unit: str
+    cod_period: str
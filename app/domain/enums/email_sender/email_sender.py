@@ -18,3 +18,18 @@ class OrgLevel(Enum):
 class Role(Enum):
     OWNER = "OWNER"
     MEMBER = "MEMBER"
+
+
+class AssociationMode(Enum):
+    # Llaves generadas en Python e insertadas por lotes
+    PYTHON = "python"
+    # INSERT IGNORE ... SELECT resuelto dentro de la base
+    SQL = "sql"
+
+
+class AssociationSource(Enum):
+    # Derivada de las reglas de remitentes (llenado por periodo o
+    # resincronización); la resincronización puede borrarla
+    RULE = "RULE"
+    # Creada a mano por los endpoints email_sender_*; nunca se recalcula
+    MANUAL = "MANUAL"
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List
+from typing import Dict, List
 
 
 # Definir el mapeo de sedes y su orden
@@ -25,12 +25,7 @@ class SedeEnum(Enum):
         :param sede_value: El valor de la sede (con tildes, mayúsculas, etc.).
         :return: True si la sede existe, False en caso contrario.
         """
-        # Comparar directamente el string con los nombres de los miembros
-        # del Enum
-        name_members = [member._name for member in cls]
-        if sede_value in name_members:
-            return True
-        return False
+        return sede_value in _SEDES_BY_NAME
 
     @classmethod
     def get_by_name(cls, name: str):
@@ -39,11 +34,14 @@ class SedeEnum(Enum):
         :param name: El nombre de la sede (como cadena, e.g., "SEDE BOGOTÁ").
         :return: El miembro correspondiente del Enum.
         """
-        # Comparar el nombre ingresado con el atributo _name del Enum
-        for member in cls:
-            if member._name == name:
-                return member
-        return None  # Si no se encuentra el nombre, se retorna None
+        # Búsqueda O(1) por el atributo _name del Enum; None si no existe
+        return _SEDES_BY_NAME.get(name)
+
+
+# Tabla de búsqueda por nombre de sede, construida una sola vez
+_SEDES_BY_NAME: Dict[str, SedeEnum] = {
+    member._name: member for member in SedeEnum
+}
 
 
 class EstudianteActivos(Enum):
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class UploadJobState(Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class IngestionStage(Enum):
+    QUEUED = "QUEUED"
+    PARSING = "PARSING"
+    INSERTING = "INSERTING"
+    DONE = "DONE"
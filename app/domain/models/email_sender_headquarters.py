@@ -1,5 +1,7 @@
 from sqlmodel import SQLModel, Field
 
+from app.domain.enums.email_sender.email_sender import AssociationSource
+
 
 class EmailSenderHeadquarters(SQLModel, table=True):
     __tablename__ = "email_sender_headquarters"
@@ -12,3 +14,6 @@ class EmailSenderHeadquarters(SQLModel, table=True):
         foreign_key="headquarters.cod_headquarters",
         primary_key=True, max_length=50
     )
+    source: str = Field(
+        default=AssociationSource.MANUAL.value, max_length=10
+    )
@@ -1,5 +1,7 @@
 from sqlmodel import SQLModel, Field
 
+from app.domain.enums.email_sender.email_sender import AssociationSource
+
 
 class EmailSenderSchool(SQLModel, table=True):
     __tablename__ = "email_sender_school"
@@ -10,3 +12,6 @@ class EmailSenderSchool(SQLModel, table=True):
     cod_school: str = Field(
         foreign_key="school.cod_school",
         primary_key=True, max_length=50)
+    source: str = Field(
+        default=AssociationSource.MANUAL.value, max_length=10
+    )
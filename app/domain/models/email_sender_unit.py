@@ -1,5 +1,7 @@
 from sqlmodel import SQLModel, Field
 
+from app.domain.enums.email_sender.email_sender import AssociationSource
+
 
 class EmailSenderUnit(SQLModel, table=True):
     __tablename__ = "email_sender_unit"
@@ -10,3 +12,6 @@ class EmailSenderUnit(SQLModel, table=True):
     cod_unit: str = Field(
         foreign_key="unit_unal.cod_unit",
         primary_key=True, max_length=50)
+    source: str = Field(
+        default=AssociationSource.MANUAL.value, max_length=10
+    )
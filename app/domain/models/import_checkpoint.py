@@ -0,0 +1,17 @@
+from sqlmodel import SQLModel, Field, Text
+from datetime import datetime
+from typing import Optional
+
+
+class ImportCheckpoint(SQLModel, table=True):
+    __tablename__ = "import_checkpoint"
+
+    content_hash: str = Field(primary_key=True, max_length=64)
+    cod_period: str = Field(primary_key=True, max_length=50)
+    table_name: str = Field(primary_key=True, max_length=50)
+    chunk_index: int = Field(primary_key=True)
+    # Tamaño de bloque con el que se marcó; con otro tamaño los índices no
+    # corresponden a los mismos registros
+    chunk_rows: int = Field(default=0)
+    result: Optional[str] = Field(default=None, sa_type=Text)
+    created_at: datetime = Field(default_factory=datetime.now)
@@ -0,0 +1,14 @@
+from sqlmodel import SQLModel, Field, Text
+from datetime import datetime
+from typing import Optional
+
+
+class ImportLedger(SQLModel, table=True):
+    __tablename__ = "import_ledger"
+
+    content_hash: str = Field(primary_key=True, max_length=64)
+    cod_period: str = Field(primary_key=True, max_length=50)
+    filename: Optional[str] = Field(default=None, max_length=255)
+    submitted_by: Optional[str] = Field(default=None, max_length=100)
+    result: Optional[str] = Field(default=None, sa_type=Text)
+    created_at: datetime = Field(default_factory=datetime.now)
@@ -19,6 +19,7 @@ from .controllers import (
     email_sender_school_controller,
     email_sender_headquarters_controller,
     upload_controller,
+    internal_controller,
 )
 
 app = FastAPI()
@@ -62,3 +63,4 @@ app.include_router(email_sender_controller.router)
 app.include_router(email_sender_unit_controller.router)
 app.include_router(email_sender_school_controller.router)
 app.include_router(email_sender_headquarters_controller.router)
+app.include_router(internal_controller.router)
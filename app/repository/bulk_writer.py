@@ -0,0 +1,229 @@
+from itertools import islice
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+)
+from sqlalchemy import (
+    bindparam, delete, func, insert, select, tuple_, update
+)
+from sqlalchemy.sql import ColumnElement, Select
+from sqlalchemy.sql.dml import Insert
+from sqlmodel import Session, SQLModel
+
+from app.configuration.config import BULK_INSERT_BATCH_SIZE
+
+
+def chunked(
+    rows: Iterable[Any],
+    batch_size: int
+) -> Iterator[List[Any]]:
+    """Agrupa un iterable en listas de a lo sumo `batch_size` elementos."""
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, batch_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def insert_ignore_statement(model: type[SQLModel]) -> Insert:
+    """
+    INSERT que ignora filas con PK duplicada. El prefijo depende del
+    dialecto para poder ejecutarse también sobre SQLite.
+    """
+    return (
+        insert(model.__table__)
+        .prefix_with("IGNORE", dialect="mysql")
+        .prefix_with("OR IGNORE", dialect="sqlite")
+    )
+
+
+def insert_ignore_in_batches(
+    session: Session,
+    model: type[SQLModel],
+    rows: Iterable[Mapping[str, Any]],
+    batch_size: Optional[int] = None
+) -> int:
+    """
+    Inserta las filas por lotes con parámetros enlazados (executemany), de
+    forma que ni la sentencia ni su lista de parámetros crezcan con el
+    total de filas.
+
+    :param rows: Diccionarios columna -> valor; puede ser un generador.
+    :return: Filas realmente insertadas según MySQL (sin las ignoradas).
+    """
+    stmt = insert_ignore_statement(model)
+    connection = session.connection()
+    inserted = 0
+    for chunk in chunked(rows, batch_size or BULK_INSERT_BATCH_SIZE):
+        result = connection.execute(stmt, chunk)
+        inserted += max(result.rowcount, 0)
+    session.commit()
+    return inserted
+
+
+def upsert_changed_in_batches(
+    session: Session,
+    model: type[SQLModel],
+    rows: Iterable[Mapping[str, Any]],
+    compare_fields: Sequence[str],
+    batch_size: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Inserta las filas nuevas y actualiza solo las que cambiaron. Por cada
+    lote se consultan las filas existentes con un IN sobre la PK y se
+    comparan en memoria los `compare_fields`; las filas iguales no generan
+    escritura. Solo aplica a tablas con PK de una columna.
+
+    :param compare_fields: Columnas que trae la carga; las demás (p. ej.
+        descripciones editadas a mano) no se comparan ni se sobrescriben.
+    :return: Conteos de filas insertadas, actualizadas y sin cambios.
+    """
+    table = model.__table__
+    (pk,) = table.primary_key.columns
+    columns = [table.c[name] for name in compare_fields]
+
+    insert_stmt = insert_ignore_statement(model)
+    # Los bindparam no pueden llamarse como las columnas del SET
+    update_stmt = (
+        update(table)
+        .where(pk == bindparam("key_"))
+        .values({name: bindparam(f"new_{name}") for name in compare_fields})
+    )
+
+    connection = session.connection()
+    inserted = updated = unchanged = 0
+    for chunk in chunked(rows, batch_size or BULK_INSERT_BATCH_SIZE):
+        incoming = {row[pk.name]: row for row in chunk}
+        existing = {
+            found[0]: tuple(found[1:])
+            for found in connection.execute(
+                select(pk, *columns).where(pk.in_(list(incoming)))
+            )
+        }
+
+        new_rows: List[Mapping[str, Any]] = []
+        changed: List[Dict[str, Any]] = []
+        for key, row in incoming.items():
+            values = tuple(row[name] for name in compare_fields)
+            current = existing.get(key)
+            if current is None:
+                new_rows.append(row)
+            elif current != values:
+                changed.append({
+                    "key_": key,
+                    **{f"new_{name}": row[name] for name in compare_fields}
+                })
+            else:
+                unchanged += 1
+
+        if new_rows:
+            result = connection.execute(insert_stmt, new_rows)
+            inserted += max(result.rowcount, 0)
+        if changed:
+            connection.execute(update_stmt, changed)
+            updated += len(changed)
+
+    session.commit()
+    return {
+        "inserted": inserted,
+        "updated": updated,
+        "unchanged": unchanged,
+    }
+
+
+def insert_ignore_from_select(
+    session: Session,
+    model: type[SQLModel],
+    columns: Sequence[str],
+    query: Select
+) -> Dict[str, int]:
+    """
+    INSERT IGNORE ... SELECT: las filas se generan y escriben dentro de la
+    base sin pasar por Python. Antes cuenta las filas que entrega `query`
+    para informar cuántas fueron duplicadas.
+
+    :param columns: Columnas destino, en el orden de las de `query`.
+    """
+    connection = session.connection()
+    received = connection.execute(
+        select(func.count()).select_from(query.subquery())
+    ).scalar_one()
+    result = connection.execute(
+        insert_ignore_statement(model).from_select(columns, query)
+    )
+    session.commit()
+    return insert_summary(received, max(result.rowcount, 0))
+
+
+def sync_from_select(
+    session: Session,
+    model: type[SQLModel],
+    columns: Sequence[str],
+    query: Select,
+    scope: ColumnElement,
+    values: Optional[Mapping[str, Any]] = None
+) -> Dict[str, int]:
+    """
+    Deja en la tabla, dentro de `scope`, exactamente las filas que entrega
+    `query`: inserta las que faltan y borra las sobrantes. Pensado para
+    recalcular un subconjunto pequeño (p. ej. las llaves de un remitente).
+    Solo se borran filas dentro de `scope`. No confirma: quien llama lo
+    hace junto con la escritura que originó el recálculo.
+
+    :param scope: Condición sobre la tabla que delimita las filas actuales
+        que se comparan con `query`.
+    :param values: Columnas fijas de las filas insertadas, además de la
+        llave.
+    """
+    table = model.__table__
+    key_columns = [table.c[name] for name in columns]
+    connection = session.connection()
+    desired = {tuple(row) for row in connection.execute(query)}
+    current = {
+        tuple(row)
+        for row in connection.execute(select(*key_columns).where(scope))
+    }
+
+    missing = desired - current
+    stale = current - desired
+    inserted = 0
+    if missing:
+        # Una llave puede existir fuera de `scope`; el IGNORE la respeta
+        inserted = connection.execute(
+            insert_ignore_statement(model),
+            [{**dict(zip(columns, key)), **(values or {})} for key in missing]
+        ).rowcount
+    if stale:
+        connection.execute(
+            delete(table)
+            .where(scope)
+            .where(tuple_(*key_columns).in_(list(stale)))
+        )
+    return {
+        "inserted": max(inserted, 0),
+        "deleted": len(stale),
+        "unchanged": len(desired & current),
+    }
+
+
+class CountingIterator:
+    """
+    Recorre un iterable una sola vez contando sus elementos, para resumir
+    cargas que llegan como generador sin materializarlas.
+    """
+
+    def __init__(self, rows: Iterable[Any]):
+        self.rows = rows
+        self.count: int = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        for row in self.rows:
+            self.count += 1
+            yield row
+
+
+def insert_summary(received: int, inserted: int) -> Dict[str, int]:
+    return {
+        "inserted": inserted,
+        "duplicates_ignored": received - inserted,
+    }
@@ -1,7 +1,17 @@
-from sqlmodel import Session, insert, select
-from typing import List, Optional
+from sqlmodel import Session, and_, select
+from sqlalchemy import literal
+from sqlalchemy.sql import ColumnElement, Select
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
+from app.domain.enums.email_sender.email_sender import AssociationSource
 from app.domain.models.email_sender_headquarters import EmailSenderHeadquarters
+from app.repository.bulk_writer import (
+    insert_ignore_from_select,
+    insert_ignore_in_batches,
+    sync_from_select,
+)
+
+RULE: str = AssociationSource.RULE.value
 
 
 class EmailSenderHeadquartersRepository:
@@ -42,15 +52,44 @@ class EmailSenderHeadquartersRepository:
         return False
 
     def bulk_insert_ignore(
-        self, headquarter_emails: List[EmailSenderHeadquarters]
-    ):
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> int:
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        Inserta múltiples registros en la tabla por lotes a partir de
+        diccionarios columna -> valor, sin construir modelos.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
         """
-        stmt = insert(EmailSenderHeadquarters).values(
-            [u.model_dump() for u in headquarter_emails]
+        return insert_ignore_in_batches(
+            self.session, EmailSenderHeadquarters, rows
+        )
+
+    def insert_ignore_from_select(self, query: Select) -> Dict[str, int]:
+        """
+        Inserta las parejas (sender_id, cod_headquarters) que entrega
+        `query` con un INSERT IGNORE ... SELECT, sin traerlas a Python.
+        Quedan marcadas como derivadas de las reglas.
+        """
+        return insert_ignore_from_select(
+            self.session,
+            EmailSenderHeadquarters,
+            ("sender_id", "cod_headquarters", "source"),
+            query.add_columns(literal(RULE))
+        )
+
+    def sync_from_select(
+        self, query: Select, scope: ColumnElement
+    ) -> Dict[str, int]:
+        """
+        Deja dentro de `scope` exactamente las parejas
+        (sender_id, cod_headquarters) de `query` entre las derivadas de
+        las reglas; las creadas a mano no se borran.
+        """
+        return sync_from_select(
+            self.session,
+            EmailSenderHeadquarters,
+            ("sender_id", "cod_headquarters"),
+            query,
+            and_(scope, EmailSenderHeadquarters.source == RULE),
+            {"source": RULE}
         )
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.exec(stmt)
-        self.session.commit()
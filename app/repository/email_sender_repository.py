@@ -23,13 +23,22 @@ class EmailSenderRepository:
             select(EmailSender).where(EmailSender.email == email)
         ).first()
 
-    def create(self, sender: EmailSender) -> EmailSender:
+    def create(self, sender: EmailSender, commit: bool = True) -> EmailSender:
+        """
+        Con `commit=False` solo envía el cambio a la base; quien llama lo
+        confirma junto con sus demás escrituras. Igual en update y delete.
+        """
         self.session.add(sender)
+        if not commit:
+            self.session.flush()
+            return sender
         self.session.commit()
         self.session.refresh(sender)
         return sender
 
-    def update(self, id: str, data: EmailSender) -> Optional[EmailSender]:
+    def update(
+        self, id: str, data: EmailSender, commit: bool = True
+    ) -> Optional[EmailSender]:
         sender = self.get_by_id(id)
         if not sender:
             return None
@@ -38,14 +47,20 @@ class EmailSenderRepository:
             setattr(sender, key, value)
 
         self.session.add(sender)
+        if not commit:
+            self.session.flush()
+            return sender
         self.session.commit()
         self.session.refresh(sender)
         return sender
 
-    def delete(self, id: str) -> bool:
+    def delete(self, id: str, commit: bool = True) -> bool:
         sender = self.get_by_id(id)
         if sender:
             self.session.delete(sender)
-            self.session.commit()
+            if commit:
+                self.session.commit()
+            else:
+                self.session.flush()
             return True
         return False
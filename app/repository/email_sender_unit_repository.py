@@ -1,7 +1,17 @@
-from sqlmodel import Session, insert, select
-from typing import List, Optional
+from sqlmodel import Session, and_, select
+from sqlalchemy import literal
+from sqlalchemy.sql import ColumnElement, Select
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
+from app.domain.enums.email_sender.email_sender import AssociationSource
 from app.domain.models.email_sender_unit import EmailSenderUnit
+from app.repository.bulk_writer import (
+    insert_ignore_from_select,
+    insert_ignore_in_batches,
+    sync_from_select,
+)
+
+RULE: str = AssociationSource.RULE.value
 
 
 class EmailSenderUnitRepository:
@@ -37,15 +47,42 @@ class EmailSenderUnitRepository:
         return False
 
     def bulk_insert_ignore(
-        self, unit_emails: List[EmailSenderUnit]
-    ):
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> int:
+        """
+        Inserta múltiples registros en la tabla por lotes a partir de
+        diccionarios columna -> valor, sin construir modelos.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        return insert_ignore_in_batches(self.session, EmailSenderUnit, rows)
+
+    def insert_ignore_from_select(self, query: Select) -> Dict[str, int]:
         """
-        stmt = insert(EmailSenderUnit).values(
-            [u.model_dump() for u in unit_emails]
+        Inserta las parejas (sender_id, cod_unit) que entrega `query` con un
+        INSERT IGNORE ... SELECT, sin traerlas a Python. Quedan marcadas
+        como derivadas de las reglas.
+        """
+        return insert_ignore_from_select(
+            self.session,
+            EmailSenderUnit,
+            ("sender_id", "cod_unit", "source"),
+            query.add_columns(literal(RULE))
+        )
+
+    def sync_from_select(
+        self, query: Select, scope: ColumnElement
+    ) -> Dict[str, int]:
+        """
+        Deja dentro de `scope` exactamente las parejas
+        (sender_id, cod_unit) de `query` entre las derivadas de las
+        reglas; las creadas a mano no se borran.
+        """
+        return sync_from_select(
+            self.session,
+            EmailSenderUnit,
+            ("sender_id", "cod_unit"),
+            query,
+            and_(scope, EmailSenderUnit.source == RULE),
+            {"source": RULE}
         )
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.exec(stmt)
-        self.session.commit()
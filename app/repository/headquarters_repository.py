@@ -1,11 +1,19 @@
-from sqlmodel import Session, insert, select
-from typing import List, Optional
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 from app.domain.models.headquarters import Headquarters
 from app.domain.dtos.headquarters.headquarters_input import HeadquartersInput
+from app.repository.bulk_writer import (
+    insert_ignore_in_batches,
+    upsert_changed_in_batches,
+)
 
 
 class HeadquartersRepository:
+    # Columnas que llegan en las cargas de archivos
+    UPSERT_FIELDS = ("email", "name", "type_facultad")
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -19,6 +27,15 @@ class HeadquartersRepository:
     def get_by_id(self, cod_headquarters: str) -> Optional[Headquarters]:
         return self.session.get(Headquarters, cod_headquarters)
 
+    def get_by_ids(
+            self, cod_headquarters: Iterable[str]
+    ) -> List[Headquarters]:
+        return self.session.exec(
+            select(Headquarters).where(
+                Headquarters.cod_headquarters.in_(list(cod_headquarters))
+            )
+        ).all()
+
     def get_by_name(self, name_headquarters: str) -> List[Headquarters]:
         statement = select(Headquarters).where(
             Headquarters.name == name_headquarters
@@ -58,15 +75,31 @@ class HeadquartersRepository:
         return False
 
     def bulk_insert_ignore(
-        self, unitUnal: List[Headquarters]
-    ):
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> int:
+        """
+        Inserta múltiples registros en la tabla por lotes a partir de
+        diccionarios columna -> valor, sin construir modelos.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
+        """
+        return insert_ignore_in_batches(self.session, Headquarters, rows)
+
+    def bulk_upsert_changed(
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> Dict[str, int]:
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        Inserta los registros nuevos y actualiza solo los que cambiaron en
+        UPSERT_FIELDS; los registros iguales no se escriben.
         """
-        stmt = insert(Headquarters).values(
-            [u.model_dump() for u in unitUnal]
+        return upsert_changed_in_batches(
+            self.session, Headquarters, rows, self.UPSERT_FIELDS
         )
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.exec(stmt)
-        self.session.commit()
+
+
+class HeadquartersAsyncRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_id(self, cod_headquarters: str) -> Optional[Headquarters]:
+        return await self.session.get(Headquarters, cod_headquarters)
@@ -0,0 +1,47 @@
+from datetime import datetime
+from sqlmodel import Session, delete, select
+from app.domain.models.import_checkpoint import ImportCheckpoint
+from typing import List
+
+
+class ImportCheckpointRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_by_table(
+        self,
+        content_hash: str,
+        cod_period: str,
+        table_name: str,
+        chunk_rows: int
+    ) -> List[ImportCheckpoint]:
+        statement = select(ImportCheckpoint).where(
+            ImportCheckpoint.content_hash == content_hash,
+            ImportCheckpoint.cod_period == cod_period,
+            ImportCheckpoint.table_name == table_name,
+            ImportCheckpoint.chunk_rows == chunk_rows,
+        )
+        return self.session.exec(statement).all()
+
+    def save(self, checkpoint: ImportCheckpoint) -> ImportCheckpoint:
+        # merge: un bloque reescrito tras una caída reemplaza su marca
+        checkpoint = self.session.merge(checkpoint)
+        self.session.commit()
+        return checkpoint
+
+    def delete_by_upload(self, content_hash: str, cod_period: str) -> int:
+        statement = delete(ImportCheckpoint).where(
+            ImportCheckpoint.content_hash == content_hash,
+            ImportCheckpoint.cod_period == cod_period,
+        )
+        result = self.session.exec(statement)
+        self.session.commit()
+        return result.rowcount
+
+    def delete_created_before(self, created_before: datetime) -> int:
+        statement = delete(ImportCheckpoint).where(
+            ImportCheckpoint.created_at < created_before
+        )
+        result = self.session.exec(statement)
+        self.session.commit()
+        return result.rowcount
@@ -0,0 +1,19 @@
+from sqlmodel import Session
+from app.domain.models.import_ledger import ImportLedger
+from typing import Optional
+
+
+class ImportLedgerRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_by_id(
+        self, content_hash: str, cod_period: str
+    ) -> Optional[ImportLedger]:
+        return self.session.get(ImportLedger, (content_hash, cod_period))
+
+    def save(self, ledger: ImportLedger) -> ImportLedger:
+        # merge: una reimportación forzada reemplaza el registro anterior
+        ledger = self.session.merge(ledger)
+        self.session.commit()
+        return ledger
@@ -18,6 +18,18 @@ class PeriodRepository:
     def get_by_id(self, cod_period: str) -> Optional[Period]:
         return self.session.get(Period, cod_period)
 
+    def get_previous(self, cod_period: str) -> Optional[Period]:
+        """Periodo que inicia justo antes del periodo dado."""
+        period = self.get_by_id(cod_period)
+        if not period or not period.initial_date:
+            return None
+        return self.session.exec(
+            select(Period)
+            .where(Period.initial_date < period.initial_date)
+            .order_by(Period.initial_date.desc())
+            .limit(1)
+        ).first()
+
     def create(self, period: Period) -> Period:
         self.session.add(period)
         self.session.commit()
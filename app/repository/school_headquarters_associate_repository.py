@@ -1,9 +1,10 @@
-from sqlmodel import Session, and_, insert, select
-from typing import List, Optional
+from sqlmodel import Session, and_, select
+from typing import Any, Iterable, List, Mapping, Optional
 
 from app.domain.models.school_headquarters_associate import (
     SchoolHeadquartersAssociate
 )
+from app.repository.bulk_writer import insert_ignore_in_batches
 
 
 class SchoolHeadquartersAssociateRepository:
@@ -54,9 +55,14 @@ class SchoolHeadquartersAssociateRepository:
 
     def create(
             self,
-            assoc: SchoolHeadquartersAssociate
+            assoc: SchoolHeadquartersAssociate,
+            commit: bool = True
     ) -> SchoolHeadquartersAssociate:
+        # Con commit=False solo envía el cambio (ver EmailSenderRepository)
         self.session.add(assoc)
+        if not commit:
+            self.session.flush()
+            return assoc
         self.session.commit()
         self.session.refresh(assoc)
         return assoc
@@ -65,25 +71,28 @@ class SchoolHeadquartersAssociateRepository:
             self,
             cod_school: str,
             cod_headquarters: str,
-            cod_period: str
+            cod_period: str,
+            commit: bool = True
     ) -> bool:
         assoc = self.get_by_id(cod_school, cod_headquarters, cod_period)
         if assoc:
             self.session.delete(assoc)
-            self.session.commit()
+            if commit:
+                self.session.commit()
+            else:
+                self.session.flush()
             return True
         return False
 
     def bulk_insert_ignore(
-        self, unitUnal: List[SchoolHeadquartersAssociate]
-    ):
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> int:
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        Inserta múltiples registros en la tabla por lotes a partir de
+        diccionarios columna -> valor, sin construir modelos.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
         """
-        stmt = insert(SchoolHeadquartersAssociate).values(
-            [u.model_dump() for u in unitUnal]
+        return insert_ignore_in_batches(
+            self.session, SchoolHeadquartersAssociate, rows
         )
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.exec(stmt)
-        self.session.commit()
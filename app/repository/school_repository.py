@@ -1,11 +1,19 @@
-from sqlmodel import Session, insert, select
-from typing import List, Optional
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 from app.domain.models.school import School
 from app.domain.dtos.school.school_input import SchoolInput
+from app.repository.bulk_writer import (
+    insert_ignore_in_batches,
+    upsert_changed_in_batches,
+)
 
 
 class SchoolRepository:
+    # Columnas que llegan en las cargas de archivos
+    UPSERT_FIELDS = ("email", "name")
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -19,6 +27,11 @@ class SchoolRepository:
     def get_by_id(self, cod_school: str) -> Optional[School]:
         return self.session.get(School, cod_school)
 
+    def get_by_ids(self, cod_schools: Iterable[str]) -> List[School]:
+        return self.session.exec(
+            select(School).where(School.cod_school.in_(list(cod_schools)))
+        ).all()
+
     def create(self, school: School) -> School:
         self.session.add(school)
         self.session.commit()
@@ -48,15 +61,31 @@ class SchoolRepository:
         return False
 
     def bulk_insert_ignore(
-        self, unitUnal: List[School]
-    ):
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> int:
+        """
+        Inserta múltiples registros en la tabla por lotes a partir de
+        diccionarios columna -> valor, sin construir modelos.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
+        """
+        return insert_ignore_in_batches(self.session, School, rows)
+
+    def bulk_upsert_changed(
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> Dict[str, int]:
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        Inserta los registros nuevos y actualiza solo los que cambiaron en
+        UPSERT_FIELDS; los registros iguales no se escriben.
         """
-        stmt = insert(School).values(
-            [u.model_dump() for u in unitUnal]
+        return upsert_changed_in_batches(
+            self.session, School, rows, self.UPSERT_FIELDS
         )
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.exec(stmt)
-        self.session.commit()
+
+
+class SchoolAsyncRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_id(self, cod_school: str) -> Optional[School]:
+        return await self.session.get(School, cod_school)
@@ -1,7 +1,8 @@
-from sqlmodel import Session, insert, select
-from typing import List, Optional
+from sqlmodel import Session, select
+from typing import Iterable, List, Optional
 
 from app.domain.models.type_user_association import TypeUserAssociation
+from app.repository.bulk_writer import insert_ignore_in_batches
 
 
 class TypeUserAssociationRepository:
@@ -46,15 +47,15 @@ class TypeUserAssociationRepository:
         return False
 
     def bulk_insert_ignore(
-        self, unitUnal: List[TypeUserAssociation]
-    ):
+        self, unitUnal: Iterable[TypeUserAssociation]
+    ) -> int:
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        Inserta múltiples registros en la tabla por lotes.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
         """
-        stmt = insert(TypeUserAssociation).values(
-            [u.model_dump() for u in unitUnal]
+        return insert_ignore_in_batches(
+            self.session,
+            TypeUserAssociation,
+            (u.model_dump() for u in unitUnal)
         )
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.exec(stmt)
-        self.session.commit()
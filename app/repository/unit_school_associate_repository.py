@@ -1,8 +1,9 @@
-from sqlmodel import Session, and_, insert, select
-from typing import List, Optional
+from sqlmodel import Session, and_, select
+from typing import Any, Iterable, List, Mapping, Optional
 
 from app.domain.models.unit_school_associate import UnitSchoolAssociate
 from app.utils.app_logger import AppLogger
+from app.repository.bulk_writer import insert_ignore_in_batches
 
 
 class UnitSchoolAssociateRepository:
@@ -57,30 +58,44 @@ class UnitSchoolAssociateRepository:
             (cod_unit, cod_school, cod_period)
         )
 
-    def create(self, assoc: UnitSchoolAssociate) -> UnitSchoolAssociate:
+    def create(
+        self, assoc: UnitSchoolAssociate, commit: bool = True
+    ) -> UnitSchoolAssociate:
+        # Con commit=False solo envía el cambio (ver EmailSenderRepository)
         self.session.add(assoc)
+        if not commit:
+            self.session.flush()
+            return assoc
         self.session.commit()
         self.session.refresh(assoc)
         return assoc
 
-    def delete(self, cod_unit: str, cod_school: str, cod_period: str) -> bool:
+    def delete(
+        self,
+        cod_unit: str,
+        cod_school: str,
+        cod_period: str,
+        commit: bool = True
+    ) -> bool:
         assoc = self.get_by_id(cod_unit, cod_school, cod_period)
         if assoc:
             self.session.delete(assoc)
-            self.session.commit()
+            if commit:
+                self.session.commit()
+            else:
+                self.session.flush()
             return True
         return False
 
     def bulk_insert_ignore(
-        self, unitSchoolAssociate: List[UnitSchoolAssociate]
-    ):
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> int:
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        Inserta múltiples registros en la tabla por lotes a partir de
+        diccionarios columna -> valor, sin construir modelos.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
         """
-        stmt = insert(UnitSchoolAssociate).values(
-            [u.model_dump() for u in unitSchoolAssociate]
+        return insert_ignore_in_batches(
+            self.session, UnitSchoolAssociate, rows
         )
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.exec(stmt)
-        self.session.commit()
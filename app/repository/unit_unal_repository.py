@@ -1,11 +1,19 @@
-from sqlmodel import Session, insert, select
-from typing import List, Optional
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 from app.domain.models.unit_unal import UnitUnal
 from app.domain.dtos.unit_unal.unit_unal_input import UnitUnalInput
+from app.repository.bulk_writer import (
+    insert_ignore_in_batches,
+    upsert_changed_in_batches,
+)
 
 
 class UnitUnalRepository:
+    # Columnas que llegan en las cargas de archivos
+    UPSERT_FIELDS = ("email", "name", "type_unit")
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -48,15 +56,31 @@ class UnitUnalRepository:
         return False
 
     def bulk_insert_ignore(
-        self, unitUnal: List[UnitUnal]
-    ):
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> int:
+        """
+        Inserta múltiples registros en la tabla por lotes a partir de
+        diccionarios columna -> valor, sin construir modelos.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        return insert_ignore_in_batches(self.session, UnitUnal, rows)
+
+    def bulk_upsert_changed(
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> Dict[str, int]:
         """
-        stmt = insert(UnitUnal).values(
-            [u.model_dump() for u in unitUnal]
+        Inserta los registros nuevos y actualiza solo los que cambiaron en
+        UPSERT_FIELDS; los registros iguales no se escriben.
+        """
+        return upsert_changed_in_batches(
+            self.session, UnitUnal, rows, self.UPSERT_FIELDS
         )
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.exec(stmt)
-        self.session.commit()
+
+
+class UnitUnalAsyncRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_id(self, cod_unit: str) -> Optional[UnitUnal]:
+        return await self.session.get(UnitUnal, cod_unit)
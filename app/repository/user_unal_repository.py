@@ -1,9 +1,10 @@
-from typing import List, Optional
+from typing import Any, Iterable, List, Mapping, Optional
 from sqlmodel import Session, select
-from sqlalchemy.dialects.mysql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.domain.models.user_unal import UserUnal
 from app.domain.dtos.user_unal.user_unal_input import UserUnalInput
+from app.repository.bulk_writer import insert_ignore_in_batches
 
 
 class UserUnalRepository:
@@ -56,12 +57,29 @@ class UserUnalRepository:
             return True
         return False
 
-    def bulk_insert_ignore(self, users: List[UserUnal]):
+    def bulk_insert_ignore(
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> int:
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        Inserta múltiples registros en la tabla por lotes a partir de
+        diccionarios columna -> valor, sin construir modelos.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
         """
-        stmt = insert(UserUnal).values([u.model_dump() for u in users])
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.execute(stmt)
-        self.session.commit()
+        return insert_ignore_in_batches(self.session, UserUnal, rows)
+
+
+class UserUnalAsyncRepository:
+    """Lecturas de usuarios sobre una sesión asíncrona."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_all(self, start: int = 0, limit: int = 20) -> List[UserUnal]:
+        result = await self.session.exec(
+            select(UserUnal).offset(start).limit(limit)
+        )
+        return result.all()
+
+    async def get_by_email(self, email_unal: str) -> Optional[UserUnal]:
+        return await self.session.get(UserUnal, email_unal)
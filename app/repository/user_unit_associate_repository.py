@@ -1,7 +1,9 @@
-from sqlmodel import Session, and_, insert, select
-from typing import List, Optional
+from sqlmodel import Session, and_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 from app.domain.models.user_unit_associate import UserUnitAssociate
+from app.repository.bulk_writer import insert_ignore_in_batches
 
 
 class UserUnitAssociateRepository:
@@ -39,6 +41,21 @@ class UserUnitAssociateRepository:
         )
         return self.session.exec(statement).all()
 
+    def iter_keys_by_period(
+        self, cod_period: str, batch_size: int = 10000
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Recorre las llaves (email_unal, cod_unit) del periodo por bloques,
+        sin construir objetos del modelo.
+        """
+        statement = (
+            select(UserUnitAssociate.email_unal, UserUnitAssociate.cod_unit)
+            .where(UserUnitAssociate.cod_period == cod_period)
+            .execution_options(yield_per=batch_size)
+        )
+        for email_unal, cod_unit in self.session.exec(statement):
+            yield email_unal, cod_unit
+
     def get_by_keys(
         self,
         email_unal: str,
@@ -64,14 +81,42 @@ class UserUnitAssociateRepository:
             return True
         return False
 
-    def bulk_insert_ignore(self, userUnitAssocs: List[UserUnitAssociate]):
+    def bulk_insert_ignore(
+        self, rows: Iterable[Mapping[str, Any]]
+    ) -> int:
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        Inserta múltiples registros en la tabla por lotes a partir de
+        diccionarios columna -> valor, sin construir modelos.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
         """
-        stmt = insert(UserUnitAssociate).values(
-            [u.model_dump() for u in userUnitAssocs]
-        )
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.exec(stmt)
-        self.session.commit()
+        return insert_ignore_in_batches(self.session, UserUnitAssociate, rows)
+
+
+class UserUnitAssociateAsyncRepository:
+    """Consultas de asociaciones usuario-plan sobre una sesión asíncrona."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_user(
+            self, email_unal: str, cod_period: str = None
+    ) -> List[UserUnitAssociate]:
+        result = await self.session.exec(select(UserUnitAssociate).where(
+            and_(
+                UserUnitAssociate.email_unal == email_unal,
+                UserUnitAssociate.cod_period == cod_period
+            )
+        ))
+        return result.all()
+
+    async def get_by_unit(
+            self, cod_unit: str, cod_period: str = None
+    ) -> List[UserUnitAssociate]:
+        result = await self.session.exec(select(UserUnitAssociate).where(
+            and_(
+                UserUnitAssociate.cod_unit == cod_unit,
+                UserUnitAssociate.cod_period == cod_period
+            )
+        ))
+        return result.all()
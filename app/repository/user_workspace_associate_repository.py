@@ -1,6 +1,7 @@
-from typing import List
-from sqlmodel import Session, insert, select
+from typing import Iterable, List
+from sqlmodel import Session, select
 from app.domain.models.user_workspace_associate import UserWorkspaceAssociate
+from app.repository.bulk_writer import insert_ignore_in_batches
 
 
 class UserWorkspaceAssociateRepository:
@@ -38,15 +39,15 @@ class UserWorkspaceAssociateRepository:
         self.session.commit()
 
     def bulk_insert_ignore(
-        self, userWorkspaceAssociates: List[UserWorkspaceAssociate]
-    ):
+        self, userWorkspaceAssociates: Iterable[UserWorkspaceAssociate]
+    ) -> int:
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        Inserta múltiples registros en la tabla por lotes.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
         """
-        stmt = insert(UserWorkspaceAssociate).values(
-            [u.model_dump() for u in userWorkspaceAssociates]
+        return insert_ignore_in_batches(
+            self.session,
+            UserWorkspaceAssociate,
+            (u.model_dump() for u in userWorkspaceAssociates)
         )
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.exec(stmt)
-        self.session.commit()
@@ -1,7 +1,7 @@
-from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.domain.models.user_workspace import UserWorkspace
-from typing import List
+from typing import Iterable, List
+from app.repository.bulk_writer import insert_ignore_in_batches
 
 
 class UserWorkspaceRepository:
@@ -43,15 +43,15 @@ class UserWorkspaceRepository:
         return True
 
     def bulk_insert_ignore(
-        self, unitUnal: List[UserWorkspace]
-    ):
+        self, unitUnal: Iterable[UserWorkspace]
+    ) -> int:
         """
-        Inserta múltiples usuarios en la tabla.
-        Si encuentra PK duplicada (email_unal), ignora ese registro.
+        Inserta múltiples registros en la tabla por lotes.
+        Si encuentra PK duplicada, ignora ese registro.
+        Retorna la cantidad de filas realmente insertadas.
         """
-        stmt = insert(UserWorkspace).values(
-            [u.model_dump() for u in unitUnal]
+        return insert_ignore_in_batches(
+            self.session,
+            UserWorkspace,
+            (u.model_dump() for u in unitUnal)
         )
-        stmt = stmt.prefix_with("IGNORE")
-        self.session.exec(stmt)
-        self.session.commit()
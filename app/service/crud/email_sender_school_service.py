@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.sql import ColumnElement, Select
+from typing import Iterable, List, Optional
 
 from app.repository.email_sender_school_repository import (
     EmailSenderSchoolRepository
@@ -10,6 +11,13 @@ from app.domain.models.email_sender_school import EmailSenderSchool
 from app.domain.dtos.email_sender_school.email_sender_school_input import (
     EmailSenderSchoolInput
 )
+from app.domain.dtos.email_sender_school.email_sender_school_record import (
+    EmailSenderSchoolRecord,
+)
+from app.repository.bulk_writer import (
+    CountingIterator,
+    insert_summary,
+)
 
 
 class EmailSenderSchoolService:
@@ -46,24 +54,36 @@ class EmailSenderSchoolService:
             sender_id, cod_school
         )
 
-    # TODO: this methond break the pattern, fix it later
-    # the input is not a dto, its a model.
     @staticmethod
     def bulk_insert_ignore(
-        email_schools: List[EmailSenderSchool],
+        records: Iterable[EmailSenderSchoolRecord],
         session: Session
     ):
         """
-        Inserta en bulk usuarios.
-        Si hay duplicados en email_unal, MySQL los ignora.
+        Inserta en bulk asociaciones remitente-facultad.
+        `records` puede ser un generador: se consume una sola vez.
+        Si hay duplicados de PK, MySQL los ignora.
+        """
+        rows = CountingIterator(record._asdict() for record in records)
+        repo = EmailSenderSchoolRepository(session)
+        inserted = repo.bulk_insert_ignore(rows)
+        return insert_summary(rows.count, inserted)
+
+    @staticmethod
+    def insert_ignore_from_select(query: Select, session: Session):
+        """
+        Variante en SQL de bulk_insert_ignore: `query` entrega las parejas
+        (sender_id, cod_school) y se insertan dentro de la base.
         """
-        user_models = [
-            EmailSenderSchool(**u.model_dump(exclude_unset=True))
-            for u in email_schools
-        ]
         repo = EmailSenderSchoolRepository(session)
-        repo.bulk_insert_ignore(user_models)
-        return {
-            "inserted": len(email_schools),
-            "duplicates_ignored": True,
-        }
+        return repo.insert_ignore_from_select(query)
+
+    @staticmethod
+    def sync_from_select(
+        query: Select,
+        scope: ColumnElement,
+        session: Session
+    ):
+        """Recalcula las asociaciones dentro de `scope` contra `query`."""
+        repo = EmailSenderSchoolRepository(session)
+        return repo.sync_from_select(query, scope)
@@ -20,18 +20,25 @@ class EmailSenderService:
         return repo.get_by_id(id)
 
     @staticmethod
-    def create(input_data: EmailSenderInput, session: Session) -> EmailSender:
+    def create(
+        input_data: EmailSenderInput,
+        session: Session,
+        commit: bool = True
+    ) -> EmailSender:
         sender = EmailSender(**input_data.model_dump(exclude_unset=True))
-        return EmailSenderRepository(session).create(sender)
+        return EmailSenderRepository(session).create(sender, commit)
 
     @staticmethod
     def update(
         id: str,
         input_data: EmailSenderInput,
-        session: Session
+        session: Session,
+        commit: bool = True
     ) -> Optional[EmailSender]:
-        return EmailSenderRepository(session).update(id, input_data)
+        repo = EmailSenderRepository(session)
+        return repo.update(id, input_data, commit)
 
     @staticmethod
-    def delete(id: str, session: Session) -> bool:
-        return EmailSenderRepository(session).delete(id)
+    def delete(id: str, session: Session, commit: bool = True) -> bool:
+        repo = EmailSenderRepository(session)
+        return repo.delete(id, commit)
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.sql import ColumnElement, Select
+from typing import Iterable, List, Optional
 
 from app.repository.email_sender_unit_repository import (
     EmailSenderUnitRepository
@@ -8,6 +9,13 @@ from app.domain.models.email_sender_unit import EmailSenderUnit
 from app.domain.dtos.email_sender_unit.email_sender_unit_input import (
     EmailSenderUnitInput
 )
+from app.domain.dtos.email_sender_unit.email_sender_unit_record import (
+    EmailSenderUnitRecord,
+)
+from app.repository.bulk_writer import (
+    CountingIterator,
+    insert_summary,
+)
 
 
 class EmailSenderUnitService:
@@ -40,24 +48,35 @@ class EmailSenderUnitService:
     def delete(sender_id: str, cod_unit: str, session: Session) -> bool:
         return EmailSenderUnitRepository(session).delete(sender_id, cod_unit)
 
-        # TODO: this methond break the pattern, fix it later
-    # the input is not a dto, its a model.
     @staticmethod
     def bulk_insert_ignore(
-        email_units: List[EmailSenderUnit],
+        records: Iterable[EmailSenderUnitRecord],
         session: Session
     ):
         """
-        Inserta en bulk usuarios.
-        Si hay duplicados en email_unal, MySQL los ignora.
+        Inserta en bulk asociaciones remitente-unidad.
+        `records` puede ser un generador: se consume una sola vez.
+        Si hay duplicados de PK, MySQL los ignora.
+        """
+        rows = CountingIterator(record._asdict() for record in records)
+        inserted = EmailSenderUnitRepository(session).bulk_insert_ignore(rows)
+        return insert_summary(rows.count, inserted)
+
+    @staticmethod
+    def insert_ignore_from_select(query: Select, session: Session):
+        """
+        Variante en SQL de bulk_insert_ignore: `query` entrega las parejas
+        (sender_id, cod_unit) y se insertan dentro de la base.
         """
-        user_models = [
-            EmailSenderUnit(**u.model_dump(exclude_unset=True))
-            for u in email_units
-        ]
         repo = EmailSenderUnitRepository(session)
-        repo.bulk_insert_ignore(user_models)
-        return {
-            "inserted": len(email_units),
-            "duplicates_ignored": True,
-        }
+        return repo.insert_ignore_from_select(query)
+
+    @staticmethod
+    def sync_from_select(
+        query: Select,
+        scope: ColumnElement,
+        session: Session
+    ):
+        """Recalcula las asociaciones dentro de `scope` contra `query`."""
+        repo = EmailSenderUnitRepository(session)
+        return repo.sync_from_select(query, scope)
@@ -1,9 +1,18 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Iterable, List, Optional
 
-from app.repository.headquarters_repository import HeadquartersRepository
+from app.repository.headquarters_repository import (
+    HeadquartersAsyncRepository,
+    HeadquartersRepository,
+)
 from app.domain.models.headquarters import Headquarters
 from app.domain.dtos.headquarters.headquarters_input import HeadquartersInput
+from app.domain.dtos.headquarters.headquarters_record import HeadquartersRecord
+from app.repository.bulk_writer import insert_summary
+from app.utils.organization_schema_version import (
+    invalidate_organization_schema
+)
 
 
 class HeadquartersService:
@@ -23,6 +32,22 @@ class HeadquartersService:
             cod_headquarters
         )
 
+    @staticmethod
+    def get_by_ids(
+        cod_headquarters: Iterable[str],
+        session: Session
+    ) -> List[Headquarters]:
+        """Sedes de la lista en una sola consulta (IN)."""
+        return HeadquartersRepository(session).get_by_ids(cod_headquarters)
+
+    @staticmethod
+    async def get_by_id_async(
+        cod_headquarters: str,
+        session: AsyncSession
+    ) -> Optional[Headquarters]:
+        repo = HeadquartersAsyncRepository(session)
+        return await repo.get_by_id(cod_headquarters)
+
     @staticmethod
     def get_by_name(
         name_headquarters: str,
@@ -38,7 +63,9 @@ class HeadquartersService:
         session: Session
     ) -> Headquarters:
         hq = Headquarters(**input_data.model_dump(exclude_unset=True))
-        return HeadquartersRepository(session).create(hq)
+        created = HeadquartersRepository(session).create(hq)
+        invalidate_organization_schema()
+        return created
 
     @staticmethod
     def update(
@@ -61,22 +88,37 @@ class HeadquartersService:
 
     @staticmethod
     def delete(cod_headquarters: str, session: Session) -> bool:
-        return HeadquartersRepository(session).delete(cod_headquarters)
+        deleted = HeadquartersRepository(session).delete(cod_headquarters)
+        invalidate_organization_schema()
+        return deleted
 
     @staticmethod
     def bulk_insert_ignore(
-        users: List[HeadquartersInput],
+        records: List[HeadquartersRecord],
         session: Session
     ):
         """
-        Inserta en bulk usuarios.
-        Si hay duplicados en email_unal, MySQL los ignora.
+        Inserta en bulk registros de carga masiva; cada registro pasa
+        directo a los parámetros del INSERT.
+        Si hay duplicados de PK, MySQL los ignora.
         """
-        user_models = [
-            Headquarters(**u.model_dump(exclude_unset=True))
-            for u in users
-        ]
-        HeadquartersRepository(session).bulk_insert_ignore(
-            user_models
-        )
-        return {"inserted": len(users), "duplicates_ignored": True}
+        rows = (record._asdict() for record in records)
+        repo = HeadquartersRepository(session)
+        inserted = repo.bulk_insert_ignore(rows)
+        invalidate_organization_schema()
+        return insert_summary(len(records), inserted)
+
+    @staticmethod
+    def bulk_upsert_changed(
+        records: List[HeadquartersRecord],
+        session: Session
+    ):
+        """
+        Inserta en bulk los registros nuevos y actualiza los que cambiaron
+        (p. ej. planes o facultades renombrados).
+        """
+        rows = (record._asdict() for record in records)
+        repo = HeadquartersRepository(session)
+        result = repo.bulk_upsert_changed(rows)
+        invalidate_organization_schema()
+        return {"received": len(records), **result}
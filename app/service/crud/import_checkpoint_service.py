@@ -0,0 +1,64 @@
+import json
+from datetime import datetime
+from app.domain.models.import_checkpoint import ImportCheckpoint
+from app.repository.import_checkpoint_repository import (
+    ImportCheckpointRepository,
+)
+from sqlalchemy.orm import Session
+from typing import Any, Dict
+
+
+class ImportCheckpointService:
+    @staticmethod
+    def get_done_chunks(
+        content_hash: str,
+        cod_period: str,
+        table_name: str,
+        chunk_rows: int,
+        session: Session
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Resultado de cada bloque ya confirmado, por índice de bloque. Solo
+        cuentan las marcas hechas con el mismo tamaño de bloque.
+        """
+        repo = ImportCheckpointRepository(session)
+        return {
+            checkpoint.chunk_index: json.loads(checkpoint.result or "{}")
+            for checkpoint in repo.get_by_table(
+                content_hash, cod_period, table_name, chunk_rows
+            )
+        }
+
+    @staticmethod
+    def record(
+        content_hash: str,
+        cod_period: str,
+        table_name: str,
+        chunk_index: int,
+        chunk_rows: int,
+        result: Dict[str, Any],
+        session: Session
+    ) -> ImportCheckpoint:
+        repo = ImportCheckpointRepository(session)
+        return repo.save(ImportCheckpoint(
+            content_hash=content_hash,
+            cod_period=cod_period,
+            table_name=table_name,
+            chunk_index=chunk_index,
+            chunk_rows=chunk_rows,
+            result=json.dumps(result),
+        ))
+
+    @staticmethod
+    def delete_by_upload(
+        content_hash: str, cod_period: str, session: Session
+    ) -> int:
+        repo = ImportCheckpointRepository(session)
+        return repo.delete_by_upload(content_hash, cod_period)
+
+    @staticmethod
+    def delete_created_before(
+        created_before: datetime, session: Session
+    ) -> int:
+        repo = ImportCheckpointRepository(session)
+        return repo.delete_created_before(created_before)
@@ -0,0 +1,36 @@
+import json
+from app.domain.models.import_ledger import ImportLedger
+from app.repository.import_ledger_repository import ImportLedgerRepository
+from sqlalchemy.orm import Session
+from typing import Any, Optional
+
+
+class ImportLedgerService:
+    @staticmethod
+    def get_by_id(
+        content_hash: str, cod_period: str, session: Session
+    ) -> Optional[ImportLedger]:
+        repo = ImportLedgerRepository(session)
+        return repo.get_by_id(content_hash, cod_period)
+
+    @staticmethod
+    def get_result(ledger: ImportLedger) -> Any:
+        return json.loads(ledger.result) if ledger.result else None
+
+    @staticmethod
+    def record(
+        content_hash: str,
+        cod_period: str,
+        result: Any,
+        session: Session,
+        filename: Optional[str] = None,
+        submitted_by: Optional[str] = None
+    ) -> ImportLedger:
+        repo = ImportLedgerRepository(session)
+        return repo.save(ImportLedger(
+            content_hash=content_hash,
+            cod_period=cod_period,
+            filename=filename,
+            submitted_by=submitted_by,
+            result=json.dumps(result),
+        ))
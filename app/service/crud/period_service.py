@@ -18,6 +18,11 @@ class PeriodService:
         repo = PeriodRepository(session)
         return repo.get_by_id(cod_period)
 
+    @staticmethod
+    def get_previous(cod_period: str, session: Session) -> Optional[Period]:
+        repo = PeriodRepository(session)
+        return repo.get_previous(cod_period)
+
     @staticmethod
     def create_period(input_period: PeriodInput, session: Session) -> Period:
         repo = PeriodRepository(session)
@@ -14,6 +14,13 @@ from app.domain.dtos.school_headquarters_associate.school_headquarters_associate
 )
 from app.service.crud.headquarters_service import HeadquartersService
 from app.service.crud.school_service import SchoolService
+from app.domain.dtos.school_headquarters_associate.school_headquarters_associate_record import (  # noqa: E501 ignora error flake8
+    SchoolHeadquartersAssociateRecord,
+)
+from app.repository.bulk_writer import insert_summary
+from app.utils.organization_schema_version import (
+    invalidate_organization_schema
+)
 
 
 class SchoolHeadquartersAssociateService:
@@ -89,45 +96,55 @@ class SchoolHeadquartersAssociateService:
         ):
             return None
 
-        return SchoolHeadquartersAssociateRepository(session).create(
+        created = SchoolHeadquartersAssociateRepository(session).create(
             association
         )
+        invalidate_organization_schema(cod_period)
+        return created
 
     @staticmethod
     def create(
         input_data: SchoolHeadquartersAssociateInput,
-        session: Session
+        session: Session,
+        commit: bool = True
     ) -> SchoolHeadquartersAssociate:
         assoc = SchoolHeadquartersAssociate(**input_data.model_dump())
-        return SchoolHeadquartersAssociateRepository(session).create(assoc)
+        created = SchoolHeadquartersAssociateRepository(session).create(
+            assoc, commit
+        )
+        invalidate_organization_schema(assoc.cod_period)
+        return created
 
     @staticmethod
     def delete(
         cod_school: str,
         cod_headquarter: str,
         cod_period: str,
-        session: Session
+        session: Session,
+        commit: bool = True
     ) -> bool:
-        return SchoolHeadquartersAssociateRepository(session).delete(
+        deleted = SchoolHeadquartersAssociateRepository(session).delete(
             cod_school,
             cod_headquarter,
-            cod_period
+            cod_period,
+            commit
         )
+        invalidate_organization_schema(cod_period)
+        return deleted
 
     @staticmethod
     def bulk_insert_ignore(
-        users: List[SchoolHeadquartersAssociateInput],
+        records: List[SchoolHeadquartersAssociateRecord],
         session: Session
     ):
         """
-        Inserta en bulk usuarios.
-        Si hay duplicados en email_unal, MySQL los ignora.
+        Inserta en bulk registros de carga masiva; cada registro pasa
+        directo a los parámetros del INSERT.
+        Si hay duplicados de PK, MySQL los ignora.
         """
-        user_models = [
-            SchoolHeadquartersAssociate(**u.model_dump(exclude_unset=True))
-            for u in users
-        ]
-        SchoolHeadquartersAssociateRepository(session).bulk_insert_ignore(
-            user_models
-        )
-        return {"inserted": len(users), "duplicates_ignored": True}
+        rows = (record._asdict() for record in records)
+        repo = SchoolHeadquartersAssociateRepository(session)
+        inserted = repo.bulk_insert_ignore(rows)
+        for cod_period in {record.cod_period for record in records}:
+            invalidate_organization_schema(cod_period)
+        return insert_summary(len(records), inserted)
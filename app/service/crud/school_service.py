@@ -1,9 +1,15 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Iterable, List, Optional
 
-from app.repository.school_repository import SchoolRepository
+from app.repository.school_repository import (
+    SchoolAsyncRepository,
+    SchoolRepository,
+)
 from app.domain.models.school import School
 from app.domain.dtos.school.school_input import SchoolInput
+from app.domain.dtos.school.school_record import SchoolRecord
+from app.repository.bulk_writer import insert_summary
 
 
 class SchoolService:
@@ -17,6 +23,21 @@ class SchoolService:
     def get_by_id(cod_school: str, session: Session) -> Optional[School]:
         return SchoolRepository(session).get_by_id(cod_school)
 
+    @staticmethod
+    def get_by_ids(
+        cod_schools: Iterable[str],
+        session: Session
+    ) -> List[School]:
+        """Facultades de la lista en una sola consulta (IN)."""
+        return SchoolRepository(session).get_by_ids(cod_schools)
+
+    @staticmethod
+    async def get_by_id_async(
+        cod_school: str,
+        session: AsyncSession
+    ) -> Optional[School]:
+        return await SchoolAsyncRepository(session).get_by_id(cod_school)
+
     @staticmethod
     def create(input_data: SchoolInput, session: Session) -> School:
         school = School(**input_data.model_dump(exclude_unset=True))
@@ -44,18 +65,29 @@ class SchoolService:
 
     @staticmethod
     def bulk_insert_ignore(
-        users: List[SchoolInput],
+        records: List[SchoolRecord],
+        session: Session
+    ):
+        """
+        Inserta en bulk registros de carga masiva; cada registro pasa
+        directo a los parámetros del INSERT.
+        Si hay duplicados de PK, MySQL los ignora.
+        """
+        rows = (record._asdict() for record in records)
+        repo = SchoolRepository(session)
+        inserted = repo.bulk_insert_ignore(rows)
+        return insert_summary(len(records), inserted)
+
+    @staticmethod
+    def bulk_upsert_changed(
+        records: List[SchoolRecord],
         session: Session
     ):
         """
-        Inserta en bulk usuarios.
-        Si hay duplicados en email_unal, MySQL los ignora.
+        Inserta en bulk los registros nuevos y actualiza los que cambiaron
+        (p. ej. planes o facultades renombrados).
         """
-        user_models = [
-            School(**u.model_dump(exclude_unset=True))
-            for u in users
-        ]
-        SchoolRepository(session).bulk_insert_ignore(
-            user_models
-        )
-        return {"inserted": len(users), "duplicates_ignored": True}
+        rows = (record._asdict() for record in records)
+        repo = SchoolRepository(session)
+        result = repo.bulk_upsert_changed(rows)
+        return {"received": len(records), **result}
@@ -8,6 +8,7 @@ from app.domain.models.type_user_association import TypeUserAssociation
 from app.domain.dtos.type_user_association.type_user_association_input import (
     TypeUserAssociationInput
 )
+from app.repository.bulk_writer import insert_summary
 
 
 class TypeUserAssociationService:
@@ -61,9 +62,9 @@ class TypeUserAssociationService:
         Inserta en bulk usuarios.
         Si hay duplicados en email_unal, MySQL los ignora.
         """
-        user_models = [
+        user_models = (
             TypeUserAssociation(**user.model_dump()) for user in users
-        ]
-        return TypeUserAssociationRepository(session).bulk_insert_ignore(
-            user_models
         )
+        repo = TypeUserAssociationRepository(session)
+        inserted = repo.bulk_insert_ignore(user_models)
+        return insert_summary(len(users), inserted)
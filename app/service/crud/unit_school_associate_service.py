@@ -12,6 +12,13 @@ from app.domain.dtos.unit_school_associate.unit_school_associate_input import (
 )
 from app.service.crud.school_service import SchoolService
 from app.service.crud.unit_unal_service import UnitUnalService
+from app.domain.dtos.unit_school_associate.unit_school_associate_record import (  # noqa: E501 ignora error flake8
+    UnitSchoolAssociateRecord,
+)
+from app.repository.bulk_writer import insert_summary
+from app.utils.organization_schema_version import (
+    invalidate_organization_schema
+)
 
 
 class UnitSchoolAssociateService:
@@ -79,41 +86,51 @@ class UnitSchoolAssociateService:
         ):
             return None
 
-        return UnitSchoolAssociateRepository(session).create(association)
+        created = UnitSchoolAssociateRepository(session).create(association)
+        invalidate_organization_schema(cod_period)
+        return created
 
     @staticmethod
     def create(
         input_data: UnitSchoolAssociateInput,
-        session: Session
+        session: Session,
+        commit: bool = True
     ) -> UnitSchoolAssociate:
         assoc = UnitSchoolAssociate(**input_data.model_dump())
-        return UnitSchoolAssociateRepository(session).create(assoc)
+        created = UnitSchoolAssociateRepository(session).create(assoc, commit)
+        invalidate_organization_schema(assoc.cod_period)
+        return created
 
     @staticmethod
     def delete(
         cod_unit: str,
         cod_school: str,
         cod_period: str,
-        session: Session
+        session: Session,
+        commit: bool = True
     ) -> bool:
-        return UnitSchoolAssociateRepository(session).delete(
+        deleted = UnitSchoolAssociateRepository(session).delete(
             cod_unit,
             cod_school,
-            cod_period
+            cod_period,
+            commit
         )
+        invalidate_organization_schema(cod_period)
+        return deleted
 
     @staticmethod
     def bulk_insert_ignore(
-        users: List[UnitSchoolAssociateInput],
+        records: List[UnitSchoolAssociateRecord],
         session: Session
     ):
         """
-        Inserta en bulk usuarios.
-        Si hay duplicados en email_unal, MySQL los ignora.
+        Inserta en bulk registros de carga masiva; cada registro pasa
+        directo a los parámetros del INSERT.
+        Si hay duplicados de PK, MySQL los ignora.
         """
-        user_models = [
-            UnitSchoolAssociate(**u.model_dump(exclude_unset=True))
-            for u in users
-        ]
-        UnitSchoolAssociateRepository(session).bulk_insert_ignore(user_models)
-        return {"inserted": len(users), "duplicates_ignored": True}
+        rows = (record._asdict() for record in records)
+        repo = UnitSchoolAssociateRepository(session)
+        inserted = repo.bulk_insert_ignore(rows)
+        for cod_period in {record.cod_period for record in records}:
+            invalidate_organization_schema(cod_period)
+        return insert_summary(len(records), inserted)
@@ -1,9 +1,15 @@
 from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List, Optional
 
-from app.repository.unit_unal_repository import UnitUnalRepository
+from app.repository.unit_unal_repository import (
+    UnitUnalAsyncRepository,
+    UnitUnalRepository,
+)
 from app.domain.models.unit_unal import UnitUnal
 from app.domain.dtos.unit_unal.unit_unal_input import UnitUnalInput
+from app.domain.dtos.unit_unal.unit_unal_record import UnitUnalRecord
+from app.repository.bulk_writer import insert_summary
 
 
 class UnitUnalService:
@@ -18,6 +24,13 @@ class UnitUnalService:
     def get_by_id(cod_unit: str, session: Session) -> Optional[UnitUnal]:
         return UnitUnalRepository(session).get_by_id(cod_unit)
 
+    @staticmethod
+    async def get_by_id_async(
+        cod_unit: str,
+        session: AsyncSession
+    ) -> Optional[UnitUnal]:
+        return await UnitUnalAsyncRepository(session).get_by_id(cod_unit)
+
     @staticmethod
     def create(input_data: UnitUnalInput, session: Session) -> UnitUnal:
         unit = UnitUnal(**input_data.model_dump(exclude_unset=True))
@@ -44,14 +57,30 @@ class UnitUnalService:
         return UnitUnalRepository(session).delete(cod_unit)
 
     @staticmethod
-    def bulk_insert_ignore(users: List[UnitUnalInput], session: Session):
+    def bulk_insert_ignore(
+        records: List[UnitUnalRecord],
+        session: Session
+    ):
+        """
+        Inserta en bulk registros de carga masiva; cada registro pasa
+        directo a los parámetros del INSERT.
+        Si hay duplicados de PK, MySQL los ignora.
+        """
+        rows = (record._asdict() for record in records)
+        repo = UnitUnalRepository(session)
+        inserted = repo.bulk_insert_ignore(rows)
+        return insert_summary(len(records), inserted)
+
+    @staticmethod
+    def bulk_upsert_changed(
+        records: List[UnitUnalRecord],
+        session: Session
+    ):
         """
-        Inserta en bulk usuarios.
-        Si hay duplicados en email_unal, MySQL los ignora.
+        Inserta en bulk los registros nuevos y actualiza los que cambiaron
+        (p. ej. planes o facultades renombrados).
         """
-        user_models = [
-            UnitUnal(**u.model_dump(exclude_unset=True))
-            for u in users
-        ]
-        UnitUnalRepository(session).bulk_insert_ignore(user_models)
-        return {"inserted": len(users), "duplicates_ignored": True}
+        rows = (record._asdict() for record in records)
+        repo = UnitUnalRepository(session)
+        result = repo.bulk_upsert_changed(rows)
+        return {"received": len(records), **result}
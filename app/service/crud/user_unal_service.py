@@ -1,8 +1,14 @@
 from typing import List, Optional
-from app.repository.user_unal_repository import UserUnalRepository
+from app.repository.user_unal_repository import (
+    UserUnalAsyncRepository,
+    UserUnalRepository,
+)
 from app.domain.models.user_unal import UserUnal
 from app.domain.dtos.user_unal.user_unal_input import UserUnalInput
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.domain.dtos.user_unal.user_unal_record import UserUnalRecord
+from app.repository.bulk_writer import insert_summary
 
 
 class UserUnalService:
@@ -18,6 +24,22 @@ class UserUnalService:
     def get_by_email(email_unal: str, session: Session) -> Optional[UserUnal]:
         return UserUnalRepository(session).get_by_email(email_unal)
 
+    @staticmethod
+    async def get_all_async(
+        session: AsyncSession,
+        start: int = 0,
+        limit: int = 20,
+    ) -> List[UserUnal]:
+        return await UserUnalAsyncRepository(session).get_all(start, limit)
+
+    @staticmethod
+    async def get_by_email_async(
+        email_unal: str, session: AsyncSession
+    ) -> Optional[UserUnal]:
+        return await UserUnalAsyncRepository(session).get_by_email(
+            email_unal
+        )
+
     @staticmethod
     def create(input_data: UserUnalInput, session: Session) -> UserUnal:
         user = UserUnal(**input_data.model_dump(exclude_unset=True))
@@ -44,14 +66,16 @@ class UserUnalService:
         return UserUnalRepository(session).delete(email_unal)
 
     @staticmethod
-    def bulk_insert_ignore(users: List[UserUnalInput], session: Session):
+    def bulk_insert_ignore(
+        records: List[UserUnalRecord],
+        session: Session
+    ):
         """
-        Inserta en bulk usuarios.
-        Si hay duplicados en email_unal, MySQL los ignora.
+        Inserta en bulk registros de carga masiva; cada registro pasa
+        directo a los parámetros del INSERT.
+        Si hay duplicados de PK, MySQL los ignora.
         """
-        user_models = [
-            UserUnal(**u.model_dump(exclude_unset=True))
-            for u in users
-        ]
-        UserUnalRepository(session).bulk_insert_ignore(user_models)
-        return {"inserted": len(users), "duplicates_ignored": True}
+        rows = (record._asdict() for record in records)
+        repo = UserUnalRepository(session)
+        inserted = repo.bulk_insert_ignore(rows)
+        return insert_summary(len(records), inserted)
@@ -1,9 +1,11 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional, Set, Tuple
 
 from app.domain.dtos.unit_unal.unit_unal_input import UnitUnalInput
 from app.domain.dtos.user_unal.user_unal_input import UserUnalInput
 from app.repository.user_unit_associate_repository import (
+    UserUnitAssociateAsyncRepository,
     UserUnitAssociateRepository,
 )
 from app.domain.models.user_unit_associate import UserUnitAssociate
@@ -12,6 +14,10 @@ from app.domain.dtos.user_unit_associate.user_unit_associate_input import (
 )
 from app.service.crud.unit_unal_service import UnitUnalService
 from app.service.crud.user_unal_service import UserUnalService
+from app.domain.dtos.user_unit_associate.user_unit_associate_record import (
+    UserUnitAssociateRecord,
+)
+from app.repository.bulk_writer import insert_summary
 
 
 class UserUnitAssociateService:
@@ -42,6 +48,33 @@ class UserUnitAssociateService:
             cod_unit, cod_period
         )
 
+    @staticmethod
+    async def get_by_user_async(
+        email_unal: str,
+        session: AsyncSession,
+        cod_period: str = None
+    ) -> List[UserUnitAssociate]:
+        repo = UserUnitAssociateAsyncRepository(session)
+        return await repo.get_by_user(email_unal, cod_period)
+
+    @staticmethod
+    async def get_by_unit_async(
+        cod_unit: str,
+        cod_period: str,
+        session: AsyncSession
+    ) -> List[UserUnitAssociate]:
+        repo = UserUnitAssociateAsyncRepository(session)
+        return await repo.get_by_unit(cod_unit, cod_period)
+
+    @staticmethod
+    def get_keys_by_period(
+        cod_period: str,
+        session: Session
+    ) -> Set[Tuple[str, str]]:
+        """Llaves (email_unal, cod_unit) de las asociaciones del periodo."""
+        repo = UserUnitAssociateRepository(session)
+        return set(repo.iter_keys_by_period(cod_period))
+
     @staticmethod
     def get_by_id(
         email_unal: str,
@@ -101,16 +134,15 @@ class UserUnitAssociateService:
 
     @staticmethod
     def bulk_insert_ignore(
-        users: List[UserUnitAssociateInput],
+        records: List[UserUnitAssociateRecord],
         session: Session
     ):
         """
-        Inserta en bulk usuarios.
-        Si hay duplicados en email_unal, MySQL los ignora.
+        Inserta en bulk registros de carga masiva; cada registro pasa
+        directo a los parámetros del INSERT.
+        Si hay duplicados de PK, MySQL los ignora.
         """
-        user_models = [
-            UserUnitAssociate(**u.model_dump(exclude_unset=True))
-            for u in users
-        ]
-        UserUnitAssociateRepository(session).bulk_insert_ignore(user_models)
-        return {"inserted": len(users), "duplicates_ignored": True}
+        rows = (record._asdict() for record in records)
+        repo = UserUnitAssociateRepository(session)
+        inserted = repo.bulk_insert_ignore(rows)
+        return insert_summary(len(records), inserted)
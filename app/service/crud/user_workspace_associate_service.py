@@ -9,6 +9,7 @@ from app.repository.user_workspace_associate_repository import (
 )
 
 from app.domain.models.user_workspace_associate import UserWorkspaceAssociate
+from app.repository.bulk_writer import insert_summary
 
 
 class UserWorkspaceAssociateService:
@@ -47,11 +48,10 @@ class UserWorkspaceAssociateService:
         Inserta en bulk usuarios.
         Si hay duplicados en email_unal, MySQL los ignora.
         """
-        user_models = [
+        user_models = (
             UserWorkspaceAssociate(**u.model_dump(exclude_unset=True))
             for u in users
-        ]
-        UserWorkspaceAssociateRepository(session).bulk_insert_ignore(
-            user_models
         )
-        return {"inserted": len(users), "duplicates_ignored": True}
+        repo = UserWorkspaceAssociateRepository(session)
+        inserted = repo.bulk_insert_ignore(user_models)
+        return insert_summary(len(users), inserted)
@@ -6,6 +6,7 @@ from app.domain.dtos.user_workspace.user_workspace_input import (
     UserWorkspaceInput,
 )
 from app.utils.uuid_generator import generate_uuid
+from app.repository.bulk_writer import insert_summary
 
 
 class UserWorkspaceService:
@@ -52,12 +53,13 @@ class UserWorkspaceService:
         Inserta en bulk usuarios.
         Si hay duplicados en email_unal, MySQL los ignora.
         """
-        user_models = [
+        user_models = (
             UserWorkspace(
                 user_workspace_id=generate_uuid(),
                 **u.model_dump(exclude_unset=True)
             )
             for u in users
-        ]
-        UserWorkspaceRepository(session).bulk_insert_ignore(user_models)
-        return {"inserted": len(users), "duplicates_ignored": True}
+        )
+        repo = UserWorkspaceRepository(session)
+        inserted = repo.bulk_insert_ignore(user_models)
+        return insert_summary(len(users), inserted)
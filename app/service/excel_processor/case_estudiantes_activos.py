@@ -1,18 +1,27 @@
-from typing import Dict, Any, List, Tuple, Set
+import logging
+import multiprocessing
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain, islice
+from typing import (
+    Dict, Any, Iterator, List, NamedTuple, Optional, Tuple, Set, Union
+)
 from fastapi import HTTPException
 from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.cell.cell import Cell
 from sqlmodel import Session
 
-from app.domain.dtos.school_headquarters_associate.school_headquarters_associate_input import (  # noqa: E501 ignora error flake8
-    SchoolHeadquartersAssociateInput,
+from app.domain.dtos.school_headquarters_associate.school_headquarters_associate_record import (  # noqa: E501 ignora error flake8
+    SchoolHeadquartersAssociateRecord,
 )
-from app.domain.dtos.unit_school_associate.unit_school_associate_input import (
-    UnitSchoolAssociateInput,
+from app.domain.dtos.unit_school_associate.unit_school_associate_record import (  # noqa: E501 ignora error flake8
+    UnitSchoolAssociateRecord,
 )
 
-from app.domain.dtos.user_unit_associate.user_unit_associate_input import (
-    UserUnitAssociateInput,
+from app.domain.dtos.user_unit_associate.user_unit_associate_record import (
+    UserUnitAssociateRecord,
 )
 
 from app.service.crud.school_headquarters_associate_service import (
@@ -28,14 +37,19 @@ from app.service.crud.user_unit_associate_service import (
 )
 
 from app.utils.excel_processing import (
-    get_value_from_row,
+    Row,
+    get_file_text,
     is_blank,
+    normalize_email,
     )
+from app.utils.key_encoding import KeyEncoder, pack_key
 
-from app.domain.dtos.user_unal.user_unal_input import UserUnalInput
-from app.domain.dtos.unit_unal.unit_unal_input import UnitUnalInput
-from app.domain.dtos.school.school_input import SchoolInput
-from app.domain.dtos.headquarters.headquarters_input import HeadquartersInput
+from app.domain.dtos.user_unal.user_unal_record import UserUnalRecord
+from app.domain.dtos.unit_unal.unit_unal_record import UnitUnalRecord
+from app.domain.dtos.school.school_record import SchoolRecord
+from app.domain.dtos.headquarters.headquarters_record import (
+    HeadquartersRecord,
+)
 
 from app.domain.enums.files.general import General_Values
 from app.domain.enums.files.estudiante_activos import (
@@ -48,352 +62,647 @@ from app.service.crud.unit_unal_service import UnitUnalService
 from app.service.crud.school_service import SchoolService
 from app.service.crud.headquarters_service import HeadquartersService
 
+from app.configuration.config import PARSE_CHUNK_ROWS, PARSE_WORKERS
+from app.domain.dtos.upload_job.ingestion_options import IngestionOptions
+from app.domain.enums.upload_job.upload_job import IngestionStage
+from app.service.excel_processor.delta_ingestion import apply_user_unit_delta
+from app.service.excel_processor.insert_checkpoints import (
+    ChunkCallback,
+    ChunkWriter,
+    UploadCheckpoints,
+    write_in_chunks,
+)
+from app.service.excel_processor.insert_scheduler import (
+    InsertScheduler,
+    InsertTask,
+)
+from app.service.excel_processor.validation_sink import ValidationSink
+from app.utils.organization_schema_version import (
+    invalidate_organization_schema,
+)
+from app.service.excel_processor.ingestion_progress import (
+    IngestionProgress,
+    PROGRESS_EVERY_ROWS,
+)
 from app.utils.app_logger import AppLogger
 
 logger = AppLogger(__file__)
 logger2 = AppLogger(__file__, "user_unit_association.log")
 
+# Posiciones (0-indexadas) de cada columna del Enum dentro de la fila
+NOMBRES_APELLIDOS = EstudianteActivos.NOMBRES_APELLIDOS.value - 1
+EMAIL = EstudianteActivos.EMAIL.value - 1
+SEDE = EstudianteActivos.SEDE.value - 1
+FACULTAD = EstudianteActivos.FACULTAD.value - 1
+COD_PLAN = EstudianteActivos.COD_PLAN.value - 1
+PLAN = EstudianteActivos.PLAN.value - 1
+TIPO_NIVEL = EstudianteActivos.TIPO_NIVEL.value - 1
+
+COLUMN_NAMES: List[str] = [column.name for column in EstudianteActivos]
+COLUMN_COUNT: int = len(COLUMN_NAMES)
+
+SPECIAL_HEADQUARTERS: Set[str] = {
+    SedeEnum.SEDE_AMAZONIA._name,
+    SedeEnum.SEDE_CARIBE._name,
+    SedeEnum.SEDE_ORINOQUÍA._name,
+    SedeEnum.SEDE_TUMACO._name,
+    SedeEnum.SEDE_DE_LA_PAZ._name,
+}
+
+
+class OrgDerivation(NamedTuple):
+    """
+    Plan, facultad y sede derivados de una combinación
+    (sede, facultad, cod_plan, plan, tipo_nivel). Se construye una sola vez
+    por combinación y se comparte entre todas las filas que la repiten.
+    """
+    unit: UnitUnalRecord
+    school: SchoolRecord
+    is_special: bool
+    headquarters: HeadquartersRecord
+
+
+# Llave de la caché de derivación: (sede, facultad, cod_plan, plan, tipo)
+OrgKey = Tuple[str, str, str, str, str]
+
+
+class DerivedRow(NamedTuple):
+    """
+    Fila validada con su usuario y su derivación organizacional. No guarda
+    los valores crudos: solo lo que se insertará.
+    """
+    row_idx: int
+    user: UserUnalRecord
+    org: OrgDerivation
+
+
+@dataclass
+class EstudiantesActivosBatch:
+    """
+    Colecciones sin duplicados listas para insertar. Son registros livianos
+    (NamedTuple) que van directo a los parámetros del INSERT; la validación
+    con Pydantic queda para los endpoints de una sola entidad.
+    """
+    users: List[UserUnalRecord] = field(default_factory=list)
+    units: List[UnitUnalRecord] = field(default_factory=list)
+    schools: List[SchoolRecord] = field(default_factory=list)
+    headquarters: List[HeadquartersRecord] = field(default_factory=list)
+    userUnitAssocs: List[UserUnitAssociateRecord] = field(
+        default_factory=list
+    )
+    unitSchoolAssocs: List[UnitSchoolAssociateRecord] = field(
+        default_factory=list
+    )
+    schoolHeadquartersAssocs: List[SchoolHeadquartersAssociateRecord] = (
+        field(default_factory=list)
+    )
+
+    def entity_counts(self) -> Dict[str, int]:
+        return {
+            "users": len(self.users),
+            "units": len(self.units),
+            "schools": len(self.schools),
+            "headquarters": len(self.headquarters),
+            "user_unit_assocs": len(self.userUnitAssocs),
+            "unit_school_assocs": len(self.unitSchoolAssocs),
+            "school_head_assocs": len(self.schoolHeadquartersAssocs),
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "status": True,
+            "cant_users": len(self.users),
+            "cant_units": len(self.units),
+            "cant_schools": len(self.schools),
+            "cant_headquarters": len(self.headquarters),
+            "cant_user_unit_assocs": len(self.userUnitAssocs),
+            "cant_unit_school_assocs": len(self.unitSchoolAssocs),
+            "cant_school_head_assocs": len(self.schoolHeadquartersAssocs),
+        }
+
 
 # --------- validación principal y armado de colecciones ---------
 def case_estudiantes_activos(
     ws: Worksheet,
     cod_period: str,
-    session: Session
+    session: Session,
+    progress: Optional[IngestionProgress] = None,
+    options: Optional[IngestionOptions] = None
 ) -> Dict[str, Any]:
     """
     - Valida filas vacías y celdas vacías (según Enum).
     - Construye listas de DTOs (sin duplicados por código).
+    - En modo delta escribe solo las asociaciones usuario-plan que faltan
+      en el periodo y agrega la diferencia contra el periodo anterior.
     - Devuelve resumen: status, errores, conteos y previews.
     """
-    errors: List[Dict[str, Any]] = []
-    users: List[UserUnalInput] = []
-    units: List[UnitUnalInput] = []
-    schools: List[SchoolInput] = []
-    headquarters: List[HeadquartersInput] = []
-    userUnitAssocs: List[UserUnitAssociateInput] = []
-    unitSchoolAssocs: List[UnitSchoolAssociateInput] = []
-    schoolHeadquartersAssocs: List[SchoolHeadquartersAssociateInput] = []
-
-    seen_units: Set[str] = set()
-    seen_schools: Set[str] = set()
-    seen_heads: Set[str] = set()
-    seen_users: Set[str] = set()
-    seen_user_unit_assocs: Set[str] = set()
-    seen_unit_school_assocs: Set[str] = set()
-    seen_school_head_assocs: Set[str] = set()
-    unit_with_school_log: Set[str] = set()
-
-    sorted_rows = organize_rows_by_sede(ws, errors)
+    progress = progress or IngestionProgress()
+    options = options or IngestionOptions()
+    batch: EstudiantesActivosBatch = collect_estudiantes_activos(
+        ws, cod_period, progress, report_owner=options.report_owner
+    )
+    progress.record_entities(batch.entity_counts())
 
-    if errors:
-        raise HTTPException(status_code=400, detail={
-            "status": False,
-            "errors": errors[0:10]
-        })
+    delta: Optional[Dict[str, Any]] = None
+    if options.delta:
+        batch.userUnitAssocs, delta = apply_user_unit_delta(
+            batch.userUnitAssocs, cod_period, options, session
+        )
+
+    logger.info("Validación completada sin errores.")
+    logger.info("Resumiendo resultados e iniciando inserciones...")
+    progress.set_stage(IngestionStage.INSERTING)
+
+    # Con el hash del archivo la escritura es retomable por bloques
+    checkpoints: Optional[UploadCheckpoints] = (
+        UploadCheckpoints(
+            options.content_hash, cod_period,
+            on_chunk=progress.record_chunk_result
+        )
+        if options.content_hash else None
+    )
+    if checkpoints:
+        checkpoints.prepare(session, restart=options.force)
+    scheduler = InsertScheduler(session)
+    try:
+        results = scheduler.run(
+            build_insert_tasks(
+                batch, options, checkpoints, progress.record_chunk_result
+            ),
+            progress.record_inserted_result
+        )
+    except Exception as e:
+        logger.error("Error durante el proceso de inserción: %s", e)
+        raise
+    finally:
+        # Lo confirmado (completo o parcial) cambia la jerarquía del periodo
+        invalidate_organization_schema(cod_period)
+
+    if checkpoints:
+        checkpoints.clear(session)
+
+    logger.info("Inserciones completadas exitosamente.")
+    for table, result in results.items():
+        logger.info("Resultados de inserción %s: %s", table, result)
+
+    progress.set_stage(IngestionStage.DONE)
+    summary = batch.summary()
+    summary["insert_timings"] = scheduler.timings
+    if delta is not None:
+        summary["delta"] = delta
+    if options.upsert_reference:
+        summary["reference_changes"] = {
+            table: results[table]
+            for table in ("units", "schools", "headquarters")
+        }
+    return summary
+
+
+def build_insert_tasks(
+    batch: EstudiantesActivosBatch,
+    options: IngestionOptions,
+    checkpoints: Optional[UploadCheckpoints] = None,
+    on_chunk: Optional[ChunkCallback] = None
+) -> List[InsertTask]:
+    """
+    Tareas de escritura del lote. Usuarios, planes, facultades y sedes no
+    dependen entre sí; cada asociación espera a las dos tablas que une.
+    En modo upsert los planes, facultades y sedes existentes se actualizan
+    si cambiaron; si no, se ignoran como antes.
+    Con `checkpoints` cada tabla se escribe por bloques retomables. En
+    modo delta las asociaciones usuario-plan no se marcan: la lista ya
+    excluye lo escrito, así que sus bloques cambian entre intentos.
+    Con `on_chunk` las tablas sin marcas también se escriben por bloques
+    para publicar el avance de cada uno.
+    """
+    upsert = options.upsert_reference
+
+    def task(
+        table: str,
+        write: ChunkWriter,
+        records: List[Any],
+        depends_on: Tuple[str, ...] = (),
+        resumable: bool = True
+    ) -> InsertTask:
+        if checkpoints and resumable:
+            return InsertTask(
+                table, checkpoints.wrap(table, write, records), depends_on
+            )
+        if on_chunk:
+            return InsertTask(
+                table,
+                partial(
+                    write_in_chunks, table, write, records,
+                    on_chunk=on_chunk
+                ),
+                depends_on
+            )
+        return InsertTask(table, partial(write, records), depends_on)
+
+    return [
+        task("users", UserUnalService.bulk_insert_ignore, batch.users),
+        task(
+            "units",
+            UnitUnalService.bulk_upsert_changed if upsert
+            else UnitUnalService.bulk_insert_ignore,
+            batch.units
+        ),
+        task(
+            "schools",
+            SchoolService.bulk_upsert_changed if upsert
+            else SchoolService.bulk_insert_ignore,
+            batch.schools
+        ),
+        task(
+            "headquarters",
+            HeadquartersService.bulk_upsert_changed if upsert
+            else HeadquartersService.bulk_insert_ignore,
+            batch.headquarters
+        ),
+        task(
+            "user_unit_assocs",
+            UserUnitAssociateService.bulk_insert_ignore,
+            batch.userUnitAssocs,
+            ("users", "units"),
+            resumable=not options.delta
+        ),
+        task(
+            "unit_school_assocs",
+            UnitSchoolAssociateService.bulk_insert_ignore,
+            batch.unitSchoolAssocs,
+            ("units", "schools")
+        ),
+        task(
+            "school_head_assocs",
+            SchoolHeadquartersAssociateService.bulk_insert_ignore,
+            batch.schoolHeadquartersAssocs,
+            ("schools", "headquarters")
+        ),
+    ]
+
+
+def collect_estudiantes_activos(
+    ws: Worksheet,
+    cod_period: str,
+    progress: Optional[IngestionProgress] = None,
+    workers: int = PARSE_WORKERS,
+    chunk_rows: int = PARSE_CHUNK_ROWS,
+    report_owner: Optional[str] = None
+) -> EstudiantesActivosBatch:
+    """
+    Recorre la hoja una sola vez (validación, normalización, derivación de
+    llaves y agrupación por sede) y luego arma las colecciones sin
+    duplicados siguiendo el orden de las sedes.
+    Con `workers` > 1 el recorrido se reparte en bloques de `chunk_rows`
+    filas entre procesos; el resultado es idéntico al serial.
+    El reporte de errores queda a nombre de `report_owner`.
+    No toca la base de datos.
+    """
+    progress = progress or IngestionProgress()
+    with ValidationSink(owner=report_owner) as errors:
+        if use_parallel_parse(ws, workers, chunk_rows):
+            sede_chunks = organize_chunks_by_sede(
+                ws, cod_period, errors, progress, workers, chunk_rows
+            )
+            raise_row_errors(errors)
+            logger.info("Mezclando bloques de estudiantes activos")
+            return merge_sede_chunks(sede_chunks, cod_period)
+
+        sorted_rows = organize_rows_by_sede(ws, errors, progress)
+        raise_row_errors(errors)
 
     logger.info("Iniciando procesamiento de archivo de estudiantes activos")
+    return build_batch(sorted_rows, cod_period)
 
-    for row_idx, row in sorted_rows:
-        isSpecialHeadquarters: bool = False
-        logger.debug(f"Procesando fila {row_idx}")
-        logger.debug(f"Contenido de la fila: {[cell.value for cell in row]}")
 
-        if row_idx == 1:
-            continue
+def raise_row_errors(errors: ValidationSink):
+    """
+    Cierra el reporte de validación y, si hubo errores, responde con los
+    conteos, una muestra y el id del reporte completo descargable.
+    """
+    errors.close()
+    if errors:
+        raise HTTPException(status_code=400, detail=errors.to_detail())
 
-        if is_row_blank(row):
-            errors.append({
-                "row": row_idx,
-                "column": None,
-                "message": "Fila completamente vacía"
-            })
-            continue
 
-        errors.extend(get_blank_cell_errors(row, row_idx))
+def build_batch(
+    sorted_rows: Iterator[DerivedRow],
+    cod_period: str
+) -> EstudiantesActivosBatch:
+    """
+    Arma las colecciones sin duplicados a partir de filas ya validadas y
+    ordenadas por sede. Los DTOs se construyen solo para llaves nuevas.
+    """
+    builder = BatchBuilder(cod_period)
+    for derived in sorted_rows:
+        builder.add_row(derived)
+    return builder.batch
 
-        row_tuple: Tuple[Cell, ...] = row
-        user: UserUnalInput = get_user_from_row(row_tuple)
-        if user.email_unal and user.email_unal not in seen_users:
-            users.append(user)
-            seen_users.add(user.email_unal)
-            logger.debug(f"Usuario agregado: {user}")
-        else:
-            logger.warning(f"Usuario duplicado encontrado: {user.email_unal}")
 
-        unit: UnitUnalInput = get_unit_from_row(row_tuple)
-        if unit.cod_unit and unit.cod_unit not in seen_units:
-            units.append(unit)
-            seen_units.add(unit.cod_unit)
-            logger.debug(f"Plan agregada: {unit}")
-        else:
-            logger.warning(f"Plan duplicada encontrada: {unit.cod_unit}")
-
-        school: SchoolInput
-        school, isSpecialHeadquarters = get_school_from_row(row_tuple)
-        if school.cod_school and school.cod_school not in seen_schools:
-            schools.append(school)
-            seen_schools.add(school.cod_school)
-            logger.debug(f"Facultad agregada: {school}")
-        else:
-            logger.warning(
-                f"Facultad duplicada encontrada: {school.cod_school}"
-            )
+class SedeChunk(NamedTuple):
+    """
+    Colecciones de una sede dentro de un bloque de filas procesado en otro
+    proceso, junto con las facultades de sedes especiales que la mezcla
+    necesita para aplicar las mismas reglas que el recorrido serial.
+    """
+    batch: EstudiantesActivosBatch
+    special_schools: Set[str]
 
-        head: HeadquartersInput = get_headquarters_from_row(row_tuple)
-        if head.cod_headquarters and head.cod_headquarters not in seen_heads:
-            headquarters.append(head)
-            seen_heads.add(head.cod_headquarters)
-            logger.debug(
-                f"Sede administrativa agregada: {head}"
+
+class BatchBuilder:
+    """
+    Acumula las colecciones sin duplicados. Se alimenta fila a fila
+    (`add_row`) o con colecciones ya deduplicadas de un bloque
+    (`merge`); en ambos casos conserva la primera aparición de cada llave.
+    """
+
+    def __init__(self, cod_period: str):
+        self.cod_period = sys.intern(cod_period)
+        self.batch = EstudiantesActivosBatch()
+        self.special_schools: Set[str] = set()
+
+        # Cada código se codifica como entero; el codificador también
+        # indica qué entidades ya se agregaron
+        self.seen_units = KeyEncoder()
+        self.seen_schools = KeyEncoder()
+        self.seen_heads = KeyEncoder()
+        self.seen_users = KeyEncoder()
+        # El periodo es fijo en el lote: las asociaciones se identifican
+        # con los dos códigos empaquetados en un entero de 64 bits
+        self.seen_user_unit_assocs: Set[int] = set()
+        self.seen_unit_school_assocs: Set[int] = set()
+        self.seen_school_head_assocs: Set[int] = set()
+        self.unit_with_school_log: Set[int] = set()
+
+    def add_row(self, derived: DerivedRow):
+        org = derived.org
+        cod_unit = org.unit.cod_unit
+        cod_school = org.school.cod_school
+
+        self.add_user(derived.user)
+
+        if org.is_special:
+            self.special_schools.add(cod_school)
+
+        self.add_unit(org.unit)
+        self.add_school(org.school)
+        self.add_headquarters(org.headquarters)
+        self.add_user_unit_assoc(derived.user.email_unal, cod_unit)
+        self.add_unit_school_assoc(cod_unit, cod_school, org.is_special)
+        self.add_school_head_assoc(
+            cod_school, org.headquarters.cod_headquarters
+        )
+
+    def merge(self, chunk: SedeChunk):
+        part = chunk.batch
+        self.special_schools.update(chunk.special_schools)
+
+        for user in part.users:
+            self.add_user(user)
+        for unit in part.units:
+            self.add_unit(unit)
+        for school in part.schools:
+            self.add_school(school)
+        for head in part.headquarters:
+            self.add_headquarters(head)
+        for assoc in part.userUnitAssocs:
+            self.add_user_unit_assoc(assoc.email_unal, assoc.cod_unit)
+        for assoc in part.unitSchoolAssocs:
+            self.add_unit_school_assoc(
+                assoc.cod_unit,
+                assoc.cod_school,
+                assoc.cod_school in chunk.special_schools
+            )
+        for assoc in part.schoolHeadquartersAssocs:
+            self.add_school_head_assoc(
+                assoc.cod_school, assoc.cod_headquarters
             )
+
+    def to_chunk(self) -> SedeChunk:
+        return SedeChunk(self.batch, self.special_schools)
+
+    def add_user(self, user: UserUnalRecord):
+        email_unal = user.email_unal
+        if email_unal not in self.seen_users:
+            self.batch.users.append(user)
+            self.seen_users.encode(email_unal)
+            logger.debug("Usuario agregado: %s", email_unal)
         else:
-            logger.warning(
-                f"Sede administrativa duplicada encontrada: "
-                f"{head.cod_headquarters}"
+            logger.sampled(
+                logging.WARNING, "Usuario duplicado encontrado: %s",
+                email_unal
             )
 
-        userUnitAssoc: UserUnitAssociateInput = UserUnitAssociateInput(
-            email_unal=user.email_unal,
-            cod_unit=unit.cod_unit,
-            cod_period=cod_period
+    def add_unit(self, unit: UnitUnalRecord):
+        if unit.cod_unit not in self.seen_units:
+            self.batch.units.append(unit)
+            self.seen_units.encode(unit.cod_unit)
+            logger.debug("Plan agregada: %s", unit)
+
+    def add_school(self, school: SchoolRecord):
+        if school.cod_school not in self.seen_schools:
+            self.batch.schools.append(school)
+            self.seen_schools.encode(school.cod_school)
+            logger.debug("Facultad agregada: %s", school)
+
+    def add_headquarters(self, head: HeadquartersRecord):
+        if head.cod_headquarters not in self.seen_heads:
+            self.batch.headquarters.append(head)
+            self.seen_heads.encode(head.cod_headquarters)
+            logger.debug("Sede administrativa agregada: %s", head)
+
+    def add_user_unit_assoc(self, email_unal: str, cod_unit: str):
+        cod_period = self.cod_period
+        user_unit_key = pack_key(
+            self.seen_users.encode(email_unal),
+            self.seen_units.encode(cod_unit)
         )
-        if (
-            f"{user.email_unal}{unit.cod_unit}{cod_period}"
-            not in seen_user_unit_assocs
-        ):
-            seen_user_unit_assocs.add(
-                f"{user.email_unal}{unit.cod_unit}{cod_period}"
+        if user_unit_key not in self.seen_user_unit_assocs:
+            self.seen_user_unit_assocs.add(user_unit_key)
+            self.batch.userUnitAssocs.append(
+                UserUnitAssociateRecord(email_unal, cod_unit, cod_period)
             )
-            userUnitAssocs.append(userUnitAssoc)
-            logger.debug(
-                f"Asociación de usuario a plan agregada: "
-                f"{userUnitAssoc}"
+            logger2.debug(
+                "Asociación de usuario a plan: %s, %s, %s",
+                email_unal, cod_unit, cod_period
             )
         else:
-            logger.warning(
-                f"Asociación de usuario a plan duplicada encontrada: "
-                f"{user.email_unal}, {unit.cod_unit}, {cod_period}"
+            logger.sampled(
+                logging.WARNING,
+                "Asociación de usuario a plan duplicada encontrada: "
+                "%s, %s, %s",
+                email_unal, cod_unit, cod_period
             )
 
-        logger2.debug(f"Asociación de usuario a plan: {userUnitAssoc}")
-
-        unitSchoolAssoc = UnitSchoolAssociateInput(
-            cod_unit=unit.cod_unit,
-            cod_school=school.cod_school,
-            cod_period=cod_period
-        )
-        logger.debug(
-            f"Es una sede de presencia nacional: {isSpecialHeadquarters}"
+    def add_unit_school_assoc(
+        self,
+        cod_unit: str,
+        cod_school: str,
+        is_special: bool
+    ):
+        unit_code = self.seen_units.encode(cod_unit)
+        unit_school_key = pack_key(
+            unit_code, self.seen_schools.encode(cod_school)
         )
-        logger.debug(f"Plan: {unit.cod_unit}, Facultad: {school.cod_school}")
-        logger.debug(f"unit with school: {unit_with_school_log}")
-        if isSpecialHeadquarters and unit.cod_unit in unit_with_school_log:
-            logger.debug(
-                f"La plan {unit.cod_unit} pertenece a una facultad especial "
-                f"de sede {school.cod_school}"
+        if is_special and unit_code in self.unit_with_school_log:
+            logger.sampled(
+                logging.DEBUG,
+                "La plan %s pertenece a una facultad especial de sede %s",
+                cod_unit, cod_school
             )
-        elif (
-            f"{unit.cod_unit}{school.cod_school}{cod_period}"
-            not in seen_unit_school_assocs
-        ):
-            seen_unit_school_assocs.add(
-                f"{unit.cod_unit}{school.cod_school}{cod_period}"
+        elif unit_school_key not in self.seen_unit_school_assocs:
+            self.seen_unit_school_assocs.add(unit_school_key)
+            unitSchoolAssoc = UnitSchoolAssociateRecord(
+                cod_unit, cod_school, self.cod_period
             )
-            unitSchoolAssocs.append(unitSchoolAssoc)
-            unit_with_school_log.add(unit.cod_unit)
-
+            self.batch.unitSchoolAssocs.append(unitSchoolAssoc)
+            self.unit_with_school_log.add(unit_code)
             logger.debug(
-                f"Asociación de plan a facultad agregada: "
-                f"{unitSchoolAssoc}"
-            )
-        else:
-            logger.warning(
-                "Asociación de plan a facultad duplicada encontrada: "
-                f"{unitSchoolAssoc.cod_period} "
-                f"{unitSchoolAssoc.cod_unit} "
-                f"{unitSchoolAssoc.cod_school}"
+                "Asociación de plan a facultad agregada: %s", unitSchoolAssoc
             )
 
-        schoolHeadAssoc = SchoolHeadquartersAssociateInput(
-            cod_school=school.cod_school,
-            cod_headquarters=head.cod_headquarters,
-            cod_period=cod_period
+    def add_school_head_assoc(self, cod_school: str, cod_headquarters: str):
+        school_head_key = pack_key(
+            self.seen_schools.encode(cod_school),
+            self.seen_heads.encode(cod_headquarters)
         )
-        if (
-            f"{school.cod_school}{head.cod_headquarters}{cod_period}"
-            not in seen_school_head_assocs
-        ):
-            seen_school_head_assocs.add(
-                f"{school.cod_school}{head.cod_headquarters}{cod_period}"
+        if school_head_key not in self.seen_school_head_assocs:
+            self.seen_school_head_assocs.add(school_head_key)
+            schoolHeadAssoc = SchoolHeadquartersAssociateRecord(
+                cod_school, cod_headquarters, self.cod_period
             )
-            schoolHeadquartersAssocs.append(schoolHeadAssoc)
+            self.batch.schoolHeadquartersAssocs.append(schoolHeadAssoc)
             logger.debug(
-                f"Asociación de facultad a sede agregada: "
-                f"{schoolHeadAssoc}"
-            )
-        else:
-            logger.warning(
-                f"Asociación de facultad a sede duplicada encontrada: "
-                f"{schoolHeadAssoc.cod_school}, "
-                f"{schoolHeadAssoc.cod_headquarters}, "
-                f"{schoolHeadAssoc.cod_period}"
+                "Asociación de facultad a sede agregada: %s", schoolHeadAssoc
             )
 
-    if errors:
-        raise HTTPException(status_code=400, detail={
-            "status": False,
-            "errors": errors[0:10]
-        })
 
-    try:
-        logger.info("Validación completada sin errores.")
-        logger.info("Resumiendo resultados e iniciando inserciones...")
-
-        resUsers = UserUnalService.bulk_insert_ignore(users, session)
-        resUnits = UnitUnalService.bulk_insert_ignore(units, session)
-        resSchools = SchoolService.bulk_insert_ignore(schools, session)
-        resHeadquarters = HeadquartersService.bulk_insert_ignore(
-            headquarters,
-            session
-        )
-        resUserUnitAssocs = UserUnitAssociateService.bulk_insert_ignore(
-            userUnitAssocs,
-            session
-        )
-        resUnitSchoolAssocs = UnitSchoolAssociateService.bulk_insert_ignore(
-            unitSchoolAssocs,
-            session
-        )
-        resSchoolHeadquartersAssocs = SchoolHeadquartersAssociateService.bulk_insert_ignore(  # noqa: E501 ignora error flake8
-            schoolHeadquartersAssocs,
-            session
-        )
-    except Exception as e:
-        logger.error(f"Error durante el proceso de inserción: {str(e)}")
-        logger.error(f"Detalles del error: {e}")
+# Columnas que se repiten entre miles de filas (sede, facultad, plan...)
+REPEATED_COLUMNS: Set[int] = {SEDE, FACULTAD, COD_PLAN, PLAN, TIPO_NIVEL}
 
-    logger.info("Inserciones completadas exitosamente.")
 
-    logger.info(f"Resultados de inserción users: {resUsers}")
-    logger.info(f"Resultados de inserción units: {resUnits}")
-    logger.info(f"Resultados de inserción schools: {resSchools}")
-    logger.info(f"Resultados de inserción headquarters: {resHeadquarters}")
-    logger.info(
-        f"Resultados de inserción user_unit_assocs: {resUserUnitAssocs}"
-    )
-    logger.info(
-        f"Resultados de inserción unit_school_assocs: {resUnitSchoolAssocs}"
-    )
-    logger.info(
-        f"Resultados de inserción school_headquarters_assocs: "
-        f"{resSchoolHeadquartersAssocs}"
+def normalize_row(row: Row) -> Tuple[str, ...]:
+    """
+    Convierte cada columna del Enum a texto limpio una sola vez. Las
+    columnas repetidas se internan para que todas las filas compartan la
+    misma cadena.
+    """
+    return tuple(
+        sys.intern(get_file_text(v)) if idx in REPEATED_COLUMNS
+        else get_file_text(v)
+        for idx, v in enumerate(row[:COLUMN_COUNT])
     )
 
-    for userUserAssoc in userUnitAssocs:
-        logger.info(f"Asociación de usuario a plan: {userUserAssoc}")
-
-    return {
-        "status": True,
-        "cant_users": len(users),
-        "cant_units": len(units),
-        "cant_schools": len(schools),
-        "cant_headquarters": len(headquarters),
-        "cant_user_unit_assocs": len(userUnitAssocs),
-        "cant_unit_school_assocs": len(unitSchoolAssocs),
-        "cant_school_head_assocs": len(schoolHeadquartersAssocs),
-    }
 
+def get_tipo_estudiante(tipo_nivel: str) -> str:
+    if tipo_nivel == General_Values.PREGRADO.value:
+        return "pre"
+    if tipo_nivel == General_Values.POSGRADO.value:
+        return "pos"
+    return tipo_nivel
 
-def get_user_from_row(row: Tuple[Cell, ...]) -> UserUnalInput:
-    return UserUnalInput(
-        email_unal=(
-            get_value_from_row(row, EstudianteActivos.EMAIL.value) or None
-        ),
-        document=None,
-        name=None,
-        lastname=None,
-        full_name=(
-            get_value_from_row(
-                row, EstudianteActivos.NOMBRES_APELLIDOS.value
-            ) or None
-        ),
-        gender=None,
-        birth_date=None,
-        headquarters=get_value_from_row(
-            row, EstudianteActivos.SEDE.value
-        )
-    )
+
+def get_prefix_sede(sede: str) -> str:
+    if sede == SedeEnum.SEDE_DE_LA_PAZ._name:
+        return sede.split(" ")[3][:3].lower()
+    return sede.split(" ")[1][:3].lower()
 
 
-def get_unit_from_row(row: Tuple[Cell, ...]) -> UnitUnalInput:
-    sede: str = get_value_from_row(row, EstudianteActivos.SEDE.value)
-    tipoEstudiante: str = get_value_from_row(
-        row, EstudianteActivos.TIPO_NIVEL.value
-    )
+def get_unit_code(sede: str, tipo_nivel: str, cod_plan: str) -> str:
+    tipoEstudiante = get_tipo_estudiante(tipo_nivel)
+    return f"{cod_plan}_{tipoEstudiante}_{get_prefix_sede(sede)}"
 
-    if tipoEstudiante == General_Values.PREGRADO.value:
-        tipoEstudiante = "pre"
-    elif tipoEstudiante == General_Values.POSGRADO.value:
-        tipoEstudiante = "pos"
 
+def get_school_code(
+    sede: str,
+    tipo_nivel: str,
+    facultad: str
+) -> Tuple[str, bool]:
+    tipoEstudiante = get_tipo_estudiante(tipo_nivel)
+    # Las facultades usan siempre la segunda palabra de la sede
     prefix_sede: str = sede.split(" ")[1][:3].lower()
-    if sede == SedeEnum.SEDE_DE_LA_PAZ._name:
-        prefix_sede = sede.split(" ")[3][:3].lower()
 
-    cod_unit: str = get_value_from_row(row, EstudianteActivos.COD_PLAN.value)
-    plan: str = get_value_from_row(row, EstudianteActivos.PLAN.value)
-    tipo_nivel: str = get_value_from_row(
-        row, EstudianteActivos.TIPO_NIVEL.value
-    )
-    cod_unit = f"{cod_unit}_{tipoEstudiante}_{prefix_sede}"
-    email: str = f"{cod_unit}@unal.edu.co"
-    return UnitUnalInput(
-        cod_unit=cod_unit,
-        email=email,
-        name=plan or None,
-        description=None,
-        type_unit=tipo_nivel or None,
+    if sede in SPECIAL_HEADQUARTERS:
+        return f"estf{tipoEstudiante}{prefix_sede}", True
+
+    acronimo = "".join(
+        p[0].lower() for p in facultad.split() if len(p) > 2
     )
+    return f"est{acronimo}{tipoEstudiante}_{prefix_sede}", False
+
+
+def get_headquarters_code(sede: str, tipo_nivel: str) -> str:
+    tipoEstudiante = get_tipo_estudiante(tipo_nivel)
+    return f"estudiante{tipoEstudiante}_{get_prefix_sede(sede)}"
 
 
-def get_school_from_row(row: Tuple[Cell, ...]) -> Tuple[SchoolInput, bool]:
-    isSpecialHeadquarters: bool = False
-    facultad: str = get_value_from_row(row, EstudianteActivos.FACULTAD.value)
-    sede: str = get_value_from_row(row, EstudianteActivos.SEDE.value)
-    tipoEstudiante: str = get_value_from_row(
-        row, EstudianteActivos.TIPO_NIVEL.value
+def derive_row(
+    row_idx: int,
+    values: Tuple[str, ...],
+    email_unal: str,
+    derivation_cache: Dict[OrgKey, OrgDerivation]
+) -> DerivedRow:
+    """
+    Asocia a la fila su usuario y su derivación organizacional. Las
+    combinaciones distintas de un archivo son unos pocos cientos, así que
+    el trabajo de cadenas y la construcción de registros se hace una vez
+    por combinación.
+    """
+    key: OrgKey = (
+        values[SEDE],
+        values[FACULTAD],
+        values[COD_PLAN],
+        values[PLAN],
+        values[TIPO_NIVEL],
+    )
+    org = derivation_cache.get(key)
+    if org is None:
+        org = derive_org(values)
+        derivation_cache[key] = org
+    return DerivedRow(row_idx, get_user_from_row(values, email_unal), org)
+
+
+def derive_org(values: Tuple[str, ...]) -> OrgDerivation:
+    school, is_special = get_school_from_row(values)
+    return OrgDerivation(
+        unit=get_unit_from_row(values),
+        school=school,
+        is_special=is_special,
+        headquarters=get_headquarters_from_row(values),
     )
-    prefix_sede: str = sede.split(" ")[1][:3].lower()
 
-    logger.debug(f"Facultad: {facultad}, Sede: {sede}, Tipo: {tipoEstudiante}")
 
-    if tipoEstudiante == General_Values.PREGRADO.value:
-        logger.debug("Tipo de estudiante es pregrado")
-        tipoEstudiante = "pre"
-    elif tipoEstudiante == General_Values.POSGRADO.value:
-        logger.debug("Tipo de estudiante es posgrado")
-        tipoEstudiante = "pos"
+def get_user_from_row(
+    row: Tuple[str, ...],
+    email_unal: str
+) -> UserUnalRecord:
+    return UserUnalRecord(
+        email_unal=email_unal,
+        full_name=row[NOMBRES_APELLIDOS] or None,
+        headquarters=row[SEDE]
+    )
 
-    cod_school: str = ""
 
-    if (
-        sede == SedeEnum.SEDE_AMAZONIA._name or
-        sede == SedeEnum.SEDE_CARIBE._name or
-        sede == SedeEnum.SEDE_ORINOQUÍA._name or
-        sede == SedeEnum.SEDE_TUMACO._name or
-        sede == SedeEnum.SEDE_DE_LA_PAZ._name
-    ):
-        isSpecialHeadquarters = True
-        cod_school = f"estf{tipoEstudiante}{prefix_sede}"
-    else:
-        acronimo = "".join(
-            p[0].lower() for p in facultad.split() if len(p) > 2
-        )
-        cod_school = f"est{acronimo}{tipoEstudiante}_{prefix_sede}"
+def get_unit_from_row(row: Tuple[str, ...]) -> UnitUnalRecord:
+    cod_unit: str = get_unit_code(row[SEDE], row[TIPO_NIVEL], row[COD_PLAN])
+    email: str = f"{cod_unit}@unal.edu.co"
+    return UnitUnalRecord(
+        cod_unit=cod_unit,
+        email=email,
+        name=row[PLAN] or None,
+        description=None,
+        type_unit=row[TIPO_NIVEL] or None,
+    )
+
 
+def get_school_from_row(row: Tuple[str, ...]) -> Tuple[SchoolRecord, bool]:
+    facultad: str = row[FACULTAD]
+    cod_school, isSpecialHeadquarters = get_school_code(
+        row[SEDE], row[TIPO_NIVEL], facultad
+    )
     email: str = f"{cod_school}@unal.edu.co"
 
-    return SchoolInput(
+    return SchoolRecord(
         cod_school=cod_school,
         email=email,
         name=facultad or None,
@@ -402,27 +711,14 @@ def get_school_from_row(row: Tuple[Cell, ...]) -> Tuple[SchoolInput, bool]:
     ), isSpecialHeadquarters
 
 
-def get_headquarters_from_row(row: Tuple[Cell, ...]) -> HeadquartersInput:
-    sede: str = get_value_from_row(row, EstudianteActivos.SEDE.value)
-    tipoEstudiante: str = get_value_from_row(
-        row, EstudianteActivos.TIPO_NIVEL.value
-    )
-
-    if tipoEstudiante == General_Values.PREGRADO.value:
-        tipoEstudiante = "pre"
-    elif tipoEstudiante == General_Values.POSGRADO.value:
-        tipoEstudiante = "pos"
-
-    prefix_sede: str = sede.split(" ")[1][:3].lower()
-    if sede == SedeEnum.SEDE_DE_LA_PAZ._name:
-        prefix_sede = sede.split(" ")[3][:3].lower()
-
-    cod_sede: str = f"estudiante{tipoEstudiante}_{prefix_sede}"
-    type_facultad: str = f"estudiante_{prefix_sede}"
+def get_headquarters_from_row(row: Tuple[str, ...]) -> HeadquartersRecord:
+    sede: str = row[SEDE]
+    cod_sede: str = get_headquarters_code(sede, row[TIPO_NIVEL])
+    type_facultad: str = f"estudiante_{get_prefix_sede(sede)}"
 
     email: str = f"{cod_sede}@unal.edu.co"
 
-    return HeadquartersInput(
+    return HeadquartersRecord(
         cod_headquarters=cod_sede,
         email=email,
         name=sede,
@@ -431,131 +727,298 @@ def get_headquarters_from_row(row: Tuple[Cell, ...]) -> HeadquartersInput:
     )
 
 
-def is_row_blank(row: Tuple[Cell, ...]) -> bool:
-    """Retorna True si todas las columnas del Enum están vacías."""
-    cells = [
-        row[EstudianteActivos.NOMBRES_APELLIDOS.value - 1].value,
-        row[EstudianteActivos.EMAIL.value - 1].value,
-        row[EstudianteActivos.SEDE.value - 1].value,
-        row[EstudianteActivos.FACULTAD.value - 1].value,
-        row[EstudianteActivos.COD_PLAN.value - 1].value,
-        row[EstudianteActivos.PLAN.value - 1].value,
-        row[EstudianteActivos.TIPO_NIVEL.value - 1].value,
-    ]
-    return all(is_blank(v) for v in cells)
-
-
-def get_blank_cell_errors(
-    row: Tuple[Cell, ...], row_idx: int
-) -> List[Dict[str, Any]]:
-    """Retorna lista de errores por celdas vacías en la fila."""
-    col_names = [
-        "NOMBRES_APELLIDOS",
-        "EMAIL",
-        "SEDE",
-        "FACULTAD",
-        "COD_PLAN",
-        "PLAN",
-        "TIPO_NIVEL",
+def get_row_errors(row: Row, row_idx: int) -> List[Dict[str, Any]]:
+    """
+    Valida la fila en un solo recorrido: si todas las columnas del Enum
+    están vacías retorna un único error de fila vacía, si no, un error
+    por cada celda vacía.
+    """
+    blank_columns: List[str] = [
+        name for name, v in zip(COLUMN_NAMES, row) if is_blank(v)
     ]
-    cells = [
-        row[EstudianteActivos.NOMBRES_APELLIDOS.value - 1].value,
-        row[EstudianteActivos.EMAIL.value - 1].value,
-        row[EstudianteActivos.SEDE.value - 1].value,
-        row[EstudianteActivos.FACULTAD.value - 1].value,
-        row[EstudianteActivos.COD_PLAN.value - 1].value,
-        row[EstudianteActivos.PLAN.value - 1].value,
-        row[EstudianteActivos.TIPO_NIVEL.value - 1].value,
+    # Las filas cortas no traen las últimas columnas
+    blank_columns.extend(COLUMN_NAMES[len(row):])
+
+    if len(blank_columns) == COLUMN_COUNT:
+        return [{
+            "row": row_idx,
+            "column": None,
+            "message": "Fila completamente vacía"
+        }]
+
+    return [
+        {"row": row_idx, "column": name, "message": "Celda vacía"}
+        for name in blank_columns
     ]
 
-    errors: List[Dict[str, Any]] = []
-    for i, v in enumerate(cells):
-        if is_blank(v):
-            errors.append({
-                "row": row_idx,
-                "column": col_names[i],
-                "message": "Celda vacía"
-            })
-    return errors
+
+def classify_row(
+    row: Row,
+    row_idx: int,
+    errors: Union[List[Dict[str, Any]], ValidationSink],
+    derivation_cache: Dict[OrgKey, OrgDerivation]
+) -> Optional[Tuple[int, DerivedRow]]:
+    """
+    Valida, normaliza y deriva una fila. Retorna el número de su sede y la
+    fila derivada, o None si la fila tiene errores (que se agregan a
+    `errors`) o si ya hay errores previos.
+    """
+    # Validar fila vacía y celdas vacías en un solo recorrido
+    row_errors = get_row_errors(row, row_idx)
+    if row_errors and row_errors[0]["column"] is None:
+        errors.extend(row_errors)
+        return None
+
+    values = normalize_row(row)
+
+    # Obtener el valor de la sede de la fila
+    sede_value = values[SEDE].upper()
+    info_sede = SedeEnum.get_by_name(sede_value)
+
+    # Comprobar si la sede es válida y mapearla al SedeOrder
+    if not info_sede:
+        errors.extend(row_errors)
+        errors.append({
+            "row": row_idx,
+            "column": EstudianteActivos.SEDE.name,
+            "message": f"Sede no válida: {sede_value}"
+        })
+        return None
+
+    if row_errors:
+        errors.extend(row_errors)
+        return None
+
+    # Reemplaza la validación de EmailStr que hacía el DTO de usuario
+    email_unal = normalize_email(values[EMAIL])
+    if email_unal is None:
+        errors.append({
+            "row": row_idx,
+            "column": EstudianteActivos.EMAIL.name,
+            "message": f"Correo no válido: {values[EMAIL]}"
+        })
+        return None
+
+    # Con errores previos no vale la pena derivar: no se insertará nada
+    if errors:
+        return None
+
+    return info_sede.number, derive_row(
+        row_idx, values, email_unal, derivation_cache
+    )
 
 
 def organize_rows_by_sede(
     ws: Worksheet,
-    errors: List[Dict[str, Any]]
-) -> List[Tuple[int, Tuple[Cell, ...]]]:
+    errors: ValidationSink,
+    progress: IngestionProgress
+) -> Iterator[DerivedRow]:
     """
-    Organiza las filas del archivo Excel según la sede,
-    validando que la sede sea válida.
+    Recorre la hoja una sola vez: valida cada fila, la normaliza, deriva
+    las llaves de sus DTOs y la agrupa según la sede. El orden final por
+    sede se obtiene encadenando los grupos, sin volver a recorrer filas.
 
     {
     1: [
-        (2, ('SEDE BOGOTÁ', 'ejemplo@bogota.com', 'Juan Pérez')),
-        (4, ('SEDE BOGOTÁ', 'ejemplo2@bogota.com', 'Luis García'))
+        DerivedRow(2, ('Juan Pérez', 'ejemplo@bogota.com', 'SEDE BOGOTÁ',
+                       ...), ...),
+        DerivedRow(4, ('Luis García', 'ejemplo2@bogota.com', ...), ...)
     ],
     2: [
-        (3, ('SEDE MANIZALES', 'ejemplo@manizales.com', 'Ana Gómez'))
+        DerivedRow(3, ('Ana Gómez', 'ejemplo@manizales.com', ...), ...)
     ],
-    3: [
-        (5, ('SEDE MEDELLÍN', 'ejemplo@medellin.com', 'María López'))
-    ]
     }
 
     :param ws: Worksheet del archivo de Excel.
-    :param errors: Lista de errores donde se agregarán los errores encontrados.
-    :return: Lista de filas organizadas por sede.
+    :param errors: Destino de los errores encontrados.
+    :param progress: Contadores de avance, publicados cada
+        PROGRESS_EVERY_ROWS filas.
+    :return: Filas derivadas ordenadas por sede.
     """
     # Diccionario para organizar las filas según la sede
-    sede_dict: Dict[int, List[Tuple[int, Tuple[Cell, ...]]]] = {
+    sede_dict: Dict[int, List[DerivedRow]] = {
         order.number: [] for order in SedeEnum
     }
+    derivation_cache: Dict[OrgKey, OrgDerivation] = {}
+    rows_parsed: int = 0
+    rows_validated: int = 0
+    progress.set_stage(IngestionStage.PARSING)
 
     logger.info(
         "Iniciando organizacion archivo de "
         "estudiantes activos"
     )
 
-    # Recorrer todas las filas del archivo Excel (incluye encabezados en row 1)
-    for row_idx, row in enumerate(ws.iter_rows(), start=1):
-
-        if row_idx == 1:
-            continue  # Skip header row
+    # Recorrer las filas como tuplas de valores (modo streaming), omitiendo
+    # el encabezado de la fila 1 y limitando al ancho del Enum
+    rows = ws.iter_rows(
+        min_row=2,
+        max_col=COLUMN_COUNT,
+        values_only=True
+    )
+    for row_idx, row in enumerate(rows, start=2):
+        rows_parsed += 1
+        if rows_parsed % PROGRESS_EVERY_ROWS == 0:
+            progress.update_rows(rows_parsed, rows_validated)
+            progress.record_entities(
+                {"org_combinations": len(derivation_cache)}
+            )
 
-        # Verificar si la fila está vacía
-        if is_blank(row):
-            errors.append({
-                "row": row_idx,
-                "column": None,
-                "message": "Fila completamente vacía"
-            })
+        classified = classify_row(row, row_idx, errors, derivation_cache)
+        if classified is None:
             continue
 
-        # Validar celdas vacías en la fila
-        errors.extend(get_blank_cell_errors(row, row_idx))
+        sede_number, derived = classified
+        sede_dict[sede_number].append(derived)
+        rows_validated += 1
 
-        # Obtener el valor de la sede de la fila
-        sede_cell = get_value_from_row(row, EstudianteActivos.SEDE.value)
-        sede_value = sede_cell.strip().upper()
-        info_sede = SedeEnum.get_by_name(sede_value)
+    progress.update_rows(rows_parsed, rows_validated)
+    progress.record_entities({"org_combinations": len(derivation_cache)})
 
-        # Comprobar si la sede es válida y mapearla al SedeOrder
-        if info_sede:
-            sede_order = info_sede.number
-            # Almacenar fila en el diccionario
-            sede_dict[sede_order].append((row_idx, row))
-        else:
-            errors.append({
-                "row": row_idx,
-                "column": EstudianteActivos.SEDE.value,
-                "message": f"Sede no válida: {sede_value}"
-            })
-            continue
+    logger.info("Finalizando organizacion de archivo de estudiantes activos")
+    logger.debug(
+        "Combinaciones organizacionales distintas: %d", len(derivation_cache)
+    )
+    logger.debug("Errores encontrados: %d", len(errors))
 
     # Ordenar las filas según el valor de SedeOrder (de menor a mayor)
-    sorted_rows = []
-    for order in sorted(sede_dict.keys()):
-        sorted_rows.extend(sede_dict[order])
+    return chain.from_iterable(
+        sede_dict[order] for order in sorted(sede_dict.keys())
+    )
 
-    logger.info("Finalizando organizacion de archivo de estudiantes activos")
-    logger.debug(f"Errores encontrados: {errors}")
 
-    return sorted_rows
+# --------- recorrido paralelo (opcional) ---------
+# Resultado de un bloque: errores, colecciones por sede y filas válidas
+ChunkResult = Tuple[List[Dict[str, Any]], Dict[int, SedeChunk], int]
+
+
+def use_parallel_parse(ws: Worksheet, workers: int, chunk_rows: int) -> bool:
+    """
+    El modo paralelo solo compensa el arranque de los procesos en hojas
+    grandes; `max_row` viene de la dimensión declarada en el archivo y
+    puede no existir.
+    """
+    if workers <= 1:
+        return False
+    max_row = getattr(ws, "max_row", None)
+    return not max_row or max_row > chunk_rows
+
+
+def iter_row_chunks(
+    ws: Worksheet,
+    chunk_rows: int
+) -> Iterator[Tuple[int, List[Row]]]:
+    """Entrega (fila inicial, filas) en bloques de `chunk_rows` filas."""
+    rows = ws.iter_rows(
+        min_row=2,
+        max_col=COLUMN_COUNT,
+        values_only=True
+    )
+    start_idx = 2
+    while True:
+        chunk = list(islice(rows, chunk_rows))
+        if not chunk:
+            return
+        yield start_idx, chunk
+        start_idx += len(chunk)
+
+
+def process_row_chunk(
+    start_idx: int,
+    rows: List[Row],
+    cod_period: str
+) -> ChunkResult:
+    """
+    Trabajo de cada proceso: valida y deriva las filas del bloque y arma,
+    por sede, las colecciones sin duplicados del bloque.
+    """
+    errors: List[Dict[str, Any]] = []
+    derivation_cache: Dict[OrgKey, OrgDerivation] = {}
+    builders: Dict[int, BatchBuilder] = {}
+    rows_validated: int = 0
+
+    for row_idx, row in enumerate(rows, start=start_idx):
+        classified = classify_row(row, row_idx, errors, derivation_cache)
+        if classified is None:
+            continue
+
+        sede_number, derived = classified
+        builder = builders.get(sede_number)
+        if builder is None:
+            builder = builders[sede_number] = BatchBuilder(cod_period)
+        builder.add_row(derived)
+        rows_validated += 1
+
+    if errors:
+        return errors, {}, rows_validated
+    return errors, {
+        number: builder.to_chunk() for number, builder in builders.items()
+    }, rows_validated
+
+
+def organize_chunks_by_sede(
+    ws: Worksheet,
+    cod_period: str,
+    errors: ValidationSink,
+    progress: IngestionProgress,
+    workers: int,
+    chunk_rows: int
+) -> List[Dict[int, SedeChunk]]:
+    """
+    Lee la hoja en el proceso principal (el lector es secuencial) y envía
+    los bloques a un pool de procesos. Se mantienen a lo sumo dos bloques
+    pendientes por proceso para acotar la memoria. Los resultados se
+    recogen en el orden de los bloques, así los errores quedan en el mismo
+    orden que en el recorrido serial.
+    """
+    sede_chunks: List[Dict[int, SedeChunk]] = []
+    pending: "deque[Future]" = deque()
+    rows_parsed: int = 0
+    rows_validated: int = 0
+    progress.set_stage(IngestionStage.PARSING)
+
+    def collect(future: Future):
+        nonlocal rows_validated
+        chunk_errors, chunks, validated = future.result()
+        errors.extend(chunk_errors)
+        sede_chunks.append(chunks)
+        rows_validated += validated
+        progress.update_rows(rows_parsed, rows_validated)
+
+    logger.info(
+        "Recorrido paralelo: %d procesos, bloques de %d filas",
+        workers, chunk_rows
+    )
+    # spawn: el pool se crea desde hilos de trabajo y fork no es seguro ahí
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        for start_idx, rows in iter_row_chunks(ws, chunk_rows):
+            pending.append(
+                pool.submit(process_row_chunk, start_idx, rows, cod_period)
+            )
+            rows_parsed += len(rows)
+            if len(pending) > 2 * workers:
+                collect(pending.popleft())
+
+        while pending:
+            collect(pending.popleft())
+
+    progress.update_rows(rows_parsed, rows_validated)
+    return sede_chunks
+
+
+def merge_sede_chunks(
+    sede_chunks: List[Dict[int, SedeChunk]],
+    cod_period: str
+) -> EstudiantesActivosBatch:
+    """
+    Mezcla los bloques recorriendo sede por sede y, dentro de cada sede,
+    los bloques en orden de filas: es el mismo orden del recorrido serial,
+    así que la primera aparición de cada llave es la misma.
+    """
+    builder = BatchBuilder(cod_period)
+    for order in sorted(sede.number for sede in SedeEnum):
+        for chunks in sede_chunks:
+            if order in chunks:
+                builder.merge(chunks[order])
+    return builder.batch
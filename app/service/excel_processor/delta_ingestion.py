@@ -0,0 +1,84 @@
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlmodel import Session
+
+from app.domain.dtos.upload_job.ingestion_options import IngestionOptions
+from app.domain.dtos.user_unit_associate.user_unit_associate_record import (
+    UserUnitAssociateRecord,
+)
+from app.service.crud.period_service import PeriodService
+from app.service.crud.user_unit_associate_service import (
+    UserUnitAssociateService,
+)
+from app.utils.app_logger import AppLogger
+
+logger = AppLogger(__file__, "delta_ingestion.log")
+
+# Llave de una asociación usuario-plan dentro de un periodo
+UserUnitKey = Tuple[str, str]
+
+
+def resolve_previous_period(
+    cod_period: str,
+    options: IngestionOptions,
+    session: Session
+) -> Optional[str]:
+    if options.previous_period:
+        return options.previous_period
+    previous = PeriodService.get_previous(cod_period, session)
+    return previous.cod_period if previous else None
+
+
+def apply_user_unit_delta(
+    userUnitAssocs: List[UserUnitAssociateRecord],
+    cod_period: str,
+    options: IngestionOptions,
+    session: Session
+) -> Tuple[List[UserUnitAssociateRecord], Dict[str, Any]]:
+    """
+    Compara las asociaciones usuario-plan del archivo contra las llaves ya
+    cargadas en el periodo destino y en el periodo anterior (conjuntos de
+    tuplas en memoria, una consulta por periodo).
+    Retorna solo las asociaciones que faltan en el periodo destino y el
+    resumen de la diferencia.
+    """
+    existing: Set[UserUnitKey] = UserUnitAssociateService.get_keys_by_period(
+        cod_period, session
+    )
+    previous_period = resolve_previous_period(cod_period, options, session)
+    previous: Set[UserUnitKey] = (
+        UserUnitAssociateService.get_keys_by_period(previous_period, session)
+        if previous_period else set()
+    )
+
+    file_keys: Set[UserUnitKey] = set()
+    pending: List[UserUnitAssociateRecord] = []
+    for assoc in userUnitAssocs:
+        key = (assoc.email_unal, assoc.cod_unit)
+        file_keys.add(key)
+        if key not in existing:
+            pending.append(assoc)
+
+    file_students: Set[str] = {email for email, _ in file_keys}
+    previous_students: Set[str] = {email for email, _ in previous}
+    dropped_students = previous_students - file_students
+
+    diff: Dict[str, Any] = {
+        "previous_period": previous_period,
+        "in_file": len(file_keys),
+        "already_in_period": len(file_keys) - len(pending),
+        "to_write": len(pending),
+        "new_vs_previous": len(file_keys - previous),
+        "kept_vs_previous": len(file_keys & previous),
+        "dropped_vs_previous": len(previous - file_keys),
+        "new_students": len(file_students - previous_students),
+        "dropped_students": len(dropped_students),
+    }
+    if options.report_dropped:
+        diff["dropped_student_emails"] = sorted(dropped_students)
+
+    logger.info(
+        "Delta %s vs %s: %s de %s asociaciones por escribir",
+        cod_period, previous_period, diff["to_write"], diff["in_file"]
+    )
+    return pending, diff
@@ -0,0 +1,105 @@
+import json
+from typing import Any, Dict, Iterator, List, Optional
+
+from openpyxl.worksheet.worksheet import Worksheet
+
+from app.domain.enums.files.estudiante_activos import SedeEnum
+from app.service.excel_processor.case_estudiantes_activos import (
+    COLUMN_COUNT,
+    DerivedRow,
+    OrgDerivation,
+    OrgKey,
+    build_batch,
+    classify_row,
+)
+from app.service.excel_processor.ingestion_progress import (
+    PROGRESS_EVERY_ROWS,
+)
+from app.service.excel_processor.validation_sink import ValidationSink
+from app.utils.app_logger import AppLogger
+
+logger = AppLogger(__file__, "dry_run.log")
+
+
+def validate_estudiantes_activos(
+    ws: Worksheet,
+    cod_period: str,
+    chunk_rows: int = PROGRESS_EVERY_ROWS,
+    report_owner: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Validación sin escritura: recorre la hoja con la misma validación y
+    derivación de la importación (`classify_row` y `build_batch`) y entrega
+    un resultado por cada bloque de `chunk_rows` filas con sus errores, y
+    al final el veredicto con los conteos que se habrían insertado.
+    No toca la base de datos.
+    """
+    errors = ValidationSink(keep_recent=True, owner=report_owner)
+    sede_dict: Dict[int, List[DerivedRow]] = {
+        order.number: [] for order in SedeEnum
+    }
+    derivation_cache: Dict[OrgKey, OrgDerivation] = {}
+    rows_parsed: int = 0
+    rows_validated: int = 0
+    chunk_start: int = 2
+
+    # El consumidor puede abandonar el stream; el reporte se cierra igual
+    try:
+        rows = ws.iter_rows(
+            min_row=2,
+            max_col=COLUMN_COUNT,
+            values_only=True
+        )
+        for row_idx, row in enumerate(rows, start=2):
+            rows_parsed += 1
+            classified = classify_row(row, row_idx, errors, derivation_cache)
+            if classified is not None:
+                sede_number, derived = classified
+                sede_dict[sede_number].append(derived)
+                rows_validated += 1
+
+            if rows_parsed % chunk_rows == 0:
+                yield chunk_result(chunk_start, row_idx, errors)
+                chunk_start = row_idx + 1
+
+        if chunk_start <= rows_parsed + 1:
+            yield chunk_result(chunk_start, rows_parsed + 1, errors)
+    finally:
+        errors.close()
+    summary: Dict[str, Any] = {
+        "type": "summary",
+        "rows_parsed": rows_parsed,
+    }
+    if errors:
+        summary.update(errors.to_detail())
+    else:
+        batch = build_batch(
+            (row for order in sorted(sede_dict) for row in sede_dict[order]),
+            cod_period
+        )
+        summary.update(status=True, rows_validated=rows_validated)
+        summary.update(batch.summary())
+    logger.info(
+        "Validación sin escritura: %s filas, %s errores",
+        rows_parsed, len(errors)
+    )
+    yield summary
+
+
+def chunk_result(
+    first_row: int,
+    last_row: int,
+    errors: ValidationSink
+) -> Dict[str, Any]:
+    return {
+        "type": "chunk",
+        "first_row": first_row,
+        "last_row": last_row,
+        "total_errors": len(errors),
+        "errors": errors.drain_recent(),
+    }
+
+
+def to_ndjson(results: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    for result in results:
+        yield json.dumps(result, ensure_ascii=False, default=str) + "\n"
@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional, Sequence
+
+from sqlmodel import Session
+
+from app.configuration.config import (
+    IMPORT_CHECKPOINT_MAX_AGE_HOURS,
+    INSERT_CHUNK_ROWS,
+)
+from app.repository.bulk_writer import chunked
+from app.service.crud.import_checkpoint_service import (
+    ImportCheckpointService,
+)
+from app.service.excel_processor.insert_scheduler import InsertResult
+from app.utils.app_logger import AppLogger
+
+logger = AppLogger(__file__, "insert_checkpoints.log")
+
+# Escritura de servicio: (registros, sesión) -> resultado del bloque
+ChunkWriter = Callable[[List[Any], Session], InsertResult]
+# Avance de cada bloque escrito o retomado: (tabla, resultado del bloque)
+ChunkCallback = Callable[[str, InsertResult], None]
+
+
+def merge_results(results: Sequence[InsertResult]) -> InsertResult:
+    """Suma los contadores de los bloques de una tabla."""
+    merged: InsertResult = {}
+    for result in results:
+        for key, value in result.items():
+            merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def write_in_chunks(
+    table: str,
+    write: ChunkWriter,
+    records: List[Any],
+    session: Session,
+    chunk_rows: int = INSERT_CHUNK_ROWS,
+    on_chunk: Optional[ChunkCallback] = None
+) -> InsertResult:
+    """
+    Escribe la tabla por bloques sin marcarlos, para publicar el avance de
+    cada bloque con `on_chunk`.
+    """
+    results: List[InsertResult] = []
+    for chunk in chunked(records, chunk_rows):
+        result = write(chunk, session)
+        results.append(result)
+        if on_chunk:
+            on_chunk(table, result)
+    return merge_results(results)
+
+
+class UploadCheckpoints:
+    """
+    Escribe las tablas de una carga en bloques de `chunk_rows` registros,
+    cada uno en su propia transacción, y marca en `import_checkpoint` cada
+    bloque confirmado con la llave (hash del archivo, periodo, tabla,
+    índice de bloque) y el tamaño de bloque. Un reintento del mismo archivo
+    con el mismo tamaño salta los bloques ya marcados y reutiliza sus
+    contadores; las marcas con otro tamaño se ignoran y se reescriben.
+
+    La marca se guarda después del commit del bloque: si el proceso cae
+    entre ambos, el reintento reescribe ese bloque y las llaves existentes
+    se ignoran. El orden de los bloques es estable porque el lote se arma
+    igual para el mismo archivo.
+
+    `on_chunk` recibe el resultado de cada bloque, escrito o retomado.
+    """
+
+    def __init__(
+        self,
+        content_hash: str,
+        cod_period: str,
+        chunk_rows: int = INSERT_CHUNK_ROWS,
+        on_chunk: Optional[ChunkCallback] = None
+    ):
+        self.content_hash = content_hash
+        self.cod_period = cod_period
+        self.chunk_rows = chunk_rows
+        self.on_chunk = on_chunk
+
+    def prepare(
+        self,
+        session: Session,
+        restart: bool = False,
+        max_age_hours: float = IMPORT_CHECKPOINT_MAX_AGE_HOURS
+    ):
+        """
+        Antes de escribir borra las marcas vencidas de cualquier carga y,
+        con `restart`, las de esta carga para escribirla desde cero.
+        """
+        expired = ImportCheckpointService.delete_created_before(
+            datetime.now() - timedelta(hours=max_age_hours), session
+        )
+        if expired:
+            logger.info("Marcas de carga vencidas borradas: %s", expired)
+        if restart:
+            self.clear(session)
+
+    def wrap(
+        self,
+        table: str,
+        write: ChunkWriter,
+        records: List[Any]
+    ) -> Callable[[Session], InsertResult]:
+        def run(session: Session) -> InsertResult:
+            return self.write_chunks(table, write, records, session)
+        return run
+
+    def write_chunks(
+        self,
+        table: str,
+        write: ChunkWriter,
+        records: List[Any],
+        session: Session
+    ) -> InsertResult:
+        done = ImportCheckpointService.get_done_chunks(
+            self.content_hash, self.cod_period, table, self.chunk_rows,
+            session
+        )
+        results: List[InsertResult] = []
+        for idx, chunk in enumerate(chunked(records, self.chunk_rows)):
+            if idx in done:
+                result = done[idx]
+            else:
+                result = write(chunk, session)
+                ImportCheckpointService.record(
+                    self.content_hash, self.cod_period, table, idx,
+                    self.chunk_rows, result, session
+                )
+            results.append(result)
+            if self.on_chunk:
+                self.on_chunk(table, result)
+
+        if done:
+            logger.info(
+                "Tabla %s: %s bloques retomados de %s (%s)",
+                table, len(done), self.content_hash, self.cod_period
+            )
+        merged = merge_results(results)
+        merged["resumed_chunks"] = len(done)
+        return merged
+
+    def clear(self, session: Session) -> int:
+        """Borra las marcas cuando la carga terminó completa."""
+        return ImportCheckpointService.delete_by_upload(
+            self.content_hash, self.cod_period, session
+        )
@@ -0,0 +1,179 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlmodel import Session
+
+from app.configuration.config import INSERT_WORKERS
+from app.utils.app_logger import AppLogger
+
+logger = AppLogger(__file__, "insert_scheduler.log")
+
+InsertResult = Dict[str, Any]
+
+
+class InsertTask(NamedTuple):
+    """
+    Escritura de una tabla. `write` recibe la sesión en la que debe
+    trabajar y confirma su propia transacción; `depends_on` nombra las
+    tablas que deben quedar escritas antes (llaves foráneas).
+    """
+    table: str
+    write: Callable[[Session], InsertResult]
+    depends_on: Tuple[str, ...] = ()
+
+
+class InsertPhaseError(Exception):
+    """Una o más tablas de una fase fallaron; las fases siguientes no se
+    ejecutaron."""
+
+    def __init__(
+        self,
+        failed: Dict[str, Exception],
+        completed: List[str],
+        skipped: List[str]
+    ):
+        self.failed = failed
+        self.completed = completed
+        self.skipped = skipped
+        super().__init__(
+            f"Fallaron las inserciones de {sorted(failed)}; "
+            f"sin ejecutar: {skipped}"
+        )
+
+
+def plan_phases(tasks: List[InsertTask]) -> List[List[InsertTask]]:
+    """
+    Agrupa las tareas en fases: cada fase solo contiene tablas cuyas
+    dependencias quedaron en fases anteriores. Conserva el orden dado
+    dentro de cada fase.
+    """
+    names = {task.table for task in tasks}
+    for task in tasks:
+        unknown = set(task.depends_on) - names
+        if unknown:
+            raise ValueError(
+                f"{task.table} depende de tablas sin tarea: {unknown}"
+            )
+
+    done: set = set()
+    pending = list(tasks)
+    phases: List[List[InsertTask]] = []
+    while pending:
+        ready = [t for t in pending if set(t.depends_on) <= done]
+        if not ready:
+            raise ValueError(
+                f"Dependencias circulares entre {[t.table for t in pending]}"
+            )
+        phases.append(ready)
+        done.update(t.table for t in ready)
+        pending = [t for t in pending if t.table not in done]
+    return phases
+
+
+class InsertScheduler:
+    """
+    Ejecuta las escrituras de una ingesta por fases. Las tablas de una
+    misma fase no dependen entre sí y se escriben en paralelo, cada una en
+    su propia sesión (y conexión del pool); la fase siguiente empieza
+    cuando todas terminan.
+
+    Política de rollback: cada tabla confirma su propia transacción. Si una
+    falla, su sesión se revierte, las demás tablas de la fase terminan y
+    quedan confirmadas, y las fases siguientes no se ejecutan. Como todas
+    las escrituras ignoran llaves existentes, reintentar la carga completa
+    la parte que faltó.
+
+    Con `workers` <= 1 todo se escribe en serie sobre la sesión recibida.
+    """
+
+    def __init__(self, session: Session, workers: int = INSERT_WORKERS):
+        self.session = session
+        self.workers = workers
+        self.timings: List[Dict[str, Any]] = []
+
+    def run(
+        self,
+        tasks: List[InsertTask],
+        on_done: Optional[Callable[[str, InsertResult], None]] = None
+    ) -> Dict[str, InsertResult]:
+        """
+        :param on_done: Se llama en el hilo que invoca `run` al terminar
+            cada tabla, para publicar el avance sin compartir estado entre
+            hilos.
+        :return: Resultado de cada tabla por nombre.
+        """
+        phases = plan_phases(tasks)
+        results: Dict[str, InsertResult] = {}
+        for idx, phase in enumerate(phases):
+            started = time.perf_counter()
+            failed = self.run_phase(phase, results, on_done)
+            elapsed = time.perf_counter() - started
+            self.timings.append({
+                "phase": idx,
+                "tables": [task.table for task in phase],
+                "seconds": round(elapsed, 3),
+            })
+            logger.info(
+                "Fase %s %s: %.3f s",
+                idx, [t.table for t in phase], elapsed
+            )
+            if failed:
+                skipped = [t.table for p in phases[idx + 1:] for t in p]
+                raise InsertPhaseError(failed, list(results), skipped)
+        return results
+
+    def run_phase(
+        self,
+        phase: List[InsertTask],
+        results: Dict[str, InsertResult],
+        on_done: Optional[Callable[[str, InsertResult], None]]
+    ) -> Dict[str, Exception]:
+        failed: Dict[str, Exception] = {}
+        if self.workers <= 1 or len(phase) == 1:
+            for task in phase:
+                try:
+                    results[task.table] = self.run_task(task, self.session)
+                except Exception as e:
+                    self.session.rollback()
+                    failed[task.table] = e
+                    break
+                if on_done:
+                    on_done(task.table, results[task.table])
+            return failed
+
+        workers = min(self.workers, len(phase))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures: Dict[Future, InsertTask] = {
+                executor.submit(self.run_in_own_session, task): task
+                for task in phase
+            }
+            wait(futures)
+        # Se recorren en el orden de la fase para un resultado estable
+        for future, task in futures.items():
+            error = future.exception()
+            if error is not None:
+                failed[task.table] = error
+                continue
+            results[task.table] = future.result()
+            if on_done:
+                on_done(task.table, results[task.table])
+        return failed
+
+    def run_in_own_session(self, task: InsertTask) -> InsertResult:
+        with Session(self.session.get_bind()) as session:
+            return self.run_task(task, session)
+
+    @staticmethod
+    def run_task(task: InsertTask, session: Session) -> InsertResult:
+        started = time.perf_counter()
+        try:
+            result = task.write(session)
+        except Exception as e:
+            logger.error("Error insertando %s: %s", task.table, e)
+            raise
+        logger.info(
+            "Tabla %s: %s en %.3f s",
+            task.table, result, time.perf_counter() - started
+        )
+        return result
@@ -1,22 +1,47 @@
+from typing import Optional
+
 from openpyxl import Workbook, worksheet
-from pytest import Session
+from sqlmodel import Session
+from app.domain.dtos.upload_job.ingestion_options import IngestionOptions
 from app.domain.enums.files.estudiante_activos import EstudianteActivos
 from app.service.excel_processor.case_estudiantes_activos import (
     case_estudiantes_activos,
 )
+from app.service.excel_processor.ingestion_progress import IngestionProgress
 from fastapi import HTTPException
 
 
-def process_file(file: Workbook, cod_period: str, session: Session) -> bool:
+def process_file(
+    file: Workbook,
+    cod_period: str,
+    session: Session,
+    progress: Optional[IngestionProgress] = None,
+    options: Optional[IngestionOptions] = None
+) -> bool:
+    ws = get_valid_sheet(file)
+    if ws is None:
+        return False
+
+    return case_estudiantes_activos(
+        ws, cod_period, session, progress, options
+    )
+
+
+def get_valid_sheet(file: Workbook) -> Optional[worksheet]:
+    """
+    Valida los encabezados de la primera hoja. Retorna la hoja, None si no
+    tiene encabezados, o lanza 400 si su estructura no es válida. La usan
+    la importación y la validación sin escritura.
+    """
     first_sheet_name: str = file.sheetnames[0]
     ws: worksheet = file[first_sheet_name]
 
     headers = get_headers(ws)
     if not headers:
-        return False
+        return None
 
     if EstudianteActivos.validate_headers(headers):
-        return case_estudiantes_activos(ws, cod_period, session)
+        return ws
 
     raise HTTPException(status_code=400, detail={
         "error": f"La hoja {first_sheet_name} no tiene una estructura válida",
@@ -29,4 +54,9 @@ def process_file(file: Workbook, cod_period: str, session: Session) -> bool:
 
 
 def get_headers(ws: worksheet) -> list[str]:
-    return [cell.value for cell in ws[1]]
+    # Solo se lee la primera fila, sin recorrer el resto de la hoja
+    header_row = next(
+        ws.iter_rows(min_row=1, max_row=1, values_only=True),
+        ()
+    )
+    return list(header_row)
@@ -0,0 +1,180 @@
+import csv
+import gzip
+import hashlib
+import io
+import os
+import time
+import uuid
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.configuration.config import (
+    VALIDATION_REPORT_DIR,
+    VALIDATION_REPORT_MAX_AGE_HOURS,
+    VALIDATION_REPORT_RETENTION,
+    VALIDATION_SAMPLE_SIZE,
+)
+from app.utils.app_logger import AppLogger
+from app.utils.uuid_generator import generate_uuid
+
+logger = AppLogger(__file__, "validation_sink.log")
+
+REPORT_COLUMNS: List[str] = ["row", "column", "message"]
+# Etiqueta de los errores que afectan la fila completa (columna None)
+WHOLE_ROW: str = "FILA"
+
+
+def owner_dir(owner: Optional[str]) -> str:
+    """
+    Carpeta de los reportes de un usuario. El correo se guarda como hash
+    para no usarlo en rutas; sin dueño van a la raíz.
+    """
+    if owner is None:
+        return VALIDATION_REPORT_DIR
+    digest = hashlib.sha256(owner.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(VALIDATION_REPORT_DIR, digest)
+
+
+def report_path(report_id: str, owner: Optional[str] = None) -> str:
+    return os.path.join(owner_dir(owner), f"{report_id}.csv.gz")
+
+
+def find_report(report_id: str, owner: Optional[str] = None) -> Optional[str]:
+    """
+    Ruta del reporte si existe y es de `owner`; el id debe ser un UUID
+    válido.
+    """
+    try:
+        report_id = str(uuid.UUID(report_id))
+    except ValueError:
+        return None
+    path = report_path(report_id, owner)
+    return path if os.path.exists(path) else None
+
+
+def prune_reports(
+    max_age_hours: float = VALIDATION_REPORT_MAX_AGE_HOURS,
+    retention: int = VALIDATION_REPORT_RETENTION
+) -> int:
+    """
+    Borra los reportes con más de `max_age_hours` y, de los que quedan,
+    los más viejos por encima de `retention`. Retorna cuántos borró.
+    """
+    reports = []
+    for root, _, files in os.walk(VALIDATION_REPORT_DIR):
+        for name in files:
+            if name.endswith(".csv.gz"):
+                path = os.path.join(root, name)
+                reports.append((os.path.getmtime(path), path))
+    reports.sort(reverse=True)
+
+    oldest = time.time() - max_age_hours * 3600
+    expired = [
+        path for idx, (mtime, path) in enumerate(reports)
+        if mtime < oldest or idx >= retention
+    ]
+    for path in expired:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Otro proceso ya lo borró
+            pass
+    if expired:
+        logger.info("Reportes de validación borrados: %s", len(expired))
+    return len(expired)
+
+
+class ValidationSink:
+    """
+    Recibe los errores de validación de una carga sin acumularlos: guarda
+    una muestra de `sample_size` errores y conteos por columna, y escribe
+    la lista completa en un CSV comprimido en disco que se abre con el
+    primer error. Se usa como la lista `errors` del recorrido (`append`,
+    `extend` y su valor de verdad).
+    Con `keep_recent` también guarda los errores desde el último
+    `drain_recent`, para quien los publica por bloques. El reporte queda
+    en la carpeta de `owner` y solo se le entrega a él.
+    Como context manager cierra el reporte aunque el recorrido falle.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = VALIDATION_SAMPLE_SIZE,
+        keep_recent: bool = False,
+        owner: Optional[str] = None
+    ):
+        self.sample_size = sample_size
+        self.owner = owner
+        self.recent: Optional[List[Dict[str, Any]]] = (
+            [] if keep_recent else None
+        )
+        self.sample: List[Dict[str, Any]] = []
+        self.by_column: Counter = Counter()
+        self.total: int = 0
+        self.report_id: Optional[str] = None
+        self.stream: Optional[io.TextIOWrapper] = None
+        self.writer = None
+
+    def __enter__(self) -> "ValidationSink":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __bool__(self) -> bool:
+        return self.total > 0
+
+    def __len__(self) -> int:
+        return self.total
+
+    def append(self, error: Dict[str, Any]):
+        if self.writer is None:
+            self.open_report()
+        self.total += 1
+        column = error.get("column")
+        self.by_column[WHOLE_ROW if column is None else str(column)] += 1
+        if len(self.sample) < self.sample_size:
+            self.sample.append(error)
+        if self.recent is not None:
+            self.recent.append(error)
+        self.writer.writerow(error)
+
+    def extend(self, errors: Iterable[Dict[str, Any]]):
+        for error in errors:
+            self.append(error)
+
+    def drain_recent(self) -> List[Dict[str, Any]]:
+        recent, self.recent = self.recent or [], []
+        return recent
+
+    def open_report(self):
+        # Cada reporte nuevo descarta los vencidos
+        prune_reports()
+        os.makedirs(owner_dir(self.owner), exist_ok=True)
+        self.report_id = generate_uuid()
+        self.stream = io.TextIOWrapper(
+            gzip.open(report_path(self.report_id, self.owner), "wb"),
+            encoding="utf-8",
+            newline=""
+        )
+        self.writer = csv.DictWriter(self.stream, fieldnames=REPORT_COLUMNS)
+        self.writer.writeheader()
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+            logger.info(
+                "Reporte de validación %s: %s errores",
+                self.report_id, self.total
+            )
+
+    def to_detail(self) -> Dict[str, Any]:
+        """Resumen acotado para la respuesta HTTP."""
+        return {
+            "status": False,
+            "total_errors": self.total,
+            "errors_by_column": dict(self.by_column),
+            "errors": self.sample,
+            "report_id": self.report_id,
+        }
@@ -0,0 +1,58 @@
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Callable, Awaitable, Optional
+
+from app.configuration.config import (
+    PROGRESS_EVENT_HEARTBEAT,
+    PROGRESS_EVENT_INTERVAL,
+)
+from app.domain.enums.upload_job.upload_job import UploadJobState
+from app.service.jobs.upload_job_queue import UploadJob
+
+FINISHED_STATES = (UploadJobState.SUCCEEDED, UploadJobState.FAILED)
+
+
+def format_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def stream_job_events(
+    job: UploadJob,
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    interval: float = PROGRESS_EVENT_INTERVAL,
+    heartbeat: float = PROGRESS_EVENT_HEARTBEAT
+) -> AsyncIterator[str]:
+    """
+    Eventos SSE del avance de una carga. Lee los contadores del trabajo
+    cada `interval` segundos y solo emite `progress` cuando cambiaron, así
+    el recorrido no paga nada extra por tener oyentes. Sin cambios envía
+    un comentario cada `heartbeat` segundos para mantener la conexión; el
+    evento trae `seconds_since_update`, que distingue una carga lenta de
+    una detenida. Termina con un evento `done` con el estado final.
+    """
+    last_seen = None
+    last_sent = time.monotonic()
+    while True:
+        if is_disconnected and await is_disconnected():
+            return
+
+        if job.state in FINISHED_STATES:
+            yield format_event("done", job.to_status().model_dump())
+            return
+
+        seen = (job.state, job.progress.version)
+        now = time.monotonic()
+        if seen != last_seen:
+            last_seen = seen
+            last_sent = now
+            yield format_event("progress", {
+                "job_id": job.job_id,
+                "status": job.state.value,
+                **job.progress.to_dto().model_dump(),
+            })
+        elif now - last_sent >= heartbeat:
+            last_sent = now
+            yield ": keep-alive\n\n"
+
+        await asyncio.sleep(interval)
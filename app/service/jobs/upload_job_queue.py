@@ -0,0 +1,235 @@
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, BinaryIO, List, Optional
+
+from fastapi import HTTPException
+from sqlmodel import Session
+
+from app.configuration.config import UPLOAD_JOB_RETENTION, UPLOAD_JOB_WORKERS
+from app.configuration.database import engine
+from app.domain.dtos.upload_job.ingestion_options import IngestionOptions
+from app.domain.dtos.upload_job.upload_job_status import UploadJobStatus
+from app.domain.enums.upload_job.upload_job import (
+    IngestionStage,
+    UploadJobState,
+)
+from app.domain.models.import_ledger import ImportLedger
+from app.service.crud.import_ledger_service import ImportLedgerService
+from app.service.excel_processor.ingestion_progress import IngestionProgress
+from app.service.excel_processor.process_file import process_file
+from app.utils.app_logger import AppLogger
+from app.utils.type_file_validation import open_upload
+
+logger = AppLogger(__file__, "upload_job_queue.log")
+
+
+class UploadJob:
+    def __init__(
+        self,
+        cod_period: str,
+        filename: Optional[str],
+        submitted_by: Optional[str],
+        content_hash: Optional[str] = None,
+        options: Optional[IngestionOptions] = None
+    ):
+        self.job_id: str = uuid.uuid4().hex
+        self.cod_period = cod_period
+        self.filename = filename
+        self.submitted_by = submitted_by
+        self.content_hash = content_hash
+        self.reused_result: bool = False
+        self.options = options or IngestionOptions()
+        self.state: UploadJobState = UploadJobState.QUEUED
+        self.created_at: datetime = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.progress = IngestionProgress()
+        self.result: Optional[Any] = None
+        self.error: Optional[Any] = None
+
+    def to_status(self) -> UploadJobStatus:
+        return UploadJobStatus(
+            job_id=self.job_id,
+            status=self.state.value,
+            cod_period=self.cod_period,
+            filename=self.filename,
+            submitted_by=self.submitted_by,
+            content_hash=self.content_hash,
+            reused_result=self.reused_result,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            progress=self.progress.to_dto(),
+            result=self.result,
+            error=self.error,
+        )
+
+
+class UploadJobQueue:
+    """
+    Cola en proceso para las cargas de archivos: el endpoint solo copia el
+    archivo a disco y encola; el recorrido y las inserciones corren en un
+    hilo del pool con su propia sesión, sin bloquear el event loop.
+    """
+
+    def __init__(
+        self,
+        workers: int = UPLOAD_JOB_WORKERS,
+        retention: int = UPLOAD_JOB_RETENTION
+    ):
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="upload-job"
+        )
+        self.retention = retention
+        self.jobs: "OrderedDict[str, UploadJob]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(
+        self,
+        spool: BinaryIO,
+        cod_period: str,
+        filename: Optional[str] = None,
+        submitted_by: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        options: Optional[IngestionOptions] = None
+    ) -> UploadJob:
+        job = UploadJob(
+            cod_period, filename, submitted_by, content_hash, options
+        )
+        with self.lock:
+            self.jobs[job.job_id] = job
+            self.prune()
+        self.executor.submit(self.run, job, spool)
+        logger.info("Trabajo %s encolado (%s)", job.job_id, filename)
+        return job
+
+    def complete_from_ledger(
+        self,
+        ledger: ImportLedger,
+        filename: Optional[str] = None,
+        submitted_by: Optional[str] = None
+    ) -> UploadJob:
+        """
+        Registra como terminado un trabajo cuyo archivo ya se importó en el
+        periodo: no se procesa, se devuelve el resultado guardado.
+        """
+        job = UploadJob(
+            ledger.cod_period, filename, submitted_by, ledger.content_hash
+        )
+        job.state = UploadJobState.SUCCEEDED
+        job.reused_result = True
+        job.started_at = job.finished_at = job.created_at
+        job.progress.set_stage(IngestionStage.DONE)
+        job.result = ImportLedgerService.get_result(ledger)
+        with self.lock:
+            self.jobs[job.job_id] = job
+            self.prune()
+        logger.info(
+            "Trabajo %s: archivo ya importado (%s, %s)",
+            job.job_id, ledger.content_hash, ledger.cod_period
+        )
+        return job
+
+    def find_active(
+        self, content_hash: str, cod_period: str
+    ) -> Optional[UploadJob]:
+        """
+        Trabajo en cola o en curso con el mismo archivo y periodo, sin
+        opciones que cambien el resultado.
+        """
+        with self.lock:
+            return next((
+                job for job in self.jobs.values()
+                if job.content_hash == content_hash
+                and job.cod_period == cod_period
+                and job.options.is_default()
+                and job.state in (
+                    UploadJobState.QUEUED, UploadJobState.RUNNING
+                )
+            ), None)
+
+    def get(self, job_id: str) -> Optional[UploadJob]:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def get_all(self) -> List[UploadJob]:
+        with self.lock:
+            return list(self.jobs.values())
+
+    def prune(self):
+        """Descarta los trabajos terminados más antiguos sobre el límite."""
+        finished = [
+            job_id for job_id, job in self.jobs.items()
+            if job.state in (UploadJobState.SUCCEEDED, UploadJobState.FAILED)
+        ]
+        excess = len(self.jobs) - self.retention
+        for job_id in finished[:max(excess, 0)]:
+            del self.jobs[job_id]
+
+    def record_ledger(self, job: UploadJob, session: Session):
+        # El ledger guarda el resultado de la importación por defecto
+        if not job.content_hash or not job.options.is_default():
+            return
+        try:
+            ImportLedgerService.record(
+                job.content_hash,
+                job.cod_period,
+                job.result,
+                session,
+                filename=job.filename,
+                submitted_by=job.submitted_by,
+            )
+        except Exception as e:
+            # La importación ya terminó; solo se pierde el atajo
+            session.rollback()
+            logger.error(
+                "Trabajo %s: no se registró en el ledger: %s",
+                job.job_id, e
+            )
+
+    def run(self, job: UploadJob, spool: BinaryIO):
+        job.state = UploadJobState.RUNNING
+        job.started_at = datetime.now()
+        logger.info("Trabajo %s iniciado", job.job_id)
+        try:
+            wb = open_upload(spool, job.filename)
+            try:
+                with Session(engine) as session:
+                    job.result = process_file(
+                        wb, job.cod_period, session, job.progress, job.options
+                    )
+                    # False: la hoja no tiene encabezados; no se importó
+                    # nada y el archivo no entra al ledger
+                    if job.result:
+                        self.record_ledger(job, session)
+            finally:
+                wb.close()
+            if job.result:
+                job.state = UploadJobState.SUCCEEDED
+            else:
+                job.error = "La primera hoja no tiene encabezados"
+                job.state = UploadJobState.FAILED
+
+        except HTTPException as e:
+            job.error = e.detail
+            job.state = UploadJobState.FAILED
+
+        except Exception as e:
+            logger.error(
+                "Trabajo %s falló: %s", job.job_id, e, exc_info=True
+            )
+            job.error = str(e)
+            job.state = UploadJobState.FAILED
+
+        finally:
+            spool.close()
+            job.finished_at = datetime.now()
+            logger.info(
+                "Trabajo %s terminado: %s", job.job_id, job.state.value
+            )
+
+
+upload_job_queue = UploadJobQueue()
@@ -0,0 +1,142 @@
+from typing import Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel import Session, select
+
+from app.domain.enums.email_sender.email_sender import OrgType
+from app.domain.models.email_sender import EmailSender
+from app.domain.models.headquarters import Headquarters
+from app.domain.models.school import School
+from app.domain.models.school_headquarters_associate import (
+    SchoolHeadquartersAssociate
+)
+from app.domain.models.unit_school_associate import UnitSchoolAssociate
+from app.service.crud.email_sender_headquarters_service import (
+    EmailSenderHeadquartersService
+)
+from app.service.crud.email_sender_school_service import (
+    EmailSenderSchoolService
+)
+from app.service.crud.email_sender_unit_service import EmailSenderUnitService
+from app.utils.app_logger import AppLogger
+
+logger = AppLogger(__file__, "fill_associate_email_sender.log")
+
+# Mismas reglas que el motor en Python (_get_sender_scopes), solo con
+# remitentes activos:
+# - sede: remitentes GLOBAL y HEADQUARTERS con sede_code = nombre de sede.
+# - facultad y sus unidades: además los SCHOOL con sede_code = nombre de
+#   la sede y org_code = nombre de la facultad.
+
+
+def _headquarters_senders() -> ColumnElement:
+    return or_(
+        EmailSender.org_type == OrgType.GLOBAL.value,
+        and_(
+            EmailSender.org_type == OrgType.HEADQUARTERS.value,
+            EmailSender.sede_code == Headquarters.name,
+        ),
+    )
+
+
+def _school_senders() -> ColumnElement:
+    return or_(
+        _headquarters_senders(),
+        and_(
+            EmailSender.org_type == OrgType.SCHOOL.value,
+            EmailSender.sede_code == Headquarters.name,
+            EmailSender.org_code == School.name,
+        ),
+    )
+
+
+def _active(senders: ColumnElement) -> ColumnElement:
+    return and_(EmailSender.is_active.is_(True), senders)
+
+
+def headquarters_sender_statement() -> Select:
+    return (
+        select(EmailSender.email, Headquarters.cod_headquarters)
+        .select_from(Headquarters)
+        .join(EmailSender, _active(_headquarters_senders()))
+    )
+
+
+def _school_scope(columns: tuple, cod_period: Optional[str]) -> Select:
+    """
+    Facultades del periodo con su sede y sus remitentes; sin periodo, las
+    de todos los periodos.
+    """
+    statement = (
+        select(*columns)
+        .select_from(SchoolHeadquartersAssociate)
+        .join(
+            Headquarters,
+            Headquarters.cod_headquarters
+            == SchoolHeadquartersAssociate.cod_headquarters
+        )
+        .join(
+            School,
+            School.cod_school == SchoolHeadquartersAssociate.cod_school
+        )
+        .join(EmailSender, _active(_school_senders()))
+    )
+    if cod_period is not None:
+        statement = statement.where(
+            SchoolHeadquartersAssociate.cod_period == cod_period
+        )
+    return statement
+
+
+def school_sender_statement(cod_period: Optional[str]) -> Select:
+    return _school_scope(
+        (EmailSender.email, SchoolHeadquartersAssociate.cod_school),
+        cod_period
+    )
+
+
+def unit_sender_statement(cod_period: Optional[str]) -> Select:
+    # Las unidades heredan los remitentes de su facultad
+    return _school_scope(
+        (EmailSender.email, UnitSchoolAssociate.cod_unit),
+        cod_period
+    ).join(
+        UnitSchoolAssociate,
+        and_(
+            UnitSchoolAssociate.cod_school
+            == SchoolHeadquartersAssociate.cod_school,
+            UnitSchoolAssociate.cod_period
+            == SchoolHeadquartersAssociate.cod_period,
+        )
+    )
+
+
+def fill_associate_email_sender_sql(session: Session, cod_period: str):
+    """
+    Igual que fill_associate_email_sender, pero cada tabla se llena con un
+    INSERT IGNORE ... SELECT: ni las llaves ni los remitentes pasan por
+    Python y la memoria no crece con unidades x remitentes.
+    """
+    response = {
+        "response_email_headquarters": (
+            EmailSenderHeadquartersService.insert_ignore_from_select(
+                headquarters_sender_statement(), session
+            )
+        ),
+        "response_email_school": (
+            EmailSenderSchoolService.insert_ignore_from_select(
+                school_sender_statement(cod_period), session
+            )
+        ),
+        "response_email_unit": (
+            EmailSenderUnitService.insert_ignore_from_select(
+                unit_sender_statement(cod_period), session
+            )
+        ),
+    }
+    logger.info(
+        "Asociaciones de remitentes en SQL %s: %s", cod_period, response
+    )
+    return response
@@ -0,0 +1,243 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from sqlmodel import Session, select
+
+from app.domain.dtos.email_sender.email_sender_input import EmailSenderInput
+from app.domain.dtos.school_headquarters_associate.school_headquarters_associate_input import (  # noqa: E501 ignora error flake8
+    SchoolHeadquartersAssociateInput
+)
+from app.domain.dtos.unit_school_associate.unit_school_associate_input import (
+    UnitSchoolAssociateInput
+)
+from app.domain.models.email_sender import EmailSender
+from app.domain.models.email_sender_headquarters import EmailSenderHeadquarters
+from app.domain.models.email_sender_school import EmailSenderSchool
+from app.domain.models.email_sender_unit import EmailSenderUnit
+from app.domain.models.school_headquarters_associate import (
+    SchoolHeadquartersAssociate
+)
+from app.domain.models.unit_school_associate import UnitSchoolAssociate
+from app.service.crud.email_sender_headquarters_service import (
+    EmailSenderHeadquartersService
+)
+from app.service.crud.email_sender_school_service import (
+    EmailSenderSchoolService
+)
+from app.service.crud.email_sender_service import EmailSenderService
+from app.service.crud.email_sender_unit_service import EmailSenderUnitService
+from app.service.crud.school_headquarters_associate_service import (
+    SchoolHeadquartersAssociateService
+)
+from app.service.crud.unit_school_associate_service import (
+    UnitSchoolAssociateService
+)
+from app.service.use_cases.email_sender_association_sql import (
+    headquarters_sender_statement,
+    school_sender_statement,
+    unit_sender_statement,
+)
+from app.utils.app_logger import AppLogger
+from app.utils.organization_schema_version import (
+    invalidate_organization_schema
+)
+
+logger = AppLogger(__file__, "fill_associate_email_sender.log")
+
+# Recalculo incremental de las asociaciones de remitentes. Las tablas
+# email_sender_* no guardan periodo, así que lo esperado para una llave se
+# calcula sobre la jerarquía de todos los periodos; se insertan las
+# parejas que faltan y se borran las que ya no corresponden (remitente
+# borrado o inactivo, facultad o unidad que salió de la jerarquía). Solo
+# se borran filas derivadas de las reglas; las creadas a mano se conservan.
+# La escritura que origina el recálculo y el recálculo se confirman juntos.
+
+
+def sync_sender_associations(
+    session: Session,
+    email: str
+) -> Dict[str, Any]:
+    """Asociaciones de un remitente (creado, editado, inactivo o borrado)."""
+    result = {
+        "headquarters": EmailSenderHeadquartersService.sync_from_select(
+            headquarters_sender_statement()
+            .where(EmailSender.email == email),
+            EmailSenderHeadquarters.sender_id == email,
+            session
+        ),
+        "schools": EmailSenderSchoolService.sync_from_select(
+            school_sender_statement(None).where(EmailSender.email == email),
+            EmailSenderSchool.sender_id == email,
+            session
+        ),
+        "units": EmailSenderUnitService.sync_from_select(
+            unit_sender_statement(None).where(EmailSender.email == email),
+            EmailSenderUnit.sender_id == email,
+            session
+        ),
+    }
+    logger.info("Asociaciones del remitente %s: %s", email, result)
+    return result
+
+
+def sync_school_associations(
+    session: Session,
+    cod_school: str
+) -> Dict[str, Any]:
+    """
+    Asociaciones de una facultad y de sus unidades, tras cambiar sus sedes
+    en algún periodo.
+    """
+    units = select(UnitSchoolAssociate.cod_unit).where(
+        UnitSchoolAssociate.cod_school == cod_school
+    )
+    result = {
+        "schools": EmailSenderSchoolService.sync_from_select(
+            school_sender_statement(None).where(
+                SchoolHeadquartersAssociate.cod_school == cod_school
+            ),
+            EmailSenderSchool.cod_school == cod_school,
+            session
+        ),
+        # La unidad puede colgar de otras facultades: se filtra por unidad
+        "units": EmailSenderUnitService.sync_from_select(
+            unit_sender_statement(None).where(
+                UnitSchoolAssociate.cod_unit.in_(units)
+            ),
+            EmailSenderUnit.cod_unit.in_(units),
+            session
+        ),
+    }
+    logger.info("Asociaciones de la facultad %s: %s", cod_school, result)
+    return result
+
+
+def sync_unit_associations(
+    session: Session,
+    cod_unit: str
+) -> Dict[str, Any]:
+    """Asociaciones de una unidad, tras cambiar sus facultades."""
+    result = {
+        "units": EmailSenderUnitService.sync_from_select(
+            unit_sender_statement(None).where(
+                UnitSchoolAssociate.cod_unit == cod_unit
+            ),
+            EmailSenderUnit.cod_unit == cod_unit,
+            session
+        ),
+    }
+    logger.info("Asociaciones de la unidad %s: %s", cod_unit, result)
+    return result
+
+
+@contextmanager
+def single_transaction(session: Session) -> Iterator[None]:
+    """Confirma todo lo escrito en el bloque, o lo deshace si algo falla."""
+    try:
+        yield
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+
+def create_email_sender(
+    input_data: EmailSenderInput,
+    session: Session
+) -> EmailSender:
+    with single_transaction(session):
+        created = EmailSenderService.create(input_data, session, False)
+        sync_sender_associations(session, created.email)
+    session.refresh(created)
+    return created
+
+
+def update_email_sender(
+    id: str,
+    input_data: EmailSenderInput,
+    session: Session
+) -> Optional[EmailSender]:
+    with single_transaction(session):
+        current = EmailSenderService.get_by_id(id, session)
+        previous_email = current.email if current else None
+        updated = EmailSenderService.update(id, input_data, session, False)
+        if updated:
+            # Si cambió el email, las llaves del anterior quedan sobrantes
+            sync_sender_associations(session, updated.email)
+            if previous_email != updated.email:
+                sync_sender_associations(session, previous_email)
+    if updated:
+        session.refresh(updated)
+    return updated
+
+
+def delete_email_sender(id: str, session: Session) -> bool:
+    with single_transaction(session):
+        sender = EmailSenderService.get_by_id(id, session)
+        email = sender.email if sender else None
+        deleted = EmailSenderService.delete(id, session, False)
+        if deleted:
+            sync_sender_associations(session, email)
+    return deleted
+
+
+def create_school_headquarters_associate(
+    input_data: SchoolHeadquartersAssociateInput,
+    session: Session
+) -> SchoolHeadquartersAssociate:
+    with single_transaction(session):
+        created = SchoolHeadquartersAssociateService.create(
+            input_data, session, False
+        )
+        sync_school_associations(session, created.cod_school)
+    # Se invalida otra vez tras confirmar: una lectura concurrente pudo
+    # cachear la jerarquía anterior con la versión nueva
+    invalidate_organization_schema(created.cod_period)
+    session.refresh(created)
+    return created
+
+
+def delete_school_headquarters_associate(
+    cod_school: str,
+    cod_headquarters: str,
+    cod_period: str,
+    session: Session
+) -> bool:
+    with single_transaction(session):
+        deleted = SchoolHeadquartersAssociateService.delete(
+            cod_school, cod_headquarters, cod_period, session, False
+        )
+        if deleted:
+            sync_school_associations(session, cod_school)
+    invalidate_organization_schema(cod_period)
+    return deleted
+
+
+def create_unit_school_associate(
+    input_data: UnitSchoolAssociateInput,
+    session: Session
+) -> UnitSchoolAssociate:
+    with single_transaction(session):
+        created = UnitSchoolAssociateService.create(
+            input_data, session, False
+        )
+        sync_unit_associations(session, created.cod_unit)
+    invalidate_organization_schema(created.cod_period)
+    session.refresh(created)
+    return created
+
+
+def delete_unit_school_associate(
+    cod_unit: str,
+    cod_school: str,
+    cod_period: str,
+    session: Session
+) -> bool:
+    with single_transaction(session):
+        deleted = UnitSchoolAssociateService.delete(
+            cod_unit, cod_school, cod_period, session, False
+        )
+        if deleted:
+            sync_unit_associations(session, cod_unit)
+    invalidate_organization_schema(cod_period)
+    return deleted
@@ -1,13 +1,24 @@
+from typing import Iterator, NamedTuple, Optional
 from sqlmodel import Session
 
+from app.domain.dtos.email_sender_headquarters.email_sender_headquarters_record import (  # noqa: E501 ignora error flake8
+    EmailSenderHeadquartersRecord,
+)
+from app.domain.dtos.email_sender_school.email_sender_school_record import (
+    EmailSenderSchoolRecord,
+)
+from app.domain.dtos.email_sender_unit.email_sender_unit_record import (
+    EmailSenderUnitRecord,
+)
 from app.domain.models.email_sender import EmailSender
-from app.domain.models.email_sender_headquarters import EmailSenderHeadquarters
-from app.domain.models.email_sender_school import EmailSenderSchool
-from app.domain.models.email_sender_unit import EmailSenderUnit
 from app.domain.models.headquarters import Headquarters
 from app.domain.models.school import School
 
-from app.domain.enums.email_sender.email_sender import OrgType
+from app.configuration.config import EMAIL_SENDER_ASSOCIATION_MODE
+from app.domain.enums.email_sender.email_sender import (
+    AssociationMode,
+    OrgType,
+)
 from app.service.crud.email_sender_service import EmailSenderService
 from app.service.crud.email_sender_unit_service import EmailSenderUnitService
 from app.service.crud.email_sender_school_service import (
@@ -18,8 +29,11 @@ from app.service.crud.email_sender_headquarters_service import (
 )
 from app.service.crud.headquarters_service import HeadquartersService
 from app.service.crud.school_service import SchoolService
-from app.service.use_cases.get_organization_schema import (
-    get_organization_schema
+from app.service.use_cases.email_sender_association_sql import (
+    fill_associate_email_sender_sql
+)
+from app.service.use_cases.organization_schema_cache import (
+    get_cached_organization_schema
 )
 from app.utils.app_logger import AppLogger
 
@@ -28,7 +42,16 @@ logger = AppLogger(__file__, "fill_associate_email_sender.log")
 
 # TODO: Por el momento solo se rellena hasta facultades, porque no hay
 # emails para unidades academicas en la base de datos.
-def fill_associate_email_sender(session: Session, cod_period: str):
+def fill_associate_email_sender(
+    session: Session,
+    cod_period: str,
+    mode: Optional[AssociationMode] = None
+):
+    # El modo por defecto se lee en cada llamada, no al importar
+    mode = mode or AssociationMode(EMAIL_SENDER_ASSOCIATION_MODE)
+    if mode == AssociationMode.SQL:
+        return fill_associate_email_sender_sql(session, cod_period)
+
     senders_global: list[EmailSender]
     senders_headquarters: dict[str, dict[str, list[EmailSender]]]
     organization_schema: dict[str, dict[str, list[str]]] = {}
@@ -38,7 +61,9 @@ def fill_associate_email_sender(session: Session, cod_period: str):
     )
     _log_email_senders(senders_global, senders_headquarters)
 
-    organization_schema = get_organization_schema(session, cod_period)
+    organization_schema = get_cached_organization_schema(
+        session, cod_period
+    )
     _log_organization(organization_schema)
 
     emailSenderHeadquarters, emailSenderSchool, emailSenderUnit = (
@@ -78,152 +103,126 @@ def fill_associate_email_sender(session: Session, cod_period: str):
     }
 
 
+class SenderScopes(NamedTuple):
+    """
+    Remitentes (emails) ya resueltos por alcance, en el orden del esquema:
+    sedes como (cod_headquarters, senders) y facultades como
+    (cod_school, senders, units).
+    """
+    headquarters: list[tuple[str, tuple[str, ...]]]
+    schools: list[tuple[str, tuple[str, ...], list[str]]]
+
+
 def _associated_email_senders(
     senders_global: list[EmailSender],
     senders_headquarters: dict[str, dict[str, list[EmailSender]]],
-    organization_schema: dict[str, dict[str, list[str]]] = {},
+    organization_schema: Optional[dict[str, dict[str, list[str]]]] = None,
     session: Session = None
-):
-    emailSenderHeadquarters: list[EmailSenderHeadquarters] = []
-    emailSenderSchool: list[EmailSenderSchool] = []
-    emailSenderUnit: list[EmailSenderUnit] = []
+) -> tuple[
+    Iterator[EmailSenderHeadquartersRecord],
+    Iterator[EmailSenderSchoolRecord],
+    Iterator[EmailSenderUnitRecord]
+]:
+    """
+    Sedes y facultades del esquema se leen con una consulta IN cada una y
+    las listas de remitentes se arman una vez por alcance; las
+    asociaciones salen como generadores de llaves que consume el insert.
+    """
+    scopes = _get_sender_scopes(
+        senders_global,
+        senders_headquarters,
+        organization_schema or {},
+        session
+    )
+    return (
+        _headquarters_sender_keys(scopes),
+        _school_sender_keys(scopes),
+        _unit_sender_keys(scopes)
+    )
+
+
+def _get_sender_scopes(
+    senders_global: list[EmailSender],
+    senders_headquarters: dict[str, dict[str, list[EmailSender]]],
+    organization_schema: dict[str, dict[str, list[str]]],
+    session: Session
+) -> SenderScopes:
+    cod_schools = {
+        cod_school
+        for schools in organization_schema.values()
+        for cod_school in schools
+    }
+    headquarters_by_code: dict[str, Headquarters] = {
+        hq.cod_headquarters: hq
+        for hq in HeadquartersService.get_by_ids(organization_schema, session)
+    }
+    schools_by_code: dict[str, School] = {
+        school.cod_school: school
+        for school in SchoolService.get_by_ids(cod_schools, session)
+    }
 
+    global_emails = _sender_emails(senders_global)
+    scopes = SenderScopes([], [])
     for sede, schools in organization_schema.items():
-        sede_info: Headquarters = HeadquartersService.get_by_id(sede, session)
+        sede_info = headquarters_by_code.get(sede)
         if not sede_info:
             continue
 
-        sede_name = sede_info.name
-        email_senders_sede: list[EmailSender] = (
-            _get_email_senders_by_sede(
-                sede_name,
-                senders_headquarters
-            )
-        )
-
-        temp_email_senders_headquarters: list[EmailSenderHeadquarters] = (
-            _get_email_sender_headquarters(
-                sede_info.cod_headquarters,
-                email_senders_sede,
-                senders_global
-            )
+        sede_emails = _sender_emails(
+            _get_email_senders_by_sede(sede_info.name, senders_headquarters)
         )
-        emailSenderHeadquarters.extend(temp_email_senders_headquarters)
+        scopes.headquarters.append((sede, sede_emails + global_emails))
 
         for school, units in schools.items():
-            school_info: School = SchoolService.get_by_id(school, session)
+            school_info = schools_by_code.get(school)
             if not school_info:
                 continue
 
-            school_name = school_info.name
-            email_senders_school: list[EmailSender] = (
+            school_emails = _sender_emails(
                 _get_email_senders_by_school(
-                    sede_name,
-                    school_name,
+                    sede_info.name,
+                    school_info.name,
                     senders_headquarters
                 )
             )
+            scopes.schools.append((
+                school,
+                sede_emails + school_emails + global_emails,
+                units
+            ))
 
-            temp_email_senders_schools: list[EmailSenderSchool] = []
-            temp_email_senders_schools = (
-                _get_email_sender_school(
-                    school_info.cod_school,
-                    email_senders_sede,
-                    senders_global,
-                    email_senders_school
-                )
-            )
-            emailSenderSchool.extend(temp_email_senders_schools)
-
-            # todo: dont exist email senders for units in db
-            temp_unit_senders_school: list[EmailSenderUnit] = []
-            temp_unit_senders_school = (
-                _get_email_sender_units(
-                    units,
-                    email_senders_sede,
-                    senders_global,
-                    email_senders_school
-                )
-            )
-            emailSenderUnit.extend(temp_unit_senders_school)
+    return scopes
 
-    return (
-        emailSenderHeadquarters,
-        emailSenderSchool,
-        emailSenderUnit
-    )
 
+def _sender_emails(senders: list[EmailSender]) -> tuple[str, ...]:
+    return tuple(sender.email for sender in senders)
 
-def _get_email_sender_headquarters(
-        cod_headquarters: str,
-        senders_headquarters: list[EmailSender],
-        senders_global: list[EmailSender]
-) -> list[EmailSenderHeadquarters]:
-    email_senders_headquarters: list[EmailSenderHeadquarters] = []
-    sender: EmailSender
-    hq_sender: EmailSenderHeadquarters
 
-    all_headquarters_senders: list[EmailSender] = (
-        senders_headquarters + senders_global
-    )
+def _headquarters_sender_keys(
+        scopes: SenderScopes
+) -> Iterator[EmailSenderHeadquartersRecord]:
+    for cod_headquarters, senders in scopes.headquarters:
+        for sender_id in senders:
+            yield EmailSenderHeadquartersRecord(sender_id, cod_headquarters)
 
-    for sender in all_headquarters_senders:
-        hq_sender = EmailSenderHeadquarters(
-            sender_id=sender.email,
-            cod_headquarters=cod_headquarters
-        )
-        email_senders_headquarters.append(hq_sender)
 
-    return email_senders_headquarters
+def _school_sender_keys(
+        scopes: SenderScopes
+) -> Iterator[EmailSenderSchoolRecord]:
+    for cod_school, senders, _ in scopes.schools:
+        for sender_id in senders:
+            yield EmailSenderSchoolRecord(sender_id, cod_school)
 
 
-def _get_email_sender_school(
-        cod_school: str,
-        senders_headquarters: list[EmailSender],
-        senders_global: list[EmailSender],
-        senders_school: list[EmailSender]
-) -> list[EmailSenderSchool]:
-    email_senders_schools: list[EmailSenderSchool] = []
-    sender: EmailSender
-    sc_sender: EmailSenderSchool
-
-    all_school_senders: list[EmailSender] = (
-        senders_headquarters + senders_school + senders_global
-        )
-
-    for sender in all_school_senders:
-        sc_sender = EmailSenderSchool(
-            sender_id=sender.email,
-            cod_school=cod_school
-        )
-        email_senders_schools.append(sc_sender)
-
-    return email_senders_schools
-
-
-def _get_email_sender_units(
-        units: list[str],
-        senders_headquarters: list[EmailSender],
-        senders_global: list[EmailSender],
-        senders_school: list[EmailSender]
-) -> list[EmailSenderUnit]:
-    email_senders_units: list[EmailSenderUnit] = []
-    sender: EmailSender
-    sc_sender: EmailSenderUnit
-
-    all_school_units: list[EmailSender] = (
-        senders_headquarters + senders_school + senders_global
-    )
-
-    for cod_unit in units:
-        for sender in all_school_units:
-            sc_sender = EmailSenderUnit(
-                sender_id=sender.email,
-                cod_unit=cod_unit
-            )
-            email_senders_units.append(sc_sender)
-
-    return email_senders_units
+# todo: dont exist email senders for units in db; las unidades heredan
+# los remitentes de su facultad
+def _unit_sender_keys(
+        scopes: SenderScopes
+) -> Iterator[EmailSenderUnitRecord]:
+    for _, senders, units in scopes.schools:
+        for cod_unit in units:
+            for sender_id in senders:
+                yield EmailSenderUnitRecord(sender_id, cod_unit)
 
 
 def _get_email_senders_by_school(
@@ -246,8 +245,11 @@ def _get_email_senders_by_sede(
         senders_headquarters: dict[str, dict[str, list[EmailSender]]]
 ) -> list[EmailSender]:
 
+    # Una sede puede tener solo remitentes de facultad
     if sede_name in senders_headquarters:
-        return senders_headquarters[sede_name][OrgType.HEADQUARTERS.value]
+        return senders_headquarters[sede_name].get(
+            OrgType.HEADQUARTERS.value, []
+        )
 
     return []
 
@@ -279,6 +281,9 @@ def _get_organized_email_senders(
     senders_headquarters = {}
 
     for sender in senders:
+        if not sender.is_active:
+            continue
+
         _obtain_global_email_sender(
             sender,
             senders_global
@@ -1,7 +1,9 @@
-from typing import Optional
+from typing import Any, List, Mapping, Optional
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import HTTPException
 from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
 
 from app.domain.models.user_unal import UserUnal
 from app.domain.dtos.user_unal.user_info import UserInfoAssociation
@@ -28,12 +30,39 @@ def get_info_user(
             detail="Usuario no encontrado"
         )
 
-    stmt = (
+    result = session.exec(user_academic_data_statement(email_unal))
+    return build_user_info(email_unal, user, result.mappings().all())
+
+
+async def get_info_user_async(
+    email_unal: str,
+    session: AsyncSession
+) -> Optional[UserInfoAssociation]:
+    """Versión asíncrona de get_info_user, para el endpoint de lectura."""
+    user = await UserUnalService.get_by_email_async(email_unal, session)
+    if not user:
+        raise HTTPException(
+            status_code=404,
+            detail="Usuario no encontrado"
+        )
+
+    result = await session.execute(user_academic_data_statement(email_unal))
+    return build_user_info(email_unal, user, result.mappings().all())
+
+
+def user_academic_data_statement(email_unal: str) -> TextClause:
+    return (
         text("CALL GetUserAcademicData(:email)")
         .bindparams(email=email_unal)
     )
 
-    result = session.exec(stmt).mappings().all()
+
+def build_user_info(
+    email_unal: str,
+    user: UserUnal,
+    result: List[Mapping[str, Any]]
+) -> UserInfoAssociation:
+    """Agrupa las filas del SP por periodo, sede, facultad y plan."""
     user_info = UserInfoAssociation(
         email_unal=email_unal,
         document=user.document,
@@ -1,6 +1,33 @@
 from typing import List, Tuple
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+
+def unit_email_list_statement(cod_unit: str, cod_period: str) -> TextClause:
+    return (
+        text("CALL get_email_list_of_unit(:unit, :period)")
+        .bindparams(unit=cod_unit, period=cod_period)
+    )
+
+
+def school_email_list_statement(
+    cod_school: str, cod_period: str
+) -> TextClause:
+    return (
+        text("CALL get_email_list_of_school(:school, :period)")
+        .bindparams(school=cod_school, period=cod_period)
+    )
+
+
+def headquarters_email_list_statement(
+    cod_headquarters: str, cod_period: str
+) -> TextClause:
+    return (
+        text("CALL get_email_list_of_headquarters(:hq, :period)")
+        .bindparams(hq=cod_headquarters, period=cod_period)
+    )
 
 
 def get_email_list_of_unit(
@@ -8,10 +35,7 @@ def get_email_list_of_unit(
         cod_unit: str,
         cod_period: str
 ) -> List[Tuple[str, str]]:
-    stmt = (
-        text("CALL get_email_list_of_unit(:unit, :period)")
-        .bindparams(unit=cod_unit, period=cod_period)
-    )
+    stmt = unit_email_list_statement(cod_unit, cod_period)
     rows = session.exec(stmt).all()
     # rows es lista de Row/tuplas (email, tipo)
     return [(r[0], r[1]) for r in rows]
@@ -22,10 +46,7 @@ def get_email_list_of_school(
     cod_school: str,
     cod_period: str
 ) -> List[Tuple[str, str]]:
-    stmt = (
-        text("CALL get_email_list_of_school(:school, :period)")
-        .bindparams(school=cod_school, period=cod_period)
-    )
+    stmt = school_email_list_statement(cod_school, cod_period)
     rows = session.exec(stmt).all()
     return [(r[0], r[1]) for r in rows]
 
@@ -35,9 +56,46 @@ def get_email_list_of_headquarters(
     cod_headquarters: str,
     cod_period: str
 ) -> List[Tuple[str, str]]:
-    stmt = (
-        text("CALL get_email_list_of_headquarters(:hq, :period)")
-        .bindparams(hq=cod_headquarters, period=cod_period)
-    )
+    stmt = headquarters_email_list_statement(cod_headquarters, cod_period)
     rows = session.exec(stmt).all()
     return [(r[0], r[1]) for r in rows]
+
+
+# --------- versiones asíncronas (endpoints de lectura) ---------
+async def fetch_email_list(
+    session: AsyncSession,
+    stmt: TextClause
+) -> List[Tuple[str, str]]:
+    result = await session.execute(stmt)
+    return [(r[0], r[1]) for r in result.all()]
+
+
+async def get_email_list_of_unit_async(
+    session: AsyncSession,
+    cod_unit: str,
+    cod_period: str
+) -> List[Tuple[str, str]]:
+    return await fetch_email_list(
+        session, unit_email_list_statement(cod_unit, cod_period)
+    )
+
+
+async def get_email_list_of_school_async(
+    session: AsyncSession,
+    cod_school: str,
+    cod_period: str
+) -> List[Tuple[str, str]]:
+    return await fetch_email_list(
+        session, school_email_list_statement(cod_school, cod_period)
+    )
+
+
+async def get_email_list_of_headquarters_async(
+    session: AsyncSession,
+    cod_headquarters: str,
+    cod_period: str
+) -> List[Tuple[str, str]]:
+    return await fetch_email_list(
+        session,
+        headquarters_email_list_statement(cod_headquarters, cod_period)
+    )
@@ -1,5 +1,7 @@
-from typing import List
-from sqlmodel import Session
+from typing import Iterable, Optional, Tuple
+from sqlalchemy import and_
+from sqlalchemy.sql import Select
+from sqlmodel import Session, select
 
 from app.domain.models.headquarters import Headquarters
 from app.domain.models.school_headquarters_associate import (
@@ -9,100 +11,97 @@ from app.domain.models.unit_school_associate import (
     UnitSchoolAssociate
 )
 
-from app.service.crud.headquarters_service import HeadquartersService
-
-from app.service.crud.unit_school_associate_service import (
-    UnitSchoolAssociateService
-)
-from app.service.crud.school_headquarters_associate_service import (
-    SchoolHeadquartersAssociateService
-)
-
 from app.utils.app_logger import AppLogger
 
 
 logger = AppLogger(__file__, "get_organization_schema.log")
 
+# (cod_headquarters, cod_school | None, cod_unit | None)
+SchemaRow = Tuple[str, Optional[str], Optional[str]]
+
+
+def organization_schema_statement(cod_period: str) -> Select:
+    """
+    Sedes -> facultades -> unidades del periodo en una sola consulta.
+    Los LEFT JOIN conservan las sedes sin facultades y las facultades sin
+    unidades, con None en las columnas que faltan.
+    """
+    return (
+        select(
+            Headquarters.cod_headquarters,
+            SchoolHeadquartersAssociate.cod_school,
+            UnitSchoolAssociate.cod_unit,
+        )
+        .outerjoin(
+            SchoolHeadquartersAssociate,
+            and_(
+                SchoolHeadquartersAssociate.cod_headquarters
+                == Headquarters.cod_headquarters,
+                SchoolHeadquartersAssociate.cod_period == cod_period,
+            )
+        )
+        .outerjoin(
+            UnitSchoolAssociate,
+            and_(
+                UnitSchoolAssociate.cod_school
+                == SchoolHeadquartersAssociate.cod_school,
+                UnitSchoolAssociate.cod_period == cod_period,
+            )
+        )
+        .order_by(
+            Headquarters.cod_headquarters,
+            SchoolHeadquartersAssociate.cod_school,
+            UnitSchoolAssociate.cod_unit,
+        )
+    )
+
 
 def get_organization_schema(session: Session, cod_period: str):
     # organization_schema structure:
     # dict[cod_headquarters, dict[cod_school, list[cod_unit]]]
-    organization_schema: dict[str, dict[str, list[str]]] = {}
-
-    headquarters: list[Headquarters] = (
-        HeadquartersService.get_all(session)
+    rows = session.exec(organization_schema_statement(cod_period)).all()
+    organization_schema = build_organization_schema(rows)
+    logger.info(
+        "Esquema de organización %s: %d filas, %d sedes",
+        cod_period, len(rows), len(organization_schema)
     )
-
-    headquarter: Headquarters
-    for headquarter in headquarters:
-        _insert_headquarters_in_organization_dict(
-            headquarter.cod_headquarters,
-            organization_schema
-        )
-
-        _fill_headquarters_schools(
-            session,
-            headquarter.cod_headquarters,
-            organization_schema[headquarter.cod_headquarters],
-            cod_period
-        )
-
     return organization_schema
 
 
-def _fill_headquarters_schools(
-    session: Session,
-    cod_headquarters: str,
-    headquarters_schema: dict[str, list[str]],
-    cod_period: str
-):
-    all_sch_hq_asso: List[SchoolHeadquartersAssociate] = []
-    all_sch_hq_asso = SchoolHeadquartersAssociateService.get_by_headquarters(
-        cod_headquarters, cod_period, session
-    )
-
-    sch_hq_asso: SchoolHeadquartersAssociate
-    for sch_hq_asso in all_sch_hq_asso:
-        _insert_school_in_organization_dict(
-            cod_headquarters, sch_hq_asso.cod_school, headquarters_schema
+def build_organization_schema(
+    rows: Iterable[SchemaRow]
+) -> dict[str, dict[str, list[str]]]:
+    """Arma el diccionario anidado en una pasada sobre las filas."""
+    organization_schema: dict[str, dict[str, list[str]]] = {}
+    for cod_headquarters, cod_school, cod_unit in rows:
+        headquarters_schema = _insert_headquarters_in_organization_dict(
+            cod_headquarters, organization_schema
         )
+        if cod_school is None:
+            continue
 
-        _fill_school_units(
-            session,
-            sch_hq_asso.cod_school,
-            headquarters_schema[sch_hq_asso.cod_school],
-            cod_period
+        school_schema = _insert_school_in_organization_dict(
+            cod_school, headquarters_schema
         )
+        if cod_unit is not None:
+            school_schema.append(cod_unit)
 
-
-def _fill_school_units(
-    session: Session,
-    cod_school: str,
-    school_schema: list[str],
-    cod_period: str
-):
-    units_sch_ass: list[UnitSchoolAssociate]
-    units_sch_ass = UnitSchoolAssociateService.get_by_school(
-        cod_school, cod_period, session
-    )
-
-    unit: UnitSchoolAssociate
-    for unit in units_sch_ass:
-        school_schema.append(unit.cod_unit)
+    return organization_schema
 
 
 def _insert_headquarters_in_organization_dict(
     cod_headquarters: str,
     organization_schema: dict[str, dict[str, list[str]]]
-):
+) -> dict[str, list[str]]:
     if cod_headquarters not in organization_schema:
         organization_schema[cod_headquarters] = {}
+    return organization_schema[cod_headquarters]
 
 
 def _insert_school_in_organization_dict(
-    cod_headquarters: str,
     cod_school: str,
     headquarters_schema: dict[str, list[str]]
-):
+) -> list[str]:
     if cod_school not in headquarters_schema:
         headquarters_schema[cod_school] = []
+    return headquarters_schema[cod_school]
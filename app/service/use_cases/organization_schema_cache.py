@@ -0,0 +1,93 @@
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional
+
+from sqlmodel import Session
+
+from app.configuration.config import ORGANIZATION_SCHEMA_TTL
+from app.service.use_cases.get_organization_schema import (
+    get_organization_schema
+)
+from app.utils.app_logger import AppLogger
+from app.utils.organization_schema_version import (
+    OrganizationSchemaVersions,
+    Version,
+    organization_schema_versions,
+)
+
+logger = AppLogger(__file__, "get_organization_schema.log")
+
+OrganizationSchema = Dict[str, Dict[str, list]]
+
+
+class CachedSchema(NamedTuple):
+    version: Version
+    loaded_at: float
+    schema: OrganizationSchema
+
+
+class OrganizationSchemaCache:
+    """
+    Esquema sedes -> facultades -> unidades por `cod_period` en memoria
+    del proceso. Cada entrada guarda la versión con la que se leyó; la
+    ingesta y los servicios de asociaciones suben la versión en
+    `versions` y la entrada deja de valer. El TTL cubre cambios hechos
+    por fuera del proceso.
+    El diccionario devuelto es compartido: solo lectura.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Session, str], OrganizationSchema] = (
+            get_organization_schema
+        ),
+        ttl: float = ORGANIZATION_SCHEMA_TTL,
+        versions: Optional[OrganizationSchemaVersions] = None
+    ):
+        self.loader = loader
+        self.ttl = ttl
+        self.versions = versions or OrganizationSchemaVersions()
+        self.lock = threading.Lock()
+        self.entries: Dict[str, CachedSchema] = {}
+
+    def version(self, cod_period: str) -> Version:
+        return self.versions.get(cod_period)
+
+    def get(self, session: Session, cod_period: str) -> OrganizationSchema:
+        entry = self.entries.get(cod_period)
+        if (
+            entry is not None
+            and entry.version == self.version(cod_period)
+            and time.monotonic() - entry.loaded_at < self.ttl
+        ):
+            return entry.schema
+
+        # La versión se toma antes de leer: si alguien invalida durante la
+        # lectura, la entrada nace vencida
+        version = self.version(cod_period)
+        schema = self.loader(session, cod_period)
+        with self.lock:
+            self.entries[cod_period] = CachedSchema(
+                version, time.monotonic(), schema
+            )
+        logger.info(
+            "Esquema de organización %s cargado (versión %s)",
+            cod_period, version
+        )
+        return schema
+
+    def bump(self, cod_period: Optional[str] = None):
+        """Invalida un periodo, o todos si no se indica."""
+        self.versions.bump(cod_period)
+
+
+organization_schema_cache = OrganizationSchemaCache(
+    versions=organization_schema_versions
+)
+
+
+def get_cached_organization_schema(
+    session: Session,
+    cod_period: str
+) -> OrganizationSchema:
+    return organization_schema_cache.get(session, cod_period)
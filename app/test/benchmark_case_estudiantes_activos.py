@@ -0,0 +1,100 @@
+"""
+Benchmark de la validación y armado de colecciones de estudiantes activos.
+
+Mide el recorrido único sobre una hoja sintética. No toca la base de
+datos. No hay comparación contra el flujo anterior: leía celdas e insertaba
+con la sesión, así que no se puede correr sobre la misma hoja sin base.
+
+Uso (desde la raíz del repositorio):
+    python -m app.test.benchmark_case_estudiantes_activos --rows 500000
+
+Con --workers N se mide además el recorrido paralelo en N procesos.
+"""
+import argparse
+import logging
+import random
+import time
+from typing import Any, Iterator, List, Tuple
+
+from app.domain.enums.files.estudiante_activos import SedeEnum
+from app.service.excel_processor.case_estudiantes_activos import (
+    collect_estudiantes_activos,
+)
+
+SEDES: List[str] = [sede._name for sede in SedeEnum]
+FACULTADES: List[str] = [
+    "Facultad de Ingeniería",
+    "Facultad de Ciencias",
+    "Facultad de Artes",
+    "Facultad de Medicina",
+    "Facultad de Ciencias Económicas",
+]
+
+
+class SyntheticWorksheet:
+    """Imita `iter_rows(values_only=True)` de una hoja de solo lectura."""
+
+    def __init__(self, rows: List[Tuple[Any, ...]]):
+        self.rows = rows
+
+    def iter_rows(self, min_row: int = 1, **kwargs) -> Iterator[tuple]:
+        return iter(self.rows[min_row - 1:])
+
+
+def build_rows(count: int, seed: int = 7) -> List[Tuple[Any, ...]]:
+    rnd = random.Random(seed)
+    rows: List[Tuple[Any, ...]] = [(
+        "NOMBRES_APELLIDOS", "EMAIL", "SEDE", "FACULTAD",
+        "COD_PLAN", "PLAN", "TIPO_NIVEL"
+    )]
+    for i in range(count):
+        cod_plan = rnd.randint(1, 300)
+        # ~5% de estudiantes repiten fila (doble titulación)
+        student = rnd.randint(0, i) if rnd.random() < 0.05 else i
+        rows.append((
+            f"Estudiante {student}",
+            f"est{student}@unal.edu.co",
+            rnd.choice(SEDES),
+            rnd.choice(FACULTADES),
+            cod_plan,
+            f"Plan ({cod_plan})",
+            rnd.choice(["PREGRADO", "POSGRADO"]),
+        ))
+    return rows
+
+
+def _measure(label: str, fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{elapsed:>10.2f} s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+
+    # Solo se mide CPU del armado, no la escritura de logs a disco
+    logging.disable(logging.CRITICAL)
+
+    print(f"Generando hoja sintética de {args.rows} filas...")
+    ws = SyntheticWorksheet(build_rows(args.rows))
+
+    current = _measure(
+        "Una pasada", collect_estudiantes_activos, ws, "2025-1", None, 1
+    )
+
+    if args.workers > 1:
+        parallel = _measure(
+            f"Paralelo ({args.workers} procesos)",
+            collect_estudiantes_activos, ws, "2025-1", None, args.workers
+        )
+        speedup = current / parallel
+        print(f"{'Aceleración vs una pasada':<28}{speedup:>10.2f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import importlib
+import os
+import pkgutil
+import tempfile
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+# Los logs de las pruebas van a un temporal y no a la raíz del repo; debe
+# fijarse antes de importar la configuración
+os.environ["LOG_DIR"] = tempfile.mkdtemp(prefix="app_logs_")
+
+import app.domain.models  # noqa: E402
+
+# Registra todas las tablas en la metadata antes de crearlas
+for module in pkgutil.iter_modules(app.domain.models.__path__):
+    importlib.import_module(f"app.domain.models.{module.name}")
+
+
+@pytest.fixture
+def session():
+    """
+    SQLite en memoria como reemplazo de MySQL, con todas las tablas del
+    modelo. StaticPool comparte la conexión entre hilos y sesiones.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    yield session
+    session.close()
+    engine.dispose()
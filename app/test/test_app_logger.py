@@ -0,0 +1,47 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.utils import app_logger
+from app.utils.app_logger import AppLogger
+
+
+def test_sampled_logs_first_and_every_nth(tmp_path):
+    logger = AppLogger("test_sampled.py", str(tmp_path / "sampled.log"))
+    records = []
+    logger.logger.log = lambda level, msg, *args: records.append(msg % args)
+    logger.logger.setLevel(logging.DEBUG)
+
+    for idx in range(5):
+        logger.sampled(logging.WARNING, "duplicado %s", idx, every=2)
+
+    assert records == [
+        "duplicado 0 (1 vistos)",
+        "duplicado 2 (3 vistos)",
+        "duplicado 4 (5 vistos)",
+    ]
+
+
+def test_sampled_skips_disabled_levels(tmp_path):
+    logger = AppLogger("test_disabled.py", str(tmp_path / "disabled.log"))
+    logger.logger.setLevel(logging.INFO)
+
+    logger.sampled(logging.DEBUG, "fila %s", 1)
+
+    assert not logger.sample_counts
+
+
+def test_concurrent_loggers_share_one_listener(tmp_path):
+    log_file = str(tmp_path / "concurrente.log")
+    barrier = threading.Barrier(8)
+
+    def create(idx: int):
+        barrier.wait()
+        return AppLogger(f"test_concurrente_{idx}.py", log_file)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        loggers = list(executor.map(create, range(8)))
+
+    queues = {logger.logger.handlers[0].queue for logger in loggers}
+    assert len(queues) == 1
+    assert queues == {app_logger._queues[log_file]}
@@ -0,0 +1,71 @@
+import asyncio
+
+import httpx
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.configuration.async_database import get_async_session
+from app.domain.models.user_unal import UserUnal
+from app.domain.models.user_unit_associate import UserUnitAssociate
+from app.main import app
+from app.utils.auth import get_current_user
+
+TABLES = [UserUnal.__table__, UserUnitAssociate.__table__]
+
+
+async def make_engine():
+    # SQLite asíncrono en memoria como reemplazo de MySQL
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all, tables=TABLES)
+    async with AsyncSession(engine) as session:
+        session.add(UserUnal(email_unal="ana@unal.edu.co", full_name="Ana"))
+        session.add(UserUnitAssociate(
+            email_unal="ana@unal.edu.co", cod_unit="1_pre_bog",
+            cod_period="2025-1"
+        ))
+        await session.commit()
+    return engine
+
+
+def test_async_read_endpoints_serve_concurrent_requests():
+    async def run():
+        engine = await make_engine()
+
+        async def override_session():
+            async with AsyncSession(engine) as session:
+                yield session
+
+        app.dependency_overrides[get_async_session] = override_session
+        app.dependency_overrides[get_current_user] = lambda: "x@unal.edu.co"
+        transport = httpx.ASGITransport(app=app)
+        try:
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                responses = await asyncio.gather(*(
+                    client.get("/users_unal/ana@unal.edu.co")
+                    for _ in range(50)
+                ))
+                listed = await client.get("/users_unal/")
+                by_user = await client.get(
+                    "/user_unit_associates/by-user/ana@unal.edu.co/2025-1"
+                )
+                missing = await client.get("/users_unal/nadie@unal.edu.co")
+        finally:
+            app.dependency_overrides.clear()
+            await engine.dispose()
+        return responses, listed, by_user, missing
+
+    responses, listed, by_user, missing = asyncio.run(run())
+
+    assert all(r.json()["full_name"] == "Ana" for r in responses)
+    assert [u["email_unal"] for u in listed.json()] == ["ana@unal.edu.co"]
+    assert by_user.json()[0]["cod_unit"] == "1_pre_bog"
+    assert missing.status_code == 404
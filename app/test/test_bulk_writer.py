@@ -0,0 +1,79 @@
+from sqlmodel import Session
+
+from app.domain.dtos.email_sender_unit.email_sender_unit_record import (
+    EmailSenderUnitRecord,
+)
+from app.domain.dtos.unit_unal.unit_unal_record import UnitUnalRecord
+from app.domain.models.unit_unal import UnitUnal
+from app.repository.bulk_writer import (
+    insert_ignore_in_batches,
+    upsert_changed_in_batches,
+)
+from app.service.crud.email_sender_unit_service import EmailSenderUnitService
+from app.service.crud.unit_unal_service import UnitUnalService
+
+FIELDS = ("email", "name", "type_unit")
+
+
+def unit(cod_unit: str, name: str, description: str = None) -> dict:
+    return UnitUnal(
+        cod_unit=cod_unit,
+        email=f"{cod_unit}@unal.edu.co",
+        name=name,
+        description=description,
+        type_unit="PREGRADO",
+    ).model_dump()
+
+
+def test_insert_ignore_counts_only_new_rows(session: Session):
+    rows = [unit("1_pre_bog", "Artes"), unit("2_pre_bog", "Diseño")]
+
+    assert insert_ignore_in_batches(session, UnitUnal, rows, 1) == 2
+    assert insert_ignore_in_batches(session, UnitUnal, rows, 1) == 0
+
+
+def test_insert_ignore_counts_duplicates_across_chunks(session: Session):
+    rows = (
+        unit(f"{idx % 3}_pre_bog", f"Plan {idx}") for idx in range(7)
+    )
+
+    # Lotes de 2: los duplicados caen en el mismo lote y en lotes distintos
+    assert insert_ignore_in_batches(session, UnitUnal, rows, 2) == 3
+
+
+def test_services_report_inserted_and_ignored(session: Session):
+    records = [
+        UnitUnalRecord("1_pre_bog", name="Artes"),
+        UnitUnalRecord("1_pre_bog", name="Artes"),
+        UnitUnalRecord("2_pre_bog", name="Diseño"),
+    ]
+    assert UnitUnalService.bulk_insert_ignore(records, session) == {
+        "inserted": 2, "duplicates_ignored": 1
+    }
+
+    # Con un generador el total recibido se cuenta al consumirlo
+    senders = (
+        EmailSenderUnitRecord("s1", cod_unit) for cod_unit in ("a", "b", "a")
+    )
+    assert EmailSenderUnitService.bulk_insert_ignore(senders, session) == {
+        "inserted": 2, "duplicates_ignored": 1
+    }
+
+
+def test_upsert_writes_only_new_or_changed_rows(session: Session):
+    insert_ignore_in_batches(session, UnitUnal, [
+        unit("1_pre_bog", "Artes", description="editada a mano"),
+        unit("2_pre_bog", "Diseño"),
+    ])
+
+    result = upsert_changed_in_batches(session, UnitUnal, [
+        unit("1_pre_bog", "Artes Plásticas"),
+        unit("2_pre_bog", "Diseño"),
+        unit("3_pre_bog", "Música"),
+    ], FIELDS, batch_size=2)
+
+    assert result == {"inserted": 1, "updated": 1, "unchanged": 1}
+    renamed = session.get(UnitUnal, "1_pre_bog")
+    assert renamed.name == "Artes Plásticas"
+    # Las columnas fuera de FIELDS no se sobrescriben
+    assert renamed.description == "editada a mano"
@@ -0,0 +1,202 @@
+import io
+
+import pytest
+from openpyxl import Workbook
+
+from app.domain.dtos.headquarters.headquarters_record import (
+    HeadquartersRecord,
+)
+from app.domain.dtos.school.school_record import SchoolRecord
+from app.domain.dtos.school_headquarters_associate.school_headquarters_associate_record import (  # noqa: E501 ignora error flake8
+    SchoolHeadquartersAssociateRecord,
+)
+from app.domain.dtos.unit_school_associate.unit_school_associate_record import (  # noqa: E501 ignora error flake8
+    UnitSchoolAssociateRecord,
+)
+from app.domain.dtos.unit_unal.unit_unal_record import UnitUnalRecord
+from app.domain.dtos.user_unal.user_unal_record import UserUnalRecord
+from app.domain.dtos.user_unit_associate.user_unit_associate_record import (
+    UserUnitAssociateRecord,
+)
+from app.service.excel_processor.case_estudiantes_activos import (
+    BatchBuilder,
+    DerivedRow,
+    classify_row,
+    collect_estudiantes_activos,
+    derive_row,
+    normalize_row,
+)
+from app.service.excel_processor.process_file import get_headers
+from app.utils.type_file_validation import open_upload
+
+HEADERS = (
+    "NOMBRES_APELLIDOS", "EMAIL", "SEDE", "FACULTAD",
+    "COD_PLAN", "PLAN", "TIPO_NIVEL"
+)
+
+BOGOTA = (
+    " Ana Pérez ", "Ana@UNAL.EDU.CO", "SEDE BOGOTÁ", "Facultad de Artes",
+    2879, "Diseño (Gráfico)", "PREGRADO"
+)
+LA_PAZ = (
+    "Beto Ruiz", "beto@unal.edu.co", "SEDE DE LA PAZ", "Sede La Paz",
+    7, "Música", "POSGRADO"
+)
+
+ANA = UserUnalRecord(
+    "Ana@unal.edu.co", full_name="Ana Pérez", headquarters="SEDE BOGOTÁ"
+)
+BETO = UserUnalRecord(
+    "beto@unal.edu.co", full_name="Beto Ruiz", headquarters="SEDE DE LA PAZ"
+)
+DISENO = UnitUnalRecord(
+    "2879_pre_bog", "2879_pre_bog@unal.edu.co", "Diseño Gráfico",
+    None, "PREGRADO"
+)
+MUSICA = UnitUnalRecord(
+    "7_pos_paz", "7_pos_paz@unal.edu.co", "Música", None, "POSGRADO"
+)
+ARTES = SchoolRecord(
+    "estfapre_bog", "estfapre_bog@unal.edu.co", "Facultad de Artes"
+)
+# Las sedes especiales comparten una facultad por tipo de estudiante
+ESPECIAL_PAZ = SchoolRecord(
+    "estfposde", "estfposde@unal.edu.co", "Sede La Paz"
+)
+SEDE_BOGOTA = HeadquartersRecord(
+    "estudiantepre_bog", "estudiantepre_bog@unal.edu.co", "SEDE BOGOTÁ",
+    None, "estudiante_bog"
+)
+SEDE_PAZ = HeadquartersRecord(
+    "estudiantepos_paz", "estudiantepos_paz@unal.edu.co", "SEDE DE LA PAZ",
+    None, "estudiante_paz"
+)
+
+
+def test_normalize_row_cleans_text_and_interns_repeated_columns():
+    values = normalize_row(BOGOTA + ("columna extra",))
+    again = normalize_row(BOGOTA)
+
+    assert values == (
+        "Ana Pérez", "Ana@UNAL.EDU.CO", "SEDE BOGOTÁ", "Facultad de Artes",
+        "2879", "Diseño Gráfico", "PREGRADO"
+    )
+    assert values[3] is again[3]
+    assert values[5] is again[5]
+
+
+def test_get_headers_reads_only_the_first_row():
+    wb = Workbook()
+    ws = wb.active
+    ws.append(HEADERS)
+    ws.append(BOGOTA)
+
+    assert get_headers(ws) == list(HEADERS)
+
+    empty = open_upload(io.BytesIO(b""), "vacio.csv")
+    assert get_headers(empty[empty.sheetnames[0]]) == []
+
+
+@pytest.mark.parametrize("row, expected", [
+    ((None, " ", None), [
+        {"row": 5, "column": None, "message": "Fila completamente vacía"},
+    ]),
+    (("Ana", "ana@unal.edu.co", "SEDE BOGOTÁ", "", 1, "Plan"), [
+        {"row": 5, "column": "FACULTAD", "message": "Celda vacía"},
+        {"row": 5, "column": "TIPO_NIVEL", "message": "Celda vacía"},
+    ]),
+    (("Ana", None, "Sede Luna", "F", 1, "Plan", "PREGRADO"), [
+        {"row": 5, "column": "EMAIL", "message": "Celda vacía"},
+        {"row": 5, "column": "SEDE", "message": "Sede no válida: SEDE LUNA"},
+    ]),
+    (("Ana", "ana@", "SEDE BOGOTÁ", "F", 1, "Plan", "PREGRADO"), [
+        {"row": 5, "column": "EMAIL", "message": "Correo no válido: ana@"},
+    ]),
+])
+def test_classify_row_reports_errors(row, expected):
+    errors: list = []
+
+    assert classify_row(row, 5, errors, {}) is None
+    assert errors == expected
+
+
+def test_classify_row_derives_valid_rows():
+    errors: list = []
+
+    assert classify_row(BOGOTA, 2, errors, {}) == (
+        1, DerivedRow(2, ANA, (DISENO, ARTES, False, SEDE_BOGOTA))
+    )
+    assert classify_row(LA_PAZ, 3, errors, {})[0] == 9
+    assert errors == []
+
+    # Con errores previos la fila se valida pero ya no se deriva
+    errors.append({"row": 1, "column": None, "message": "x"})
+    assert classify_row(BOGOTA, 4, errors, {}) is None
+    assert len(errors) == 1
+
+
+def test_derive_row_builds_codes_once_per_combination():
+    cache: dict = {}
+    first = derive_row(2, normalize_row(BOGOTA), "Ana@unal.edu.co", cache)
+    other = normalize_row(("Otro",) + BOGOTA[1:])
+    second = derive_row(3, other, "otro@unal.edu.co", cache)
+    special = derive_row(4, normalize_row(LA_PAZ), "beto@unal.edu.co", cache)
+
+    assert first.user == ANA
+    assert first.org == (DISENO, ARTES, False, SEDE_BOGOTA)
+    assert second.org is first.org
+    assert special.org == (MUSICA, ESPECIAL_PAZ, True, SEDE_PAZ)
+    assert len(cache) == 2
+
+
+def test_batch_builder_keeps_first_occurrence_of_each_key():
+    cache: dict = {}
+    builder = BatchBuilder("2025-1")
+    for row_idx, (row, email) in enumerate([
+        (BOGOTA, "Ana@unal.edu.co"),
+        (LA_PAZ, "beto@unal.edu.co"),
+        (BOGOTA, "Ana@unal.edu.co"),
+        ((" Ana ",) + LA_PAZ[1:], "Ana@unal.edu.co"),
+    ], start=2):
+        builder.add_row(derive_row(row_idx, normalize_row(row), email, cache))
+
+    batch = builder.batch
+    assert batch.users == [ANA, BETO]
+    assert batch.units == [DISENO, MUSICA]
+    assert batch.schools == [ARTES, ESPECIAL_PAZ]
+    assert batch.headquarters == [SEDE_BOGOTA, SEDE_PAZ]
+    assert batch.userUnitAssocs == [
+        UserUnitAssociateRecord("Ana@unal.edu.co", "2879_pre_bog", "2025-1"),
+        UserUnitAssociateRecord("beto@unal.edu.co", "7_pos_paz", "2025-1"),
+        UserUnitAssociateRecord("Ana@unal.edu.co", "7_pos_paz", "2025-1"),
+    ]
+    assert batch.unitSchoolAssocs == [
+        UnitSchoolAssociateRecord("2879_pre_bog", "estfapre_bog", "2025-1"),
+        UnitSchoolAssociateRecord("7_pos_paz", "estfposde", "2025-1"),
+    ]
+    assert batch.schoolHeadquartersAssocs == [
+        SchoolHeadquartersAssociateRecord(
+            "estfapre_bog", "estudiantepre_bog", "2025-1"
+        ),
+        SchoolHeadquartersAssociateRecord(
+            "estfposde", "estudiantepos_paz", "2025-1"
+        ),
+    ]
+    assert builder.special_schools == {"estfposde"}
+
+
+def test_collect_orders_collections_by_sede():
+    content = "\n".join(
+        ";".join(str(v) for v in row)
+        for row in (HEADERS, LA_PAZ, BOGOTA, BOGOTA)
+    )
+    wb = open_upload(io.BytesIO(content.encode("utf-8")), "activos.csv")
+
+    batch = collect_estudiantes_activos(
+        wb[wb.sheetnames[0]], "2025-1", workers=1
+    )
+
+    # La Paz va antes en el archivo, pero Bogotá es la sede 1
+    assert batch.users == [ANA, BETO]
+    assert batch.units == [DISENO, MUSICA]
+    assert batch.summary()["cant_user_unit_assocs"] == 2
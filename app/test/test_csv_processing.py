@@ -0,0 +1,45 @@
+import io
+
+from app.utils.type_file_validation import open_upload
+
+HEADERS = [
+    "NOMBRES_APELLIDOS", "EMAIL", "SEDE", "FACULTAD",
+    "COD_PLAN", "PLAN", "TIPO_NIVEL"
+]
+
+
+def open_sheet(content: str, filename: str):
+    wb = open_upload(io.BytesIO(content.encode("utf-8-sig")), filename)
+    return wb[wb.sheetnames[0]]
+
+
+def test_csv_columns_mapped_by_header():
+    content = (
+        "Tipo Nivel;Email;Sede;Facultad;Cod_Plan;Plan;"
+        "Nombres Apellidos;Extra\n"
+        "PREGRADO;ana@unal.edu.co;SEDE BOGOTÁ;Facultad de Artes;"
+        "2879;Diseño;Ana Pérez;x\n"
+    )
+    ws = open_sheet(content, "estudiantes.csv")
+
+    rows = list(ws.iter_rows(min_row=1, values_only=True))
+    assert list(rows[0]) == HEADERS
+    assert rows[1] == (
+        "Ana Pérez", "ana@unal.edu.co", "SEDE BOGOTÁ",
+        "Facultad de Artes", "2879", "Diseño", "PREGRADO"
+    )
+
+
+def test_tsv_short_rows_are_padded():
+    content = "\t".join(HEADERS) + "\nAna\tana@unal.edu.co\n"
+    ws = open_sheet(content, "estudiantes.tsv")
+
+    rows = list(ws.iter_rows(min_row=2, values_only=True))
+    assert rows == [("Ana", "ana@unal.edu.co", None, None, None, None, None)]
+
+
+def test_csv_missing_headers_are_kept_as_is():
+    ws = open_sheet("EMAIL,SEDE\nana@unal.edu.co,SEDE BOGOTÁ\n", "a.csv")
+
+    header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True))
+    assert list(header) == ["EMAIL", "SEDE"]
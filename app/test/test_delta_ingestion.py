@@ -0,0 +1,93 @@
+from datetime import date
+
+from sqlmodel import Session
+
+from app.domain.dtos.upload_job.ingestion_options import IngestionOptions
+from app.domain.dtos.user_unit_associate.user_unit_associate_record import (
+    UserUnitAssociateRecord,
+)
+from app.domain.models.period import Period
+from app.domain.models.user_unit_associate import UserUnitAssociate
+from app.service.excel_processor.delta_ingestion import (
+    apply_user_unit_delta,
+    resolve_previous_period,
+)
+
+
+def seed(session: Session):
+    session.add_all([
+        Period(cod_period="2024-1", initial_date=date(2024, 2, 1)),
+        Period(cod_period="2024-2", initial_date=date(2024, 8, 1)),
+        Period(cod_period="2025-1", initial_date=date(2025, 2, 1)),
+        Period(cod_period="sin-fecha"),
+    ])
+    for email_unal, cod_unit, cod_period in [
+        ("ana@unal.edu.co", "sis", "2024-2"),
+        ("beto@unal.edu.co", "civ", "2024-2"),
+        ("caro@unal.edu.co", "mec", "2024-2"),
+        # Ya escrita en el periodo destino por una carga anterior
+        ("ana@unal.edu.co", "sis", "2025-1"),
+    ]:
+        session.add(UserUnitAssociate(
+            email_unal=email_unal, cod_unit=cod_unit, cod_period=cod_period
+        ))
+    session.commit()
+
+
+def test_previous_period_is_the_one_starting_before(session: Session):
+    seed(session)
+
+    assert resolve_previous_period(
+        "2025-1", IngestionOptions(), session
+    ) == "2024-2"
+    assert resolve_previous_period(
+        "2024-1", IngestionOptions(), session
+    ) is None
+    assert resolve_previous_period(
+        "sin-fecha", IngestionOptions(), session
+    ) is None
+    assert resolve_previous_period(
+        "2025-1", IngestionOptions(previous_period="2024-1"), session
+    ) == "2024-1"
+
+
+def test_delta_writes_only_missing_assocs_and_diffs(session: Session):
+    seed(session)
+    assocs = [
+        UserUnitAssociateRecord("ana@unal.edu.co", "sis", "2025-1"),
+        # Cambió de plan: la llave es nueva, el estudiante no
+        UserUnitAssociateRecord("beto@unal.edu.co", "ele", "2025-1"),
+        UserUnitAssociateRecord("dani@unal.edu.co", "sis", "2025-1"),
+    ]
+
+    pending, diff = apply_user_unit_delta(
+        assocs, "2025-1", IngestionOptions(report_dropped=True), session
+    )
+
+    assert pending == assocs[1:]
+    assert diff == {
+        "previous_period": "2024-2",
+        "in_file": 3,
+        "already_in_period": 1,
+        "to_write": 2,
+        "new_vs_previous": 2,
+        "kept_vs_previous": 1,
+        "dropped_vs_previous": 2,
+        "new_students": 1,
+        "dropped_students": 1,
+        "dropped_student_emails": ["caro@unal.edu.co"],
+    }
+
+
+def test_delta_without_previous_period_counts_all_as_new(session: Session):
+    seed(session)
+    assocs = [UserUnitAssociateRecord("ana@unal.edu.co", "sis", "2024-1")]
+
+    pending, diff = apply_user_unit_delta(
+        assocs, "2024-1", IngestionOptions(), session
+    )
+
+    assert pending == assocs
+    assert diff["previous_period"] is None
+    assert diff["new_vs_previous"] == 1
+    assert "dropped_student_emails" not in diff
@@ -0,0 +1,40 @@
+import io
+
+from app.service.excel_processor import validation_sink
+from app.service.excel_processor.dry_run import validate_estudiantes_activos
+from app.utils.type_file_validation import open_upload
+
+HEADER = "NOMBRES_APELLIDOS,EMAIL,SEDE,FACULTAD,COD_PLAN,PLAN,TIPO_NIVEL\n"
+ROW = "Ana Pérez,{email},SEDE BOGOTÁ,Facultad de Artes,2879,Diseño,PREGRADO\n"
+
+
+def validate(content: str):
+    wb = open_upload(io.BytesIO(content.encode("utf-8")), "a.csv")
+    ws = wb[wb.sheetnames[0]]
+    return list(validate_estudiantes_activos(ws, "2025-1", chunk_rows=2))
+
+
+def test_valid_file_reports_chunks_and_counts():
+    content = HEADER + "".join(
+        ROW.format(email=f"u{idx}@unal.edu.co") for idx in range(3)
+    )
+    results = validate(content)
+
+    assert [r["type"] for r in results] == ["chunk", "chunk", "summary"]
+    assert (results[1]["first_row"], results[1]["last_row"]) == (4, 4)
+    summary = results[-1]
+    assert summary["status"] is True
+    assert summary["cant_users"] == 3
+    assert summary["cant_user_unit_assocs"] == 3
+
+
+def test_invalid_rows_are_streamed_with_their_chunk(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation_sink, "VALIDATION_REPORT_DIR", tmp_path)
+    content = HEADER + ROW.format(email="u@unal.edu.co") + ROW.format(
+        email="sin-arroba"
+    )
+    results = validate(content)
+
+    assert results[0]["errors"][0]["row"] == 3
+    assert results[-1]["status"] is False
+    assert results[-1]["errors_by_column"] == {"EMAIL": 1}
@@ -0,0 +1,220 @@
+from collections import Counter
+
+import pytest
+from sqlmodel import Session, select
+
+from app.domain.models.email_sender import EmailSender
+from app.domain.models.email_sender_headquarters import EmailSenderHeadquarters
+from app.domain.models.email_sender_school import EmailSenderSchool
+from app.domain.models.email_sender_unit import EmailSenderUnit
+from app.domain.models.headquarters import Headquarters
+from app.domain.models.school import School
+from app.domain.models.school_headquarters_associate import (
+    SchoolHeadquartersAssociate
+)
+from app.domain.models.unit_school_associate import UnitSchoolAssociate
+from app.domain.dtos.email_sender.email_sender_input import EmailSenderInput
+from app.service.use_cases import email_sender_association_sync
+from app.service.use_cases.email_sender_association_sync import (
+    create_email_sender,
+    delete_school_headquarters_associate,
+    delete_unit_school_associate,
+    update_email_sender,
+)
+from app.service.use_cases.email_sender_association_sql import (
+    fill_associate_email_sender_sql,
+    headquarters_sender_statement,
+    school_sender_statement,
+    unit_sender_statement,
+)
+from app.service.use_cases.fill_asociate_email_sender import (
+    _associated_email_senders,
+    _get_email_senders,
+)
+from app.service.use_cases.get_organization_schema import (
+    get_organization_schema
+)
+
+
+def seed(session: Session):
+    session.add_all([
+        Headquarters(cod_headquarters="bog", name="BOGOTA"),
+        Headquarters(cod_headquarters="med", name="MEDELLIN"),
+        Headquarters(cod_headquarters="pal", name="PALMIRA"),
+        School(cod_school="ing", name="INGENIERIA"),
+        School(cod_school="cie", name="CIENCIAS"),
+        EmailSender(email="rector@unal.edu.co"),
+        EmailSender(
+            email="sede@unal.edu.co", org_type="HEADQUARTERS",
+            sede_code="BOGOTA"
+        ),
+        EmailSender(
+            email="ing@unal.edu.co", org_type="SCHOOL",
+            sede_code="BOGOTA", org_code="INGENIERIA"
+        ),
+        EmailSender(
+            email="ing.med@unal.edu.co", org_type="SCHOOL",
+            sede_code="MEDELLIN", org_code="INGENIERIA"
+        ),
+    ])
+    # "ing" está en dos sedes y "cie" no tiene unidades
+    for cod_school, cod_headquarters, cod_period in [
+        ("ing", "bog", "2025-1"),
+        ("cie", "bog", "2025-1"),
+        ("ing", "med", "2025-1"),
+        ("ing", "pal", "2024-2"),
+    ]:
+        session.add(SchoolHeadquartersAssociate(
+            cod_school=cod_school,
+            cod_headquarters=cod_headquarters,
+            cod_period=cod_period,
+        ))
+    for cod_unit, cod_period in [
+        ("sis", "2025-1"), ("civ", "2025-1"), ("ele", "2024-2")
+    ]:
+        session.add(UnitSchoolAssociate(
+            cod_unit=cod_unit, cod_school="ing", cod_period=cod_period
+        ))
+    session.commit()
+
+
+def python_keys(session: Session, cod_period: str):
+    senders_global, senders_headquarters = _get_email_senders(session)
+    streams = _associated_email_senders(
+        senders_global,
+        senders_headquarters,
+        get_organization_schema(session, cod_period),
+        session
+    )
+    return [Counter(key[:2] for key in stream) for stream in streams]
+
+
+def sql_keys(session: Session, cod_period: str):
+    statements = [
+        headquarters_sender_statement(),
+        school_sender_statement(cod_period),
+        unit_sender_statement(cod_period),
+    ]
+    return [
+        Counter(tuple(row) for row in session.exec(statement))
+        for statement in statements
+    ]
+
+
+def stored_keys(session: Session):
+    return [
+        set(session.exec(select(model.sender_id, column)).all())
+        for model, column in [
+            (EmailSenderHeadquarters,
+             EmailSenderHeadquarters.cod_headquarters),
+            (EmailSenderSchool, EmailSenderSchool.cod_school),
+            (EmailSenderUnit, EmailSenderUnit.cod_unit),
+        ]
+    ]
+
+
+def test_sql_mode_matches_python_engine(session: Session):
+    seed(session)
+    expected = python_keys(session, "2025-1")
+    assert sql_keys(session, "2025-1") == expected
+    assert expected[2][("ing.med@unal.edu.co", "sis")] == 1
+
+    response = fill_associate_email_sender_sql(session, "2025-1")
+    assert stored_keys(session) == [set(keys) for keys in expected]
+    assert response["response_email_school"] == {
+        "inserted": len(expected[1]),
+        "duplicates_ignored": sum(expected[1].values()) - len(expected[1]),
+    }
+
+
+def rebuilt_keys(session: Session):
+    # Lo que dejaría un recálculo completo de todos los periodos
+    expected = [set(), set(), set()]
+    for cod_period in ("2025-1", "2024-2"):
+        for keys, found in zip(expected, sql_keys(session, cod_period)):
+            keys.update(found)
+    return expected
+
+
+def test_incremental_sync_matches_full_rebuild(session: Session):
+    seed(session)
+    fill_associate_email_sender_sql(session, "2025-1")
+    fill_associate_email_sender_sql(session, "2024-2")
+
+    create_email_sender(EmailSenderInput(
+        id="10", email="pal@unal.edu.co", org_type="SCHOOL",
+        sede_code="PALMIRA", org_code="INGENIERIA"
+    ), session)
+    assert ("pal@unal.edu.co", "ele") in stored_keys(session)[2]
+    assert stored_keys(session) == rebuilt_keys(session)
+
+    # Inactivo: sus llaves sobran
+    sede = session.exec(
+        select(EmailSender).where(EmailSender.email == "sede@unal.edu.co")
+    ).one()
+    update_email_sender(str(sede.id), EmailSenderInput(
+        id=str(sede.id), email=sede.email, org_type="HEADQUARTERS",
+        sede_code="BOGOTA", is_active=False
+    ), session)
+    assert stored_keys(session) == rebuilt_keys(session)
+    assert all(
+        sender_id != "sede@unal.edu.co"
+        for keys in stored_keys(session) for sender_id, _ in keys
+    )
+
+    # "ing" sale de Medellín y "civ" de "ing"
+    delete_school_headquarters_associate("ing", "med", "2025-1", session)
+    delete_unit_school_associate("civ", "ing", "2025-1", session)
+    assert stored_keys(session) == rebuilt_keys(session)
+    assert not any(
+        key[0] == "ing.med@unal.edu.co" for key in stored_keys(session)[1]
+    )
+    assert not any(key[1] == "civ" for key in stored_keys(session)[2])
+
+
+def test_sync_keeps_manual_associations(session: Session):
+    seed(session)
+    fill_associate_email_sender_sql(session, "2025-1")
+    # Creadas a mano: ninguna regla las produce
+    session.add(EmailSenderUnit(sender_id="sede@unal.edu.co", cod_unit="ele"))
+    session.add(
+        EmailSenderSchool(sender_id="ing@unal.edu.co", cod_school="cie")
+    )
+    session.commit()
+
+    sede = session.exec(
+        select(EmailSender).where(EmailSender.email == "sede@unal.edu.co")
+    ).one()
+    update_email_sender(str(sede.id), EmailSenderInput(
+        id=str(sede.id), email=sede.email, org_type="HEADQUARTERS",
+        sede_code="BOGOTA", is_active=False
+    ), session)
+    delete_school_headquarters_associate("cie", "bog", "2025-1", session)
+
+    headquarters, schools, units = stored_keys(session)
+    assert ("sede@unal.edu.co", "bog") not in headquarters
+    assert ("sede@unal.edu.co", "ele") in units
+    assert ("ing@unal.edu.co", "cie") in schools
+    assert ("rector@unal.edu.co", "cie") not in schools
+
+
+def test_failed_sync_rolls_back_the_sender_write(
+    session: Session, monkeypatch
+):
+    seed(session)
+
+    def fail(session, email):
+        raise RuntimeError("sin conexión")
+
+    monkeypatch.setattr(
+        email_sender_association_sync, "sync_sender_associations", fail
+    )
+    with pytest.raises(RuntimeError):
+        create_email_sender(EmailSenderInput(
+            id="10", email="pal@unal.edu.co", org_type="HEADQUARTERS",
+            sede_code="PALMIRA"
+        ), session)
+
+    assert session.exec(
+        select(EmailSender).where(EmailSender.email == "pal@unal.edu.co")
+    ).first() is None
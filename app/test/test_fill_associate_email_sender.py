@@ -0,0 +1,97 @@
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.domain.models.email_sender import EmailSender
+from app.domain.models.headquarters import Headquarters
+from app.domain.models.school import School
+from app.service.use_cases.fill_asociate_email_sender import (
+    _associated_email_senders,
+    _get_organized_email_senders,
+)
+
+TABLES = [Headquarters.__table__, School.__table__]
+
+
+def seed(session: Session, school_count: int):
+    session.add(Headquarters(cod_headquarters="bog", name="BOGOTA"))
+    session.add(Headquarters(cod_headquarters="med", name="MEDELLIN"))
+    session.add(School(cod_school="ing", name="INGENIERIA"))
+    for i in range(school_count):
+        session.add(School(cod_school=f"s{i}", name=f"S{i}"))
+    session.commit()
+
+
+SENDERS = [
+    EmailSender(email="rector@unal.edu.co", org_type="GLOBAL"),
+    EmailSender(
+        email="sede@unal.edu.co", org_type="HEADQUARTERS", sede_code="BOGOTA"
+    ),
+    EmailSender(
+        email="ing@unal.edu.co", org_type="SCHOOL",
+        sede_code="BOGOTA", org_code="INGENIERIA"
+    ),
+    # Sede con remitentes de facultad pero sin remitente de sede
+    EmailSender(
+        email="ing.med@unal.edu.co", org_type="SCHOOL",
+        sede_code="MEDELLIN", org_code="INGENIERIA"
+    ),
+]
+
+
+def associate(session: Session, schema: dict):
+    statements: list = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2])
+    )
+    senders_global, senders_headquarters = _get_organized_email_senders(
+        SENDERS, [], {}
+    )
+    keys = _associated_email_senders(
+        senders_global, senders_headquarters, schema, session
+    )
+    return [list(stream) for stream in keys], len(statements)
+
+
+def test_associations_follow_the_organization_schema(session: Session):
+    seed(session, 0)
+    schema = {
+        "bog": {"ing": ["sis", "civ"], "nope": ["x"]},
+        "med": {"ing": ["mec"]},
+        "nope": {"ing": ["y"]},
+    }
+    (headquarters, schools, units), _ = associate(session, schema)
+
+    assert [key[:2] for key in headquarters] == [
+        ("sede@unal.edu.co", "bog"),
+        ("rector@unal.edu.co", "bog"),
+        ("rector@unal.edu.co", "med"),
+    ]
+    assert [key[:2] for key in schools] == [
+        ("sede@unal.edu.co", "ing"),
+        ("ing@unal.edu.co", "ing"),
+        ("rector@unal.edu.co", "ing"),
+        ("ing.med@unal.edu.co", "ing"),
+        ("rector@unal.edu.co", "ing"),
+    ]
+    assert [key[:2] for key in units] == [
+        ("sede@unal.edu.co", "sis"),
+        ("ing@unal.edu.co", "sis"),
+        ("rector@unal.edu.co", "sis"),
+        ("sede@unal.edu.co", "civ"),
+        ("ing@unal.edu.co", "civ"),
+        ("rector@unal.edu.co", "civ"),
+        ("ing.med@unal.edu.co", "mec"),
+        ("rector@unal.edu.co", "mec"),
+    ]
+
+
+def test_query_count_does_not_grow_with_schools(session: Session):
+    seed(session, 300)
+    schema = {"bog": {f"s{i}": [f"u{i}"] for i in range(300)}}
+    (_, schools, units), queries = associate(session, schema)
+
+    assert queries == 2
+    assert len(schools) == 300 * 2
+    assert len(units) == 300 * 2
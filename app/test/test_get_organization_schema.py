@@ -0,0 +1,60 @@
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.domain.models.headquarters import Headquarters
+from app.domain.models.school_headquarters_associate import (
+    SchoolHeadquartersAssociate
+)
+from app.domain.models.unit_school_associate import UnitSchoolAssociate
+from app.service.use_cases.get_organization_schema import (
+    get_organization_schema
+)
+
+
+def seed(session: Session):
+    session.add_all([
+        Headquarters(cod_headquarters="bog"),
+        Headquarters(cod_headquarters="med"),
+        Headquarters(cod_headquarters="pal"),
+    ])
+    for cod_school, cod_headquarters, cod_period in [
+        ("ing", "bog", "2025-1"),
+        ("cie", "bog", "2025-1"),
+        ("ing", "med", "2025-1"),
+        ("art", "med", "2024-2"),
+    ]:
+        session.add(SchoolHeadquartersAssociate(
+            cod_school=cod_school,
+            cod_headquarters=cod_headquarters,
+            cod_period=cod_period,
+        ))
+    for cod_unit, cod_school, cod_period in [
+        ("sis", "ing", "2025-1"),
+        ("civ", "ing", "2025-1"),
+        ("mus", "art", "2024-2"),
+        ("ele", "ing", "2024-2"),
+    ]:
+        session.add(UnitSchoolAssociate(
+            cod_unit=cod_unit, cod_school=cod_school, cod_period=cod_period
+        ))
+    session.commit()
+
+
+def test_schema_is_built_with_a_single_query(session: Session):
+    seed(session)
+    statements: list = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2])
+    )
+
+    schema = get_organization_schema(session, "2025-1")
+
+    assert len(statements) == 1
+    # Sedes sin facultades y facultades sin unidades se conservan vacías
+    assert schema == {
+        "bog": {"cie": [], "ing": ["civ", "sis"]},
+        "med": {"ing": ["civ", "sis"]},
+        "pal": {},
+    }
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import Session, select
+
+from app.domain.models.import_checkpoint import ImportCheckpoint
+from app.service.excel_processor.ingestion_progress import IngestionProgress
+from app.service.excel_processor.insert_checkpoints import (
+    UploadCheckpoints,
+    write_in_chunks,
+)
+
+
+def test_retry_resumes_after_last_committed_chunk(session: Session):
+    checkpoints = UploadCheckpoints("abc", "2025-1", chunk_rows=2)
+    records = list(range(5))
+    written: list = []
+
+    def failing_write(chunk, session):
+        if chunk[0] == 2:
+            raise RuntimeError("conexión perdida")
+        written.extend(chunk)
+        return {"inserted": len(chunk)}
+
+    with pytest.raises(RuntimeError):
+        checkpoints.write_chunks("units", failing_write, records, session)
+    assert written == [0, 1]
+
+    def write(chunk, session):
+        written.extend(chunk)
+        return {"inserted": len(chunk)}
+
+    result = checkpoints.write_chunks("units", write, records, session)
+
+    assert written == [0, 1, 2, 3, 4]
+    assert result == {"inserted": 5, "resumed_chunks": 1}
+    assert checkpoints.clear(session) == 3
+
+
+def write_all(written: list):
+    def write(chunk, session):
+        written.extend(chunk)
+        return {"inserted": len(chunk)}
+    return write
+
+
+def test_checkpoints_with_other_chunk_size_are_ignored(session: Session):
+    records = list(range(4))
+    UploadCheckpoints("abc", "2025-1", chunk_rows=2).write_chunks(
+        "units", write_all([]), records, session
+    )
+
+    written: list = []
+    result = UploadCheckpoints("abc", "2025-1", chunk_rows=3).write_chunks(
+        "units", write_all(written), records, session
+    )
+
+    assert written == records
+    assert result == {"inserted": 4, "resumed_chunks": 0}
+
+
+def test_prepare_restarts_and_drops_expired_checkpoints(session: Session):
+    records = list(range(4))
+    old = UploadCheckpoints("old", "2025-1", chunk_rows=2)
+    old.write_chunks("units", write_all([]), records, session)
+    for checkpoint in session.exec(select(ImportCheckpoint)).all():
+        checkpoint.created_at = datetime.now() - timedelta(hours=5)
+    session.commit()
+    checkpoints = UploadCheckpoints("abc", "2025-1", chunk_rows=2)
+    checkpoints.write_chunks("units", write_all([]), records, session)
+
+    checkpoints.prepare(session, max_age_hours=4)
+    assert old.clear(session) == 0
+
+    written: list = []
+    checkpoints.prepare(session, restart=True, max_age_hours=4)
+    checkpoints.write_chunks("units", write_all(written), records, session)
+    assert written == records
+
+
+def test_progress_is_reported_per_chunk(session: Session):
+    progress = IngestionProgress()
+    seen: list = []
+
+    def on_chunk(table, result):
+        progress.record_chunk_result(table, result)
+        seen.append(progress.inserted_by_table[table])
+
+    records = list(range(5))
+    checkpoints = UploadCheckpoints(
+        "abc", "2025-1", chunk_rows=2, on_chunk=on_chunk
+    )
+    checkpoints.write_chunks("units", write_all([]), records[:2], session)
+    checkpoints.write_chunks("units", write_all([]), records, session)
+    write_in_chunks(
+        "users", write_all([]), records, session, chunk_rows=2,
+        on_chunk=on_chunk
+    )
+
+    # El bloque retomado también cuenta en el acumulado
+    assert seen == [2, 4, 6, 7, 2, 4, 5]
+    assert progress.rows_inserted == 12
@@ -0,0 +1,62 @@
+import pytest
+from sqlmodel import Session, create_engine
+
+from app.service.excel_processor.insert_scheduler import (
+    InsertPhaseError,
+    InsertScheduler,
+    InsertTask,
+    plan_phases,
+)
+
+
+def write(table: str, calls: list):
+    def run(session: Session) -> dict:
+        calls.append(table)
+        return {"inserted": 1}
+    return run
+
+
+def fail(session: Session) -> dict:
+    raise RuntimeError("sin conexión")
+
+
+def test_phases_follow_dependencies():
+    calls: list = []
+    tasks = [
+        InsertTask("assoc", write("assoc", calls), ("users", "units")),
+        InsertTask("users", write("users", calls)),
+        InsertTask("units", write("units", calls)),
+    ]
+
+    phases = plan_phases(tasks)
+    assert [[t.table for t in p] for p in phases] == [
+        ["users", "units"], ["assoc"]
+    ]
+
+    engine = create_engine("sqlite://")
+    with Session(engine) as session:
+        scheduler = InsertScheduler(session, workers=2)
+        results = scheduler.run(tasks)
+
+    assert calls[-1] == "assoc"
+    assert set(results) == {"users", "units", "assoc"}
+    assert len(scheduler.timings) == 2
+
+
+def test_failed_table_skips_dependent_phases():
+    calls: list = []
+    tasks = [
+        InsertTask("users", write("users", calls)),
+        InsertTask("units", fail),
+        InsertTask("assoc", write("assoc", calls), ("users", "units")),
+    ]
+
+    engine = create_engine("sqlite://")
+    with Session(engine) as session:
+        with pytest.raises(InsertPhaseError) as error:
+            InsertScheduler(session, workers=2).run(tasks)
+
+    assert set(error.value.failed) == {"units"}
+    assert error.value.completed == ["users"]
+    assert error.value.skipped == ["assoc"]
+    assert calls == ["users"]
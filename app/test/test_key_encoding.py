@@ -0,0 +1,21 @@
+from app.utils.key_encoding import KeyEncoder, pack_key
+
+
+def test_encoder_assigns_stable_consecutive_codes():
+    encoder = KeyEncoder()
+
+    assert encoder.encode("a@unal.edu.co") == 0
+    assert encoder.encode("b@unal.edu.co") == 1
+    assert encoder.encode("a@unal.edu.co") == 0
+    assert "b@unal.edu.co" in encoder
+    assert len(encoder) == 2
+
+
+def test_packed_keys_do_not_collide_like_concatenation():
+    # "ab" + "c" y "a" + "bc" producen la misma cadena concatenada
+    encoder = KeyEncoder()
+    first = pack_key(encoder.encode("ab"), encoder.encode("c"))
+    second = pack_key(encoder.encode("a"), encoder.encode("bc"))
+
+    assert "ab" + "c" == "a" + "bc"
+    assert first != second
@@ -0,0 +1,68 @@
+from app.service.use_cases.organization_schema_cache import (
+    OrganizationSchemaCache
+)
+from app.utils.organization_schema_version import OrganizationSchemaVersions
+
+
+def make_cache(ttl: float = 600):
+    loads: list = []
+
+    def loader(session, cod_period):
+        loads.append(cod_period)
+        return {"bog": {"ing": [f"sis_{len(loads)}"]}}
+
+    return OrganizationSchemaCache(loader, ttl), loads
+
+
+def test_reads_are_served_from_memory_until_bumped():
+    cache, loads = make_cache()
+
+    first = cache.get(None, "2025-1")
+    assert cache.get(None, "2025-1") is first
+    cache.get(None, "2024-2")
+    assert loads == ["2025-1", "2024-2"]
+
+    # Invalidar un periodo no afecta a los demás
+    cache.bump("2025-1")
+    assert cache.get(None, "2025-1") == {"bog": {"ing": ["sis_3"]}}
+    cache.get(None, "2024-2")
+    assert loads == ["2025-1", "2024-2", "2025-1"]
+
+    cache.bump()
+    cache.get(None, "2024-2")
+    assert loads[-1] == "2024-2" and len(loads) == 4
+
+
+def test_ttl_expires_entries():
+    cache, loads = make_cache(ttl=0)
+    cache.get(None, "2025-1")
+    cache.get(None, "2025-1")
+    assert len(loads) == 2
+
+
+def test_bump_during_load_leaves_entry_stale():
+    cache, loads = make_cache()
+
+    def loader(session, cod_period):
+        loads.append(cod_period)
+        if len(loads) == 1:
+            # Una ingesta termina mientras se lee el esquema
+            cache.bump(cod_period)
+        return {}
+
+    cache.loader = loader
+    cache.get(None, "2025-1")
+    cache.get(None, "2025-1")
+    assert len(loads) == 2
+
+
+def test_shared_versions_invalidate_the_cache():
+    versions = OrganizationSchemaVersions()
+    cache, loads = make_cache()
+    cache.versions = versions
+    cache.get(None, "2025-1")
+
+    # Los servicios crud suben la versión sin conocer el caché
+    versions.bump("2025-1")
+    cache.get(None, "2025-1")
+    assert len(loads) == 2
@@ -0,0 +1,85 @@
+import io
+from dataclasses import astuple
+
+import pytest
+from fastapi import HTTPException
+
+from app.service.excel_processor.case_estudiantes_activos import (
+    collect_estudiantes_activos,
+    use_parallel_parse,
+)
+from app.utils.type_file_validation import open_upload
+
+HEADER = "NOMBRES_APELLIDOS;EMAIL;SEDE;FACULTAD;COD_PLAN;PLAN;TIPO_NIVEL"
+
+# Filas de varias sedes, incluidas las especiales (sus facultades comparten
+# código), con estudiantes y planes repetidos en bloques distintos
+ROWS = [
+    "Ana;ana@unal.edu.co;SEDE BOGOTÁ;Facultad de Artes;1;Diseño;PREGRADO",
+    "Beto;beto@unal.edu.co;SEDE AMAZONÍA;Sede Amazonía;2;Biología;PREGRADO",
+    "Caro;caro@unal.edu.co;SEDE CARIBE;Sede Caribe;3;Estudios;POSGRADO",
+    "Dani;dani@unal.edu.co;SEDE MANIZALES;Facultad de Minas;4;Civil;"
+    "PREGRADO",
+    "Eva;eva@unal.edu.co;SEDE ORINOQUÍA;Sede Orinoquía;2;Biología;PREGRADO",
+    "Ana;ana@unal.edu.co;SEDE BOGOTÁ;Facultad de Ciencias;5;Física;POSGRADO",
+    "Fer;fer@unal.edu.co;SEDE TUMACO;Sede Tumaco;6;Mares;PREGRADO",
+    "Gabi;gabi@unal.edu.co;SEDE DE LA PAZ;Sede La Paz;7;Música;PREGRADO",
+    "Beto;beto@unal.edu.co;SEDE AMAZONÍA;Otra Facultad;8;Selva;PREGRADO",
+    "Hugo;hugo@unal.edu.co;SEDE DE LA PAZ;Sede La Paz;7;Música;PREGRADO",
+    "Iris;iris@unal.edu.co;SEDE MEDELLÍN;Facultad de Minas;4;Civil;PREGRADO",
+    "Juan;juan@unal.edu.co;SEDE CARIBE;Sede Caribe;9;Mar;PREGRADO",
+    "Dani;dani@unal.edu.co;SEDE MANIZALES;Facultad de Minas;4;Civil;"
+    "PREGRADO",
+    "Kike;kike@unal.edu.co;SEDE PALMIRA;Facultad de Agro;10;Agro;POSGRADO",
+]
+
+
+def open_sheet(rows):
+    content = "\n".join([HEADER, *rows]) + "\n"
+    wb = open_upload(io.BytesIO(content.encode("utf-8")), "activos.csv")
+    return wb[wb.sheetnames[0]]
+
+
+def collect(rows, workers):
+    return collect_estudiantes_activos(
+        open_sheet(rows), "2025-1", workers=workers, chunk_rows=3
+    )
+
+
+def test_parallel_parse_matches_serial():
+    assert use_parallel_parse(open_sheet(ROWS), workers=2, chunk_rows=3)
+    assert not use_parallel_parse(open_sheet(ROWS), workers=1, chunk_rows=3)
+
+    parallel = collect(ROWS, workers=2)
+    serial = collect(ROWS, workers=1)
+
+    # Mismos registros en el mismo orden, colección por colección
+    assert astuple(parallel) == astuple(serial)
+    assert parallel.entity_counts() == serial.entity_counts()
+    assert len(serial.users) == 11
+    # Las dos facultades de Amazonía son la misma facultad especial
+    schools = [school.cod_school for school in serial.schools]
+    assert schools.count("estfpreama") == 1
+
+
+def test_parallel_parse_reports_the_same_errors():
+    rows = [
+        *ROWS[:4],
+        "Luz;no-es-correo;SEDE BOGOTÁ;Facultad de Artes;1;Diseño;PREGRADO",
+        ";;;;;;",
+        *ROWS[4:8],
+        "Mar;mar@unal.edu.co;SEDE LUNA;Facultad;1;Plan;PREGRADO",
+        "Nico;nico@unal.edu.co;SEDE CARIBE;;3;Estudios;",
+    ]
+
+    details = []
+    for workers in (2, 1):
+        with pytest.raises(HTTPException) as exc:
+            collect(rows, workers)
+        detail = dict(exc.value.detail)
+        # Cada recorrido escribe su propio reporte
+        detail.pop("report_id")
+        details.append(detail)
+
+    assert details[0] == details[1]
+    assert details[1]["total_errors"] == 5
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.configuration.pool_metrics import (
+    MeteredAsyncQueuePool,
+    MeteredQueuePool,
+    get_pool_stats,
+)
+
+
+def test_pool_stats_count_checkouts_and_timeouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MeteredQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    connection = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    stats = get_pool_stats(engine)
+    assert stats["checked_out"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["max_overflow"] == 0
+    assert stats["wait_max_ms"] >= 50
+
+    connection.close()
+    assert get_pool_stats(engine)["checked_out"] == 0
+
+
+def test_async_pool_stats(tmp_path):
+    async def run():
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=MeteredAsyncQueuePool,
+            pool_size=1,
+            max_overflow=2,
+        )
+        async with engine.connect():
+            stats = get_pool_stats(engine.sync_engine)
+        await engine.dispose()
+        return stats
+
+    stats = asyncio.run(run())
+    assert stats["pool_class"] == "MeteredAsyncQueuePool"
+    assert stats["checked_out"] == 1
+    assert stats["checkouts"] == 1
+    assert stats["max_overflow"] == 2
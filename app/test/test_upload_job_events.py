@@ -0,0 +1,32 @@
+import asyncio
+
+from app.domain.enums.upload_job.upload_job import (
+    IngestionStage,
+    UploadJobState,
+)
+from app.service.jobs.upload_job_events import stream_job_events
+from app.service.jobs.upload_job_queue import UploadJob
+
+
+def test_events_only_on_change_and_done_at_the_end():
+    job = UploadJob("2025-1", "a.xlsx", "x@unal.edu.co")
+    job.state = UploadJobState.RUNNING
+
+    async def collect():
+        events = []
+        stream = stream_job_events(job, interval=0.01, heartbeat=60)
+        async for event in stream:
+            events.append(event)
+            if len(events) == 1:
+                job.progress.set_stage(IngestionStage.PARSING)
+                job.progress.update_rows(5000, 4990)
+            elif len(events) == 2:
+                job.state = UploadJobState.SUCCEEDED
+        return events
+
+    events = asyncio.run(collect())
+
+    assert [e.split("\n")[0] for e in events] == [
+        "event: progress", "event: progress", "event: done"
+    ]
+    assert '"rows_parsed": 5000' in events[1]
@@ -0,0 +1,117 @@
+import io
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import Session
+
+from app.domain.dtos.upload_job.ingestion_options import IngestionOptions
+from app.domain.enums.upload_job.upload_job import UploadJobState
+from app.domain.models.import_ledger import ImportLedger
+from app.domain.models.period import Period
+from app.service.jobs import upload_job_queue as queue_module
+from app.service.jobs.upload_job_queue import UploadJob, UploadJobQueue
+
+
+class Workbook:
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def queue(session: Session, monkeypatch):
+    session.add(Period(cod_period="2025-1"))
+    session.commit()
+    monkeypatch.setattr(queue_module, "engine", session.get_bind())
+    monkeypatch.setattr(
+        queue_module, "open_upload", lambda spool, filename: Workbook()
+    )
+    queue = UploadJobQueue(workers=1, retention=2)
+    yield queue
+    queue.executor.shutdown(wait=True)
+
+
+def run_with(queue: UploadJobQueue, monkeypatch, outcome, **job_args):
+    states: list = []
+
+    def process_file(wb, cod_period, session, progress, options):
+        # Corre en el hilo del pool; submit puede no haber retornado aún
+        states.extend(job.state for job in queue.get_all())
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(queue_module, "process_file", process_file)
+    job = queue.submit(
+        io.BytesIO(), "2025-1", "estudiantes.xlsx", content_hash="abc",
+        **job_args
+    )
+    queue.executor.shutdown(wait=True)
+    return job, states
+
+
+def test_job_runs_and_records_ledger(queue, session, monkeypatch):
+    job, states = run_with(queue, monkeypatch, {"status": True})
+
+    assert states == [UploadJobState.RUNNING]
+    assert job.state == UploadJobState.SUCCEEDED
+    assert job.started_at and job.finished_at
+    assert session.get(ImportLedger, ("abc", "2025-1")) is not None
+
+
+@pytest.mark.parametrize("outcome, error", [
+    (False, "La primera hoja no tiene encabezados"),
+    (HTTPException(status_code=400, detail={"status": False}),
+     {"status": False}),
+    (RuntimeError("conexión perdida"), "conexión perdida"),
+])
+def test_failed_jobs_skip_the_ledger(
+    queue, session, monkeypatch, outcome, error
+):
+    job, _ = run_with(queue, monkeypatch, outcome)
+
+    assert job.state == UploadJobState.FAILED
+    assert job.error == error
+    assert session.get(ImportLedger, ("abc", "2025-1")) is None
+
+
+def test_non_default_options_skip_the_ledger(queue, session, monkeypatch):
+    job, _ = run_with(
+        queue, monkeypatch, {"status": True},
+        options=IngestionOptions(delta=True)
+    )
+
+    assert job.state == UploadJobState.SUCCEEDED
+    assert session.get(ImportLedger, ("abc", "2025-1")) is None
+
+
+def test_find_active_matches_pending_default_jobs():
+    queue = UploadJobQueue(workers=1, retention=10)
+    queued = UploadJob("2025-1", "a.xlsx", None, "abc")
+    delta = UploadJob(
+        "2025-1", "a.xlsx", None, "abc", IngestionOptions(delta=True)
+    )
+    queue.jobs[delta.job_id] = delta
+    queue.jobs[queued.job_id] = queued
+
+    assert queue.find_active("abc", "2025-1") is queued
+    assert queue.find_active("abc", "2024-2") is None
+
+    queued.state = UploadJobState.SUCCEEDED
+    assert queue.find_active("abc", "2025-1") is None
+    queue.executor.shutdown()
+
+
+def test_prune_drops_oldest_finished_jobs():
+    queue = UploadJobQueue(workers=1, retention=2)
+    jobs = [UploadJob("2025-1", f"{i}.xlsx", None) for i in range(4)]
+    jobs[0].state = UploadJobState.RUNNING
+    jobs[1].state = UploadJobState.SUCCEEDED
+    jobs[2].state = UploadJobState.FAILED
+    for job in jobs:
+        queue.jobs[job.job_id] = job
+
+    queue.prune()
+
+    # Los trabajos sin terminar nunca se descartan
+    assert list(queue.jobs.values()) == [jobs[0], jobs[3]]
+    queue.executor.shutdown()
@@ -0,0 +1,72 @@
+import hashlib
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.configuration.database import get_session
+from app.domain.models.import_ledger import ImportLedger
+from app.domain.models.period import Period
+from app.main import app
+from app.service.jobs.upload_job_queue import UploadJob, upload_job_queue
+from app.utils.auth import get_current_user
+
+CONTENT = b"archivo ya importado"
+
+
+@pytest.fixture
+def client(session: Session, monkeypatch):
+    session.add(Period(cod_period="2025-1"))
+    session.add(ImportLedger(
+        content_hash=hashlib.sha256(CONTENT).hexdigest(),
+        cod_period="2025-1",
+        result='{"status": true}',
+    ))
+    session.commit()
+
+    submitted: list = []
+
+    def submit(spool, cod_period, filename, submitted_by, content_hash,
+               options):
+        spool.close()
+        submitted.append(options)
+        return UploadJob(cod_period, filename, submitted_by, content_hash)
+
+    monkeypatch.setattr(upload_job_queue, "submit", submit)
+    app.dependency_overrides[get_session] = lambda: session
+    app.dependency_overrides[get_current_user] = lambda: "x@unal.edu.co"
+    try:
+        yield TestClient(app), submitted
+    finally:
+        app.dependency_overrides.clear()
+
+
+def upload(client: TestClient, **params):
+    return client.post(
+        "/upload_excel/",
+        params={"cod_period": "2025-1", **params},
+        files={"file": ("estudiantes.xlsx", CONTENT)},
+    ).json()
+
+
+def test_reupload_reuses_ledger_result(client):
+    client, submitted = client
+    status = upload(client)
+
+    assert status["reused_result"] is True
+    assert status["result"] == {"status": True}
+    assert submitted == []
+
+
+@pytest.mark.parametrize("params", [
+    {"force": "true"},
+    {"delta": "true"},
+    {"upsert": "true"},
+    {"report_dropped": "true"},
+])
+def test_options_skip_the_ledger_shortcut(client, params):
+    client, submitted = client
+    status = upload(client, **params)
+
+    assert status["reused_result"] is False
+    assert len(submitted) == 1
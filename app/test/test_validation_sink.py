@@ -0,0 +1,84 @@
+import csv
+import gzip
+import os
+import time
+
+from app.service.excel_processor import validation_sink
+from app.service.excel_processor.validation_sink import (
+    ValidationSink,
+    find_report,
+    prune_reports,
+)
+
+
+def test_sink_keeps_sample_and_counts_and_writes_full_report(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(validation_sink, "VALIDATION_REPORT_DIR", tmp_path)
+    sink = ValidationSink(sample_size=2)
+    assert not sink
+
+    sink.extend(
+        {"row": idx, "column": "EMAIL", "message": "Celda vacía"}
+        for idx in range(2, 7)
+    )
+    sink.append({"row": 7, "column": None, "message": "Fila vacía"})
+    sink.close()
+
+    detail = sink.to_detail()
+    assert detail["total_errors"] == 6
+    assert detail["errors_by_column"] == {"EMAIL": 5, "FILA": 1}
+    assert len(detail["errors"]) == 2
+
+    path = find_report(detail["report_id"])
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as report:
+        rows = list(csv.DictReader(report))
+    assert len(rows) == 6
+    assert rows[-1] == {"row": "7", "column": "", "message": "Fila vacía"}
+
+
+def test_find_report_rejects_non_uuid_ids():
+    assert find_report("../../etc/passwd") is None
+
+
+def test_sink_closes_report_when_parsing_fails(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation_sink, "VALIDATION_REPORT_DIR", tmp_path)
+    try:
+        with ValidationSink() as sink:
+            sink.append({"row": 2, "column": "SEDE", "message": "Sede"})
+            raise ValueError("hoja corrupta")
+    except ValueError:
+        pass
+
+    assert sink.stream is None
+    path = find_report(sink.report_id)
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as report:
+        assert len(list(csv.DictReader(report))) == 1
+
+
+def test_reports_are_only_found_by_their_owner(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation_sink, "VALIDATION_REPORT_DIR", tmp_path)
+    with ValidationSink(owner="ana@unal.edu.co") as sink:
+        sink.append({"row": 2, "column": "SEDE", "message": "Sede"})
+
+    assert find_report(sink.report_id, "ana@unal.edu.co")
+    assert find_report(sink.report_id, "beto@unal.edu.co") is None
+    assert find_report(sink.report_id) is None
+
+
+def test_prune_drops_old_and_excess_reports(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation_sink, "VALIDATION_REPORT_DIR", tmp_path)
+    sinks = []
+    for idx, owner in enumerate(["ana", "beto", "ana", "caro"]):
+        with ValidationSink(owner=owner) as sink:
+            sink.append({"row": 2, "column": "SEDE", "message": "Sede"})
+        # Del más viejo al más nuevo, uno por hora
+        age = time.time() - (4 - idx) * 3600
+        path = validation_sink.report_path(sink.report_id, owner)
+        os.utime(path, (age, age))
+        sinks.append((sink.report_id, owner))
+
+    assert prune_reports(max_age_hours=3.5, retention=2) == 2
+    assert [bool(find_report(*args)) for args in sinks] == [
+        False, False, True, True
+    ]
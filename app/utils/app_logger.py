@@ -1,5 +1,54 @@
+import atexit
 import logging
 import os
+import queue
+import threading
+from collections import Counter
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict
+
+from app.configuration.config import LOG_DIR, LOG_LEVEL, LOG_SAMPLE_EVERY
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Un hilo escritor por archivo de log, compartido por todos los loggers
+# que escriben en ese archivo. Los loggers se crean desde varios hilos
+# (trabajos de carga, pool de inserción), así que el registro va con
+# candado; es reentrante porque AppLogger lo toma antes de pedir la cola.
+_listeners: Dict[str, QueueListener] = {}
+_queues: Dict[str, queue.SimpleQueue] = {}
+_lock = threading.RLock()
+
+
+def get_log_queue(logger_file: str) -> queue.SimpleQueue:
+    """
+    Cola del archivo de log. La primera vez crea el FileHandler y el
+    QueueListener que escribe en disco desde su propio hilo, así el hilo
+    que registra solo encola el mensaje.
+    """
+    with _lock:
+        log_queue = _queues.get(logger_file)
+        if log_queue is None:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            file_handler = logging.FileHandler(
+                os.path.join(LOG_DIR, logger_file), encoding="utf-8"
+            )
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler)
+            listener.start()
+            _listeners[logger_file] = listener
+            _queues[logger_file] = log_queue
+        return log_queue
+
+
+@atexit.register
+def stop_log_listeners():
+    """Vacía las colas pendientes al cerrar el proceso."""
+    with _lock:
+        for listener in _listeners.values():
+            listener.stop()
+        _listeners.clear()
 
 
 class AppLogger:
@@ -15,34 +64,51 @@ class AppLogger:
         # solo el nombre del archivo
         module_name = os.path.basename(module_file)
         self.logger = logging.getLogger(module_name)
-        self.logger.setLevel(logging.DEBUG)  # nivel mínimo a registrar
+        self.logger.setLevel(LOG_LEVEL)  # nivel mínimo a registrar
+        self.sample_counts: Counter = Counter()
 
         # Evitar duplicados si el logger ya tiene handlers
-        if not self.logger.handlers:
-            # Crear handler para archivo fijo con UTF-8
-            file_handler = logging.FileHandler(logger_file, encoding="utf-8")
-            file_handler.setLevel(logging.DEBUG)
-
-            # Formato de los mensajes
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            file_handler.setFormatter(formatter)
+        with _lock:
+            if not self.logger.handlers:
+                self.logger.addHandler(
+                    QueueHandler(get_log_queue(logger_file))
+                )
 
-            # Agregar handler
-            self.logger.addHandler(file_handler)
+    # Los argumentos se formatean con % solo si el nivel está habilitado
+    def debug(self, msg: str, *args: Any):
+        self.logger.debug(msg, *args)
 
-    def debug(self, msg: str):
-        self.logger.debug(msg)
+    def info(self, msg: str, *args: Any):
+        self.logger.info(msg, *args)
 
-    def info(self, msg: str):
-        self.logger.info(msg)
+    def warning(self, msg: str, *args: Any):
+        self.logger.warning(msg, *args)
 
-    def warning(self, msg: str):
-        self.logger.warning(msg)
+    def error(self, msg: str, *args: Any, exc_info: bool = False):
+        self.logger.error(msg, *args, exc_info=exc_info)
 
-    def error(self, msg: str):
-        self.logger.error(msg)
+    def critical(self, msg: str, *args: Any):
+        self.logger.critical(msg, *args)
 
-    def critical(self, msg: str):
-        self.logger.critical(msg)
+    def is_enabled(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
+    def sampled(
+        self,
+        level: int,
+        msg: str,
+        *args: Any,
+        every: int = LOG_SAMPLE_EVERY
+    ):
+        """
+        Para mensajes por fila: registra la 1.ª, (every+1).ª, ... aparición
+        de cada plantilla `msg`, con el total visto hasta ese momento.
+        `every` <= 1 registra todas.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        count = self.sample_counts[msg] = self.sample_counts[msg] + 1
+        if every <= 1:
+            self.logger.log(level, msg, *args)
+        elif count % every == 1:
+            self.logger.log(level, msg + " (%d vistos)", *args, count)
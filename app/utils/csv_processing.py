@@ -0,0 +1,128 @@
+import csv
+import io
+from operator import itemgetter
+from typing import BinaryIO, Callable, Iterator, List, Optional
+
+from app.utils.excel_processing import Row, normalize_string
+
+# Bytes iniciales usados para detectar el separador de un .csv
+SNIFF_BYTES: int = 64 * 1024
+CSV_DELIMITERS: str = ",;\t"
+
+# Separador fijo por extensión; None indica que se detecta
+DELIMITER_BY_EXTENSION = {
+    ".csv": None,
+    ".tsv": "\t",
+}
+
+
+def normalize_header(header: Optional[str]) -> str:
+    """'Nombres Apellidos' -> 'nombres_apellidos' (sin tildes)."""
+    return "_".join(normalize_string((header or "").strip()).split())
+
+
+def sniff_delimiter(spool: BinaryIO, encoding: str) -> str:
+    sample = spool.read(SNIFF_BYTES).decode(encoding, errors="ignore")
+    spool.seek(0)
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=CSV_DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+
+
+class CsvSheet:
+    """
+    Hoja de solo lectura sobre un CSV/TSV leído en streaming con el módulo
+    csv. Imita `iter_rows(values_only=True)` de openpyxl: las columnas se
+    ubican por nombre de encabezado y se entregan en el orden de
+    `column_names`, así el resto del pipeline no distingue el origen.
+    Las filas de datos se pueden recorrer una sola vez.
+    """
+
+    # El tamaño no se conoce sin leer todo el archivo
+    max_row: Optional[int] = None
+
+    def __init__(
+        self,
+        stream: io.TextIOBase,
+        delimiter: str,
+        column_names: List[str]
+    ):
+        self.title = "csv"
+        self.reader = csv.reader(stream, delimiter=delimiter)
+        raw_header: List[str] = next(self.reader, [])
+
+        positions = {
+            normalize_header(name): idx for idx, name in enumerate(raw_header)
+        }
+        indexes = [positions.get(name.lower()) for name in column_names]
+        if None in indexes:
+            # Encabezados incompletos: se exponen tal cual para el reporte
+            self.header: Row = tuple(raw_header)
+            self.pick: Callable[[List[str]], Row] = tuple
+        else:
+            self.header = tuple(column_names)
+            self.pick = self.build_picker(indexes)
+
+    @staticmethod
+    def build_picker(indexes: List[int]) -> Callable[[List[str]], Row]:
+        getter = itemgetter(*indexes)
+        width = max(indexes) + 1
+
+        def pick(values: List[str]) -> Row:
+            if len(values) < width:
+                # Filas cortas: las columnas faltantes quedan vacías
+                values = values + [None] * (width - len(values))
+            return getter(values)
+
+        return pick
+
+    def iter_rows(
+        self,
+        min_row: int = 1,
+        max_row: Optional[int] = None,
+        max_col: Optional[int] = None,
+        values_only: bool = True
+    ) -> Iterator[Row]:
+        if min_row <= 1:
+            yield self.header
+        if max_row is not None and max_row < 2:
+            return
+
+        pick = self.pick
+        for row_idx, values in enumerate(self.reader, start=2):
+            if max_row is not None and row_idx > max_row:
+                return
+            if row_idx >= min_row:
+                yield pick(values)
+
+
+class CsvWorkbook:
+    """
+    Imita la parte de Workbook que usa process_file (`sheetnames`, acceso
+    por nombre y `close`) para un archivo de una sola hoja.
+    """
+
+    def __init__(self, sheet: CsvSheet, stream: io.TextIOBase):
+        self.sheet = sheet
+        self.stream = stream
+        self.sheetnames: List[str] = [sheet.title]
+
+    def __getitem__(self, name: str) -> CsvSheet:
+        return self.sheet
+
+    def close(self):
+        self.stream.close()
+
+
+def open_csv_workbook(
+    spool: BinaryIO,
+    extension: str,
+    column_names: List[str],
+    encoding: str = "utf-8-sig"
+) -> CsvWorkbook:
+    delimiter = DELIMITER_BY_EXTENSION.get(extension) or sniff_delimiter(
+        spool, encoding
+    )
+    stream = io.TextIOWrapper(spool, encoding=encoding, newline="")
+    return CsvWorkbook(CsvSheet(stream, delimiter, column_names), stream)
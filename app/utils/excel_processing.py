@@ -1,7 +1,10 @@
-from openpyxl.cell.cell import Cell
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
+import re
 import unicodedata
 
+# Fila leída en modo values_only: tupla de valores planos (no Cell)
+Row = Tuple[Any, ...]
+
 
 def is_blank(v: Any) -> bool:
     return v is None or (isinstance(v, str) and v.strip() == "")
@@ -15,9 +18,30 @@ def get_file_text(v: Any) -> str:
     return text
 
 
-def get_value_from_row(row: Tuple[Cell, ...], col_idx: int) -> str:
-    # La columna es 1-indexada
-    return get_file_text(row[col_idx - 1].value)
+# Forma mínima de un correo: sin espacios, una @ y un dominio con punto
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def normalize_email(text: str) -> Optional[str]:
+    """
+    Valida la forma del correo y pasa el dominio a minúsculas, como hacía
+    EmailStr. Retorna None si el correo no es válido.
+    """
+    if not EMAIL_PATTERN.match(text):
+        return None
+    local, domain = text.rsplit("@", 1)
+    return f"{local}@{domain.lower()}"
+
+
+def get_cell_value(row: Row, col_idx: int) -> Any:
+    # La columna es 1-indexada; las filas cortas se completan con None
+    if col_idx > len(row):
+        return None
+    return row[col_idx - 1]
+
+
+def get_value_from_row(row: Row, col_idx: int) -> str:
+    return get_file_text(get_cell_value(row, col_idx))
 
 
 # Función para normalizar la cadena: eliminar tildes y convertir a minúsculas
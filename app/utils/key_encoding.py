@@ -0,0 +1,39 @@
+from typing import Dict
+
+# Bits reservados para cada código dentro de una llave empaquetada
+KEY_BITS: int = 32
+KEY_LIMIT: int = 1 << KEY_BITS
+
+
+class KeyEncoder:
+    """
+    Codifica textos (correos, códigos de plan, facultad o sede) como
+    enteros pequeños y consecutivos. Cada texto distinto se guarda una sola
+    vez y las llaves compuestas se arman con sus códigos enteros.
+    """
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+
+    def __contains__(self, value: str) -> bool:
+        return value in self.codes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.codes)
+            if code >= KEY_LIMIT:
+                raise OverflowError("Demasiados valores distintos")
+            self.codes[value] = code
+        return code
+
+
+def pack_key(first: int, second: int) -> int:
+    """
+    Une dos códigos en un solo entero de 64 bits. A diferencia de
+    concatenar textos, dos pares distintos nunca producen la misma llave.
+    """
+    return (first << KEY_BITS) | second
@@ -0,0 +1,38 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+# (versión global, versión del periodo)
+Version = Tuple[int, int]
+
+
+class OrganizationSchemaVersions:
+    """
+    Versión de la jerarquía sedes -> facultades -> unidades por periodo.
+    Quien escribe sedes o asociaciones llama `bump`; el caché de
+    use_cases compara versiones sin que los servicios crud dependan de él.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.global_version: int = 0
+        self.period_versions: Dict[str, int] = {}
+
+    def get(self, cod_period: str) -> Version:
+        return self.global_version, self.period_versions.get(cod_period, 0)
+
+    def bump(self, cod_period: Optional[str] = None):
+        """Invalida un periodo, o todos si no se indica."""
+        with self.lock:
+            if cod_period is None:
+                self.global_version += 1
+            else:
+                self.period_versions[cod_period] = (
+                    self.period_versions.get(cod_period, 0) + 1
+                )
+
+
+organization_schema_versions = OrganizationSchemaVersions()
+
+
+def invalidate_organization_schema(cod_period: Optional[str] = None):
+    organization_schema_versions.bump(cod_period)
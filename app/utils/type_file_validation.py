@@ -1,21 +1,92 @@
+import os
 from fastapi import HTTPException
-from io import BytesIO
 from fastapi import UploadFile
 from openpyxl import load_workbook, Workbook
+from tempfile import TemporaryFile
+from typing import Any, BinaryIO, Optional, Union
 
+from app.domain.enums.files.estudiante_activos import EstudianteActivos
+from app.utils.csv_processing import (
+    CsvWorkbook,
+    DELIMITER_BY_EXTENSION,
+    open_csv_workbook,
+)
+
+# Tamaño de cada bloque leído del archivo subido (1 MiB)
+UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm")
+CSV_EXTENSIONS = tuple(DELIMITER_BY_EXTENSION)
+
+
+async def spool_upload(
+    file: UploadFile,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    hasher: Optional[Any] = None
+) -> BinaryIO:
+    """
+    Copia el archivo subido a un temporal en disco leyendo por bloques,
+    para no cargar el archivo completo en memoria. Si se pasa `hasher`
+    (p. ej. hashlib.sha256()), se actualiza con cada bloque.
+    El temporal se elimina automáticamente al cerrarse.
+    """
+    spool: BinaryIO = TemporaryFile()
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        if hasher is not None:
+            hasher.update(chunk)
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+def get_extension(filename: str) -> str:
+    return os.path.splitext(filename or "")[1].lower()
+
+
+def open_workbook(spool: BinaryIO) -> Workbook:
+    """
+    Abre el archivo en modo solo lectura (streaming): las filas se leen
+    bajo demanda desde el disco y no se crea un objeto Cell por celda.
+    El llamador debe cerrar el workbook con `wb.close()`.
+    """
+    try:
+        return load_workbook(spool, read_only=True)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error al procesar el archivo: {str(e)}"
+        )
+
+
+def validate_upload_filename(filename: str):
+    extension = get_extension(filename)
+    if extension not in EXCEL_EXTENSIONS + CSV_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail="El archivo debe ser .xlsx, .xlsm, .csv o .tsv"
+        )
+
+
+def open_upload(
+    spool: BinaryIO,
+    filename: str
+) -> Union[Workbook, CsvWorkbook]:
+    """
+    Abre el archivo según su extensión: los CSV/TSV se leen en streaming
+    con el módulo csv, ubicando las columnas de EstudianteActivos por
+    encabezado, sin pasar por openpyxl.
+    """
+    extension = get_extension(filename)
+    if extension not in CSV_EXTENSIONS:
+        return open_workbook(spool)
 
-async def readExcelFile(file: UploadFile) -> Workbook:
     try:
-        if not file.filename.endswith((".xlsx", ".xlsm")):
-            raise HTTPException(
-                status_code=400,
-                detail="El archivo debe ser .xlsx o .xlsm"
-            )
-
-        contents = await file.read()
-        excel_io = BytesIO(contents)
-        wb: Workbook = load_workbook(excel_io)
-        return wb
+        column_names = [column.name for column in EstudianteActivos]
+        return open_csv_workbook(spool, extension, column_names)
 
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,11 @@
+-- Origen de las asociaciones de remitentes: RULE (llenado o
+-- resincronización) o MANUAL (endpoints email_sender_*). La
+-- resincronización solo borra filas RULE. Las filas existentes quedan como
+-- MANUAL: no se puede saber cuáles vinieron de las reglas, y así ninguna
+-- se borra; el siguiente llenado por periodo no las duplica.
+ALTER TABLE email_sender_unit
+    ADD COLUMN source VARCHAR(10) NOT NULL DEFAULT 'MANUAL';
+ALTER TABLE email_sender_school
+    ADD COLUMN source VARCHAR(10) NOT NULL DEFAULT 'MANUAL';
+ALTER TABLE email_sender_headquarters
+    ADD COLUMN source VARCHAR(10) NOT NULL DEFAULT 'MANUAL';
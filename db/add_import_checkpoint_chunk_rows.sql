@@ -0,0 +1,5 @@
+-- Tamaño de bloque de cada marca de import_checkpoint. Un reintento con
+-- otro INSERT_CHUNK_ROWS ignora las marcas que no coinciden. Las marcas
+-- existentes quedan en 0 y no se retoman.
+ALTER TABLE import_checkpoint
+    ADD COLUMN chunk_rows INT NOT NULL DEFAULT 0;
@@ -22,6 +22,8 @@ DROP TABLE IF EXISTS headquarters;
 DROP TABLE IF EXISTS type_user;
 DROP TABLE IF EXISTS email_sender;
 DROP TABLE IF EXISTS user_unal;
+DROP TABLE IF EXISTS import_checkpoint;
+DROP TABLE IF EXISTS import_ledger;
 DROP TABLE IF EXISTS period;
 
 -- Ahora creamos nuevamente las tablas
@@ -177,6 +179,7 @@ CREATE TABLE IF NOT EXISTS email_sender (
 CREATE TABLE IF NOT EXISTS email_sender_unit (
     sender_id VARCHAR(50) NOT NULL,
     cod_unit  VARCHAR(50) NOT NULL,
+    source    VARCHAR(10) NOT NULL DEFAULT 'MANUAL',
     PRIMARY KEY (sender_id, cod_unit),
     CONSTRAINT fk_esu_sender FOREIGN KEY (sender_id) REFERENCES email_sender(email) ON DELETE CASCADE ON UPDATE CASCADE,
     CONSTRAINT fk_esu_unit   FOREIGN KEY (cod_unit)  REFERENCES unit_unal(cod_unit) ON DELETE CASCADE ON UPDATE CASCADE,
@@ -187,6 +190,7 @@ CREATE TABLE IF NOT EXISTS email_sender_unit (
 CREATE TABLE IF NOT EXISTS email_sender_school (
     sender_id  VARCHAR(50) NOT NULL,
     cod_school VARCHAR(50) NOT NULL,
+    source    VARCHAR(10) NOT NULL DEFAULT 'MANUAL',
     PRIMARY KEY (sender_id, cod_school),
     CONSTRAINT fk_ess_sender FOREIGN KEY (sender_id)  REFERENCES email_sender(email) ON DELETE CASCADE ON UPDATE CASCADE,
     CONSTRAINT fk_ess_school FOREIGN KEY (cod_school) REFERENCES school(cod_school) ON DELETE CASCADE ON UPDATE CASCADE,
@@ -197,12 +201,38 @@ CREATE TABLE IF NOT EXISTS email_sender_school (
 CREATE TABLE IF NOT EXISTS email_sender_headquarters (
     sender_id        VARCHAR(50) NOT NULL,
     cod_headquarters VARCHAR(50) NOT NULL,
+    source           VARCHAR(10) NOT NULL DEFAULT 'MANUAL',
     PRIMARY KEY (sender_id, cod_headquarters),
     CONSTRAINT fk_esh_sender       FOREIGN KEY (sender_id)        REFERENCES email_sender(email) ON DELETE CASCADE ON UPDATE CASCADE,
     CONSTRAINT fk_esh_headquarters FOREIGN KEY (cod_headquarters) REFERENCES headquarters(cod_headquarters) ON DELETE CASCADE ON UPDATE CASCADE,
     INDEX idx_esh_headquarters (cod_headquarters)
 ) ENGINE=InnoDB;
 
+-- Tabla: import_ledger (cargas ya importadas por contenido y periodo)
+CREATE TABLE IF NOT EXISTS import_ledger (
+    content_hash VARCHAR(64)  NOT NULL,
+    cod_period   VARCHAR(50)  NOT NULL,
+    filename     VARCHAR(255) NULL,
+    submitted_by VARCHAR(100) NULL,
+    result       TEXT         NULL,
+    created_at   DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (content_hash, cod_period),
+    CONSTRAINT fk_il_period FOREIGN KEY (cod_period) REFERENCES period(cod_period) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB;
+
+-- Tabla: import_checkpoint (bloques ya confirmados de una carga en curso)
+CREATE TABLE IF NOT EXISTS import_checkpoint (
+    content_hash VARCHAR(64)  NOT NULL,
+    cod_period   VARCHAR(50)  NOT NULL,
+    table_name   VARCHAR(50)  NOT NULL,
+    chunk_index  INT          NOT NULL,
+    chunk_rows   INT          NOT NULL DEFAULT 0,
+    result       TEXT         NULL,
+    created_at   DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (content_hash, cod_period, table_name, chunk_index),
+    CONSTRAINT fk_ic_period FOREIGN KEY (cod_period) REFERENCES period(cod_period) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB;
+
 -- Auth tables
 CREATE TABLE IF NOT EXISTS system_user (
     email           VARCHAR(100) PRIMARY KEY,